@@ -0,0 +1,114 @@
+# TODO: Solve equations whose functions are coroutines (async def), e.g. remote model evaluations, without blocking on every evaluation
+# Note: func and der_func may be either plain callables or coroutine functions, whatever they return is awaited when it is awaitable
+# Note: All the approximations are advanced concurrently with asyncio.gather, and so are the mid-points of every level of Bisection, hence the
+# latencies of the evaluations overlap instead of adding up
+# Note: The budget of every root (see Budget.py) includes the time spent awaiting its evaluations
+# Note: Set max_concurrency to cap the number of evaluations in flight at any time (e.g. the rate limit of a remote service), None for no limit
+
+# Note: set_approximations(*args, **kwargs) and set_roots(*args, **kwargs) are coroutines here and need to be awaited
+#           solver = AsyncNewtonRhapsonSolver(func, der_func, intervals, max_concurrency = 8)
+#           await solver.set_approximations(5)
+#           await solver.set_roots()
+#           solver.get_roots()
+
+from typing import Callable, Sequence
+from .NumericalMethod import NumericalMethodSolver
+from .Bisection import get_iterations
+from .IntermediateValueTheorem import sign
+from .SolverStatistics import RootResult
+from .ResultStorage import ResultStore
+import asyncio
+import inspect
+import random
+
+class AsyncSolver(NumericalMethodSolver):
+    def __init__(self, func : Callable, intervals : Sequence = None, epsilon : float = 1e-5, max_concurrency : int = None) -> None:
+        super(AsyncSolver, self).__init__(func, intervals, epsilon)
+        assert max_concurrency == None or (isinstance(max_concurrency, int) and max_concurrency > 0), "Maximum concurrency should be an integer and should trivially be greater than zero"
+        self.max_concurrency = max_concurrency
+        self.semaphore = None
+
+    # Evaluate func at x, holding one of the max_concurrency slots while doing so
+    async def evaluate_async(self, func : Callable, x : float) -> float:
+        if self.semaphore == None:
+            value = func(x)
+            return await value if inspect.isawaitable(value) else value
+        async with self.semaphore:
+            value = func(x)
+            return await value if inspect.isawaitable(value) else value
+
+    # Semaphores belong to the running event loop, hence a fresh one is created for every solve
+    def set_semaphore(self) -> None:
+        self.semaphore = None if self.max_concurrency == None else asyncio.Semaphore(self.max_concurrency)
+
+    # Same Bisection as bracket_interval and approximate_brackets in Bisection.py, evaluating all the mid-points of a level concurrently
+    async def set_approximations(self, iterations : int = None, epsilon : float = None, digits : int = 5) -> None:
+        assert not self.intervals == None, "Intervals need to be set for estimating approximations using self.set_intervals(*args, **kwargs)"
+        intervals = [self.intervals] if isinstance(self.intervals, tuple) else list(self.intervals)
+        iterations = get_iterations(intervals, iterations, epsilon)
+        self.set_semaphore()
+        values = await asyncio.gather(*(self.evaluate_async(self.func, x) for interval in intervals for x in interval[:2]))
+        brackets = [(interval[0], interval[1], values[2 * i], values[2 * i + 1]) for i, interval in enumerate(intervals)]
+        for i in range(iterations):
+            mid_intervals = [lower + (upper - lower) / 2 for lower, upper, _, _ in brackets]
+            f_mids = await asyncio.gather(*(self.evaluate_async(self.func, mid_interval) for mid_interval in mid_intervals))
+            new_brackets = []
+            for (lower, upper, f_lower, f_upper), mid_interval, f_mid in zip(brackets, mid_intervals, f_mids):
+                if f_lower == 0 or f_mid == 0 or sign(f_lower) * sign(f_mid) == -1:
+                    new_brackets.append((lower, mid_interval, f_lower, f_mid))
+                if not f_mid == 0 and (f_upper == 0 or sign(f_mid) * sign(f_upper) == -1):
+                    new_brackets.append((mid_interval, upper, f_mid, f_upper))
+            brackets = new_brackets
+
+        self.brackets = brackets
+        approximations = [lower + (upper - lower) / 2 for lower, upper, _, _ in brackets]
+        values = await asyncio.gather(*(self.evaluate_async(self.func, approximation) for approximation in approximations))
+        self.approximations = ResultStore(digits)
+        self.approximations.add_approximations(approximations, values)
+
+    async def set_roots(self, init_approx : Sequence[float] = None) -> None:
+        assert hasattr(self, "find_root"), "Asynchronous solvers need to implement the coroutine find_root(self, x_0)"
+        approximations = self.get_initial_approximations(init_approx)
+        self.set_semaphore()
+        self.set_results(approximations, [list(await asyncio.gather(*(self.find_root(approximation) for approximation in self.convert_approximations(approximations))))])
+
+# Newton-Rhapson Method (see NewtonRhapson.py), f(x) and f'(x) are evaluated concurrently at every iteration
+class AsyncNewtonRhapsonSolver(AsyncSolver):
+    def __init__(self, func : Callable, der_func : Callable, intervals : Sequence = None, epsilon : float = 1e-5, max_concurrency : int = None) -> None:
+        super(AsyncNewtonRhapsonSolver, self).__init__(func, intervals, epsilon, max_concurrency)
+        self.der_func = der_func
+
+    async def find_root(self, x_0 : float) -> RootResult:
+        f_x_k, der_f_x_k = await asyncio.gather(self.evaluate_async(self.func, x_0), self.evaluate_async(self.der_func, x_0))
+        monitor = self.get_monitor()
+        stop = None
+        iterations = 0
+        while(abs(f_x_k) >= self.epsilon and stop == None):
+            x_0 = x_0 - f_x_k / der_f_x_k
+            f_x_k, der_f_x_k = await asyncio.gather(self.evaluate_async(self.func, x_0), self.evaluate_async(self.der_func, x_0))
+            iterations += 1
+            if not self.callback == None:
+                self.callback(iterations, x_0, f_x_k)
+            stop = monitor.update(iterations, f_x_k)
+
+        return self.get_result(x_0, f_x_k, iterations, stop = stop)
+
+# Secant Method (see Secant.py), f(x_0) is carried over from the previous iteration so that every iteration costs a single evaluation
+class AsyncSecantSolver(AsyncSolver):
+    async def find_root(self, x_0 : float) -> RootResult:
+        x_1 = x_0 + 1e-01 * random.random()
+        f_x_0, f_x_k = await asyncio.gather(self.evaluate_async(self.func, x_0), self.evaluate_async(self.func, x_1))
+        monitor = self.get_monitor()
+        stop = None
+        iterations = 0
+        while(not self.is_small_step(x_1, x_0) and abs(f_x_k) >= self.epsilon and stop == None):
+            x_new = x_1 - f_x_k * (x_1 - x_0) / (f_x_k - f_x_0)
+            x_0, f_x_0 = x_1, f_x_k
+            x_1 = x_new
+            f_x_k = await self.evaluate_async(self.func, x_new)
+            iterations += 1
+            if not self.callback == None:
+                self.callback(iterations, x_1, f_x_k)
+            stop = monitor.update(iterations, f_x_k)
+
+        return self.get_result(x_1, f_x_k, iterations, stop = stop)
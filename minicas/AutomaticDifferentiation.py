@@ -0,0 +1,237 @@
+# TODO: Differentiate a function automatically (forward mode) so that derivative based solvers only need f
+# Note: A Jet carries the value of an expression along with its first and second derivatives with respect to x, (u, u', u'')
+# Evaluating f on the Jet (x, 1, 0) hence yields (f(x), f'(x), f''(x)) in a single evaluation of f, exact upto rounding unlike finite differences
+
+# Arithmetic on Jets follows the rules of differentiation:
+#   (u + v)'' = u'' + v''
+#   (u.v)' = u'.v + u.v'                                    (u.v)'' = u''.v + 2.u'.v' + u.v''
+#   (1/v)' = -v'/v^2                                        (1/v)'' = 2.v'^2/v^3 - v''/v^2
+#   g(u)' = g'(u).u'                                        g(u)'' = g''(u).u'^2 + g'(u).u''           (chain rule)
+
+# Note: Functions need to be written with arithmetic operators and the elementary functions of this module (sin, cos, exp, log, ...) instead of the
+# ones in math, which cannot handle Jets. The elementary functions of this module fall back to math for numbers and to NumPy for arrays, so
+# the same function also works with plain floats and in the vectorized modes
+# Note: Comparisons of Jets compare their values, hence functions may branch on x (e.g. piecewise definitions)
+
+from typing import Callable, Tuple
+import math
+
+# Names of the elementary functions in NumPy, where they differ from math
+numpy_names = {"atan" : "arctan"}
+
+# Apply the elementary function called name to x, which may be a Jet (or any other type implementing the function as a method), a number or an array
+def apply(name : str, x):
+    method = getattr(x, name, None)
+    if not method == None:
+        return method()
+    if isinstance(x, (int, float)):
+        return getattr(math, name)(x)
+    import numpy as np
+    return getattr(np, numpy_names.get(name, name))(x)
+
+def sin(x):
+    return apply("sin", x)
+
+def cos(x):
+    return apply("cos", x)
+
+def tan(x):
+    return apply("tan", x)
+
+def exp(x):
+    return apply("exp", x)
+
+def log(x):
+    return apply("log", x)
+
+def sqrt(x):
+    return apply("sqrt", x)
+
+def sinh(x):
+    return apply("sinh", x)
+
+def cosh(x):
+    return apply("cosh", x)
+
+def tanh(x):
+    return apply("tanh", x)
+
+def atan(x):
+    return apply("atan", x)
+
+class Jet():
+    __slots__ = ("value", "first", "second")
+    __hash__ = None
+
+    def __init__(self, value, first = 0.0, second = 0.0) -> None:
+        self.value = value
+        self.first = first
+        self.second = second
+
+    # Apply g to the Jet by the chain rule, given g(u), g'(u) and g''(u)
+    def chain(self, g_u, der_g_u, der_der_g_u) -> "Jet":
+        return Jet(g_u, der_g_u * self.first, der_der_g_u * self.first * self.first + der_g_u * self.second)
+
+    def __add__(self, other) -> "Jet":
+        if isinstance(other, Jet):
+            return Jet(self.value + other.value, self.first + other.first, self.second + other.second)
+        return Jet(self.value + other, self.first, self.second)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "Jet":
+        return Jet(-self.value, -self.first, -self.second)
+
+    def __pos__(self) -> "Jet":
+        return self
+
+    def __sub__(self, other) -> "Jet":
+        return self + (-other)
+
+    def __rsub__(self, other) -> "Jet":
+        return (-self) + other
+
+    def __mul__(self, other) -> "Jet":
+        if isinstance(other, Jet):
+            return Jet(self.value * other.value, self.first * other.value + self.value * other.first,
+                       self.second * other.value + 2 * self.first * other.first + self.value * other.second)
+        return Jet(self.value * other, self.first * other, self.second * other)
+
+    __rmul__ = __mul__
+
+    def reciprocal(self) -> "Jet":
+        reciprocal = 1 / self.value
+        return self.chain(reciprocal, -reciprocal * reciprocal, 2 * reciprocal * reciprocal * reciprocal)
+
+    def __truediv__(self, other) -> "Jet":
+        if isinstance(other, Jet):
+            return self * other.reciprocal()
+        return Jet(self.value / other, self.first / other, self.second / other)
+
+    def __rtruediv__(self, other) -> "Jet":
+        return self.reciprocal() * other
+
+    def __pow__(self, other) -> "Jet":
+        if isinstance(other, Jet):
+            return exp(other * log(self))
+        if other == 0:
+            return Jet(self.value ** 0, 0 * self.first, 0 * self.second)
+        if other == 1:
+            return self
+        power = self.value ** (other - 2)
+        return self.chain(power * self.value * self.value, other * power * self.value, other * (other - 1) * power)
+
+    def __rpow__(self, other) -> "Jet":
+        return exp(self * log(other))
+
+    def __abs__(self) -> "Jet":
+        return self * ((self.value > 0) * 1.0 - (self.value < 0) * 1.0)
+
+    def sin(self) -> "Jet":
+        sin_u, cos_u = sin(self.value), cos(self.value)
+        return self.chain(sin_u, cos_u, -sin_u)
+
+    def cos(self) -> "Jet":
+        sin_u, cos_u = sin(self.value), cos(self.value)
+        return self.chain(cos_u, -sin_u, -cos_u)
+
+    def tan(self) -> "Jet":
+        tan_u = tan(self.value)
+        sec_u_2 = 1 + tan_u * tan_u
+        return self.chain(tan_u, sec_u_2, 2 * tan_u * sec_u_2)
+
+    def exp(self) -> "Jet":
+        exp_u = exp(self.value)
+        return self.chain(exp_u, exp_u, exp_u)
+
+    def log(self) -> "Jet":
+        reciprocal = 1 / self.value
+        return self.chain(log(self.value), reciprocal, -reciprocal * reciprocal)
+
+    def sqrt(self) -> "Jet":
+        sqrt_u = sqrt(self.value)
+        return self.chain(sqrt_u, 0.5 / sqrt_u, -0.25 / (sqrt_u * self.value))
+
+    def sinh(self) -> "Jet":
+        sinh_u, cosh_u = sinh(self.value), cosh(self.value)
+        return self.chain(sinh_u, cosh_u, sinh_u)
+
+    def cosh(self) -> "Jet":
+        sinh_u, cosh_u = sinh(self.value), cosh(self.value)
+        return self.chain(cosh_u, sinh_u, cosh_u)
+
+    def tanh(self) -> "Jet":
+        tanh_u = tanh(self.value)
+        sech_u_2 = 1 - tanh_u * tanh_u
+        return self.chain(tanh_u, sech_u_2, -2 * tanh_u * sech_u_2)
+
+    def atan(self) -> "Jet":
+        reciprocal = 1 / (1 + self.value * self.value)
+        return self.chain(atan(self.value), reciprocal, -2 * self.value * reciprocal * reciprocal)
+
+    def __lt__(self, other):
+        return self.value < (other.value if isinstance(other, Jet) else other)
+
+    def __le__(self, other):
+        return self.value <= (other.value if isinstance(other, Jet) else other)
+
+    def __gt__(self, other):
+        return self.value > (other.value if isinstance(other, Jet) else other)
+
+    def __ge__(self, other):
+        return self.value >= (other.value if isinstance(other, Jet) else other)
+
+    def __eq__(self, other):
+        return self.value == (other.value if isinstance(other, Jet) else other)
+
+    def __repr__(self) -> str:
+        return "Jet(" + repr(self.value) + ", " + repr(self.first) + ", " + repr(self.second) + ")"
+
+# Return (f(x), f'(x), ..., f^(order)(x)) for order upto 2 with a single evaluation of func
+def differentiate(func : Callable, x, order : int = 1) -> Tuple:
+    assert order in (0, 1, 2), "Order of the derivatives should be 0, 1 or 2"
+    jet = func(Jet(x, 1.0 + 0 * x, 0 * x))
+    if not isinstance(jet, Jet):
+        # func does not depend on x
+        return (jet,) + (0 * x,) * order
+    return (jet.value, jet.first, jet.second)[:order + 1]
+
+# Whether func evaluates over Jets, probed at x. Functions of math (math.sin, ...) raise TypeError on a Jet, while other errors (e.g. x outside
+# the domain of func) leave the question open, hence func is given the benefit of the doubt
+def supports_jets(func : Callable, x : float = 1.0) -> bool:
+    try:
+        differentiate(func, x, 1)
+    except TypeError:
+        return False
+    except (ValueError, ArithmeticError):
+        pass
+    return True
+
+# Wrap func so that it can derive itself, the same way as a Polynomial
+# Note: Calling the wrapper evaluates func on plain numbers, Jets are only used when derivatives are asked for
+class DifferentiableFunction():
+    def __init__(self, func : Callable) -> None:
+        self.func = func
+
+    def __call__(self, x):
+        return self.func(x)
+
+    def derivatives(self, x, order : int = 1) -> Tuple:
+        return differentiate(self.func, x, order)
+
+    def derivative(self, order : int = 1) -> "Derivative":
+        return Derivative(self.func, order)
+
+class Derivative():
+    def __init__(self, func : Callable, order : int = 1) -> None:
+        self.func = func
+        self.order = order
+
+    def __call__(self, x):
+        return differentiate(self.func, x, self.order)[self.order]
+
+# Perform unit tests with the following examples
+# func = lambda x : x * sin(x) - 1
+# differentiate(func, 1.0, 2) -> (-0.1585290151921035, 1.3817732906760363, 0.23913362692838303)
+# NewtonRhapsonSolver(func, intervals = (0, 2)) needs no der_func
+# supports_jets(lambda x : math.sin(x) - 0.5) -> False, hence NewtonRhapsonSolver(lambda x : math.sin(x) - 0.5) fails its assertion right away
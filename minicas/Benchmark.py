@@ -0,0 +1,227 @@
+# TODO: Benchmark all the solvers on a standard corpus of equations and report throughput, function evaluations per root, accuracy and failure rate
+# Note: Run as a module entry point, the report is written as JSON so that it can be tracked for regressions across versions
+#           python -m minicas.Benchmark --output benchmark.json
+# Note: Run with --imports to measure the import time of the package instead, and of its entry point followed by the first use of every registered
+# solver (see __init__.py), each in a fresh interpreter so that nothing is imported already
+
+# Note: Every equation of the corpus comes with its analytic derivatives, the intervals to bisect and its exact real roots
+# Note: All the solvers start from the same initial approximations, obtained by bisecting the intervals for a fixed number of iterations
+# Note: Brent's Method starts from the brackets these initial approximations were taken from
+# Note: Bisection itself is benchmarked by bisecting the intervals all the way down to the requested accuracy
+# Note: Solvers in this project may diverge or loop forever on unfortunate initial approximations, hence every root is solved under a budget of
+# function evaluations, and a root exceeding it is counted as a failure
+# Note: A root counts as a failure when the solver raises, exceeds the budget or ends up farther than tolerance from every exact root
+# Note: Exact roots which none of the solved roots is within tolerance of are reported as missed, e.g. roots Bisection could not bracket
+
+from typing import Callable, Dict, List, Sequence
+from .Bisection import bisect_interval, bracket_interval
+from .NewtonRhapson import NewtonRhapsonSolver
+from .Secant import SecantSolver
+from .Regula_Falsi import Regula_FalsiSolver
+from .Muller import MullerSolver
+from .Chebysev import ChebysevSolver
+from .Multipoint import MultipointSolver
+from .Brent import BrentSolver
+from .SolverStatistics import CountingFunction
+from . import solvers as registered_solvers
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+class EvaluationBudgetExceeded(Exception):
+    pass
+
+# Count the evaluations of a function and raise EvaluationBudgetExceeded once the budget is exhausted
+class BudgetedFunction(CountingFunction):
+    def __init__(self, func : Callable, budget : int) -> None:
+        super(BudgetedFunction, self).__init__(func)
+        self.budget = budget
+
+    def __call__(self, *args):
+        if self.calls >= self.budget:
+            raise EvaluationBudgetExceeded("Function evaluation budget of " + str(self.budget) + " exhausted")
+        return super(BudgetedFunction, self).__call__(*args)
+
+class Equation():
+    def __init__(self, name : str, category : str, func : Callable, der_func : Callable, der_der_func : Callable, intervals : Sequence, roots : Sequence[float]) -> None:
+        self.name = name
+        self.category = category
+        self.func = func
+        self.der_func = der_func
+        self.der_der_func = der_der_func
+        self.intervals = intervals
+        self.roots = roots
+
+corpus = [
+    Equation("quadratic", "polynomial", lambda x : x**2 - 5*x + 6, lambda x : 2*x - 5, lambda x : 2, [(1, 4)], [2.0, 3.0]),
+    Equation("cubic", "polynomial", lambda x : x**3 - 2*x - 5, lambda x : 3*x**2 - 2, lambda x : 6*x, [(2, 3)], [2.0945514815423265]),
+    Equation("quintic", "polynomial", lambda x : (x - 1)*(x - 2)*(x - 3)*(x - 4)*(x - 5),
+             lambda x : 5*x**4 - 60*x**3 + 255*x**2 - 450*x + 274, lambda x : 20*x**3 - 180*x**2 + 510*x - 450, [(0.5, 5.5)], [1.0, 2.0, 3.0, 4.0, 5.0]),
+    Equation("sine", "transcendental", math.sin, math.cos, lambda x : -math.sin(x), [(2, 4), (5, 7)], [math.pi, 2*math.pi]),
+    Equation("cosine_fixed_point", "transcendental", lambda x : math.cos(x) - x, lambda x : -math.sin(x) - 1, lambda x : -math.cos(x), [(0, 1)], [0.7390851332151607]),
+    Equation("exponential", "transcendental", lambda x : math.exp(x) - 3*x, lambda x : math.exp(x) - 3, math.exp, [(0, 1), (1, 2)], [0.6190612867359452, 1.5121345516578424]),
+    Equation("flat_power", "flat", lambda x : x**11 - 1e-3, lambda x : 11*x**10, lambda x : 110*x**9, [(0, 1)], [10**(-3/11)]),
+    Equation("steep_tanh", "stiff", lambda x : math.tanh(50*(x - 0.3)), lambda x : 50 / math.cosh(50*(x - 0.3))**2,
+             lambda x : -5000 * math.tanh(50*(x - 0.3)) / math.cosh(50*(x - 0.3))**2, [(0, 1)], [0.3]),
+    Equation("triple_root", "multiple", lambda x : (x - 1)**3 * (x + 2), lambda x : 3*(x - 1)**2 * (x + 2) + (x - 1)**3,
+             lambda x : 6*(x - 1)*(x + 2) + 6*(x - 1)**2, [(0.3, 2), (-3, -1)], [1.0, -2.0]),
+    Equation("repeated_factors", "multiple", lambda x : (x + 1)**3 * (x - 2)**3, lambda x : 3*(x + 1)**2 * (x - 2)**3 + 3*(x + 1)**3 * (x - 2)**2,
+             lambda x : 6*(x + 1)*(x - 2)**3 + 18*(x + 1)**2 * (x - 2)**2 + 6*(x + 1)**3 * (x - 2), [(-1.7, -0.2), (1.3, 2.9)], [-1.0, 2.0]),
+]
+
+solvers = {
+    "bisection" : None,
+    "newton_rhapson" : lambda equation : NewtonRhapsonSolver(equation.func, equation.der_func),
+    "secant" : lambda equation : SecantSolver(equation.func),
+    "regula_falsi" : lambda equation : Regula_FalsiSolver(equation.func),
+    "muller" : lambda equation : MullerSolver(equation.func),
+    "chebysev" : lambda equation : ChebysevSolver(equation.func, equation.der_func, equation.der_der_func),
+    "multipoint_1" : lambda equation : MultipointSolver(equation.func, equation.der_func),
+    "multipoint_2" : lambda equation : MultipointSolver(equation.func, equation.der_func),
+    "brent" : lambda equation : BrentSolver(equation.func),
+}
+
+def get_error(root : float, equation : Equation) -> float:
+    try:
+        return min(abs(root - exact_root) for exact_root in equation.roots)
+    except TypeError:
+        return math.inf
+
+# Bisect every interval down to epsilon and treat the approximations as the roots
+def benchmark_bisection(equation : Equation, epsilon : float, budget : int) -> Dict:
+    func = BudgetedFunction(equation.func, budget * len(equation.intervals))
+    start = time.perf_counter()
+    try:
+        roots = list(bisect_interval(func, list(equation.intervals), epsilon = epsilon, digits = 15).keys())
+    except EvaluationBudgetExceeded:
+        roots = []
+    wall_time = time.perf_counter() - start
+    return {"roots" : [(root, func.calls / max(len(roots), 1)) for root in roots], "attempts" : len(roots), "wall_time" : wall_time}
+
+# Solve every initial approximation separately, so that the evaluation budget applies per root
+def benchmark_solver(name : str, equation : Equation, approximations : List[float], epsilon : float, budget : int) -> Dict:
+    roots = []
+    start = time.perf_counter()
+    for approximation in approximations:
+        solver = solvers[name](equation)
+        solver.epsilon = epsilon
+        functions = [BudgetedFunction(getattr(solver, func), budget) for func in ("func", "der_func", "der_der_func") if hasattr(solver, func)]
+        solver.func = functions[0]
+        if len(functions) > 1:
+            solver.der_func = functions[1]
+        if len(functions) > 2:
+            solver.der_der_func = functions[2]
+        try:
+            if name == "multipoint_2":
+                solver.set_roots([approximation], use_method = 1)
+            else:
+                solver.set_roots([approximation])
+            roots.append((solver.get_roots()[0], sum(func.calls for func in functions)))
+        except (EvaluationBudgetExceeded, ArithmeticError, ValueError, RecursionError):
+            pass
+    wall_time = time.perf_counter() - start
+    return {"roots" : roots, "attempts" : len(approximations), "wall_time" : wall_time}
+
+def run_benchmark(names : Sequence[str] = None, equations : Sequence[Equation] = None, approximation_iterations : int = 4, epsilon : float = 1e-8,
+                  tolerance : float = 1e-4, budget : int = 1000, repeat : int = 3, seed : int = 0) -> Dict:
+    names = list(solvers) if names == None else names
+    equations = corpus if equations == None else equations
+    random.seed(seed)
+    results = []
+    for name in names:
+        assert name in solvers, "Solver should be one of " + ", ".join(solvers)
+        for equation in equations:
+            if name == "brent":
+                approximations = bracket_interval(equation.func, list(equation.intervals), approximation_iterations)
+            else:
+                approximations = list(bisect_interval(equation.func, list(equation.intervals), approximation_iterations, digits = 15).keys())
+            runs = []
+            for i in range(repeat):
+                if name == "bisection":
+                    runs.append(benchmark_bisection(equation, epsilon, budget))
+                else:
+                    runs.append(benchmark_solver(name, equation, approximations, epsilon, budget))
+            # Accuracy and evaluation counts come from the first run, throughput from the fastest one
+            run = runs[0]
+            errors = [get_error(root, equation) for root, _ in run["roots"]]
+            successes = sum(1 for error in errors if error <= tolerance)
+            failures = run["attempts"] - successes
+            missed = sum(1 for exact_root in equation.roots if not any(abs(root - exact_root) <= tolerance for root, _ in run["roots"]))
+            wall_time = min(run["wall_time"] for run in runs)
+            results.append({
+                "solver" : name,
+                "equation" : equation.name,
+                "category" : equation.category,
+                "attempts" : run["attempts"],
+                "roots" : successes,
+                "failures" : failures,
+                "missed_roots" : missed,
+                "failure_rate" : failures / run["attempts"] if run["attempts"] else 0.0,
+                "evaluations_per_root" : sum(evaluations for _, evaluations in run["roots"]) / len(run["roots"]) if run["roots"] else None,
+                "max_error" : max((error for error in errors if error <= tolerance), default = None),
+                "roots_per_second" : successes / wall_time if wall_time > 0 else None,
+                "wall_time" : wall_time,
+            })
+
+    return {
+        "python" : platform.python_version(),
+        "platform" : platform.platform(),
+        "settings" : {"approximation_iterations" : approximation_iterations, "epsilon" : epsilon, "tolerance" : tolerance, "budget" : budget, "repeat" : repeat, "seed" : seed},
+        "results" : results,
+    }
+
+# Run statement in a fresh interpreter and return the time it took, the fastest of repeat runs
+def measure_import_time(statement : str, repeat : int = 5) -> float:
+    code = "import time; start = time.perf_counter(); " + statement + "; print(time.perf_counter() - start)"
+    # The directory the package lives in
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return min(float(subprocess.run([sys.executable, "-c", code], cwd = root, capture_output = True, text = True, check = True).stdout) for i in range(repeat))
+
+def run_import_benchmark(repeat : int = 5) -> Dict:
+    package = __package__
+    results = [{"solver" : None, "statement" : "import " + package, "import_time" : measure_import_time("import " + package, repeat)}]
+    for name in registered_solvers:
+        statement = "import " + package + "; " + package + ".get_solver(" + repr(name) + ")"
+        results.append({"solver" : name, "statement" : statement, "import_time" : measure_import_time(statement, repeat)})
+
+    return {
+        "python" : platform.python_version(),
+        "platform" : platform.platform(),
+        "settings" : {"repeat" : repeat},
+        "imports" : results,
+    }
+
+def main(argv : Sequence[str] = None) -> None:
+    parser = argparse.ArgumentParser(description = "Benchmark the solvers on a standard corpus of equations")
+    parser.add_argument("--solvers", nargs = "+", choices = list(solvers), default = None, help = "Solvers to benchmark (default: all)")
+    parser.add_argument("--equations", nargs = "+", choices = [equation.name for equation in corpus], default = None, help = "Equations to solve (default: all)")
+    parser.add_argument("--approximation-iterations", type = int, default = 4, help = "Bisection iterations for the initial approximations")
+    parser.add_argument("--epsilon", type = float, default = 1e-8, help = "Accuracy requested from the solvers")
+    parser.add_argument("--tolerance", type = float, default = 1e-4, help = "Largest error of a root still counted as a success")
+    parser.add_argument("--budget", type = int, default = 1000, help = "Function evaluations allowed per root")
+    parser.add_argument("--repeat", type = int, default = 3, help = "Number of timed repetitions")
+    parser.add_argument("--seed", type = int, default = 0, help = "Seed for the random perturbations of Secant, Regula-Falsi and Muller")
+    parser.add_argument("--output", default = None, help = "File to write the JSON report to (default: stdout)")
+    parser.add_argument("--imports", action = "store_true", help = "Measure import times instead of the solvers")
+    args = parser.parse_args(argv)
+
+    if args.imports:
+        report = run_import_benchmark(args.repeat)
+    else:
+        equations = None if args.equations == None else [equation for equation in corpus if equation.name in args.equations]
+        report = run_benchmark(args.solvers, equations, args.approximation_iterations, args.epsilon, args.tolerance, args.budget, args.repeat, args.seed)
+    if args.output == None:
+        json.dump(report, sys.stdout, indent = 2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent = 2)
+
+if __name__ == "__main__":
+    main()
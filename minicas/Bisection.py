@@ -0,0 +1,157 @@
+# TODO: Bisect a closed interval [a, b] and apply the Intermediate Value Theorem either for a specified number of iterations or untill a particular accuracy
+# has already been achieved
+# Bisection helps in estimating an accurate initial approximation to a real root of a function, thus making sure that the iterative method does not diverge
+
+from .IntermediateValueTheorem import sign
+from .Vectorization import evaluate_batch
+from typing import Sequence, List, Callable, Tuple, Dict
+import math
+
+# Calculate the minimum number of iterations required for a given epsilon
+def calculate_iterations(interval : Tuple, epsilon : float) -> int:
+    return math.ceil(math.log(interval[1] - interval[0], 2) - math.log(epsilon, 2))
+
+# For an accuracy of epsilon e0, the prescribed number of iterations is given by the formula (ln(b - a) - ln(e0)) / ln(2)
+# Number of intervals need not necessarily be one, i.e. can be greater than one
+# For the approximations, 'digits' number of digits are considered after the decimal place
+
+# Note: For Bisection to work, the half-interval of the given intervals must contain either one or an odd number of real roots
+# Half-intervals are defined as follows : (lower-limit, mid-limit) and (mid-limit, upper-limit)
+
+# Note: Bisecting every interval down to a fixed number of iterations wastes most of the function evaluations on the linearly convergent phase
+# Pass hand_off(lower-limit, upper-limit, f(lower-limit), f(mid-limit), f(upper-limit)) to stop bisecting an interval as soon as it returns True,
+# i.e. once the subsequent iterative method is expected to converge from there on. The surviving half-interval(s) are then handed off as they are.
+# Note: hand_off receives NumPy arrays in the vectorized Bisection, hence it should only use arithmetic, comparisons and the & and | operators
+# Note: is_nearly_linear is the default criterion used by NumericalMethodSolver.can_hand_off
+
+# Note: Intervals may also be given as brackets (lower-limit, upper-limit, f(lower-limit), f(upper-limit)), e.g. from scan_interval in Scanning.py,
+# in which case the function values are not evaluated again
+# Note: bracket_interval returns the surviving intervals themselves as (lower-limit, upper-limit, f(lower-limit), f(upper-limit)), which bracketing
+# methods (e.g. BrentSolver) can use directly, while bisect_interval reduces every bracket to its mid-point as an initial approximation
+
+# The function is close to linear over [lower, upper] when the slopes over both half-intervals have the same sign and differ at most by a factor of 2
+# Close to linear functions have |g'(x)| well below 1 for the generator functions g of Newton-Rhapson, Secant, Chebysev and Multipoint Methods
+# Note: The ratio of the slopes is compared without dividing, (d_left/d_right) in [1/2, 2] <==> d_left.d_right in (0, 2.d_left^2] and (0, 2.d_right^2]
+def is_nearly_linear(lower : float, upper : float, f_lower : float, f_mid : float, f_upper : float) -> bool:
+    d_left, d_right = f_mid - f_lower, f_upper - f_mid
+    product = d_left * d_right
+    return (product > 0) & (product <= 2 * d_left * d_left) & (product <= 2 * d_right * d_right)
+
+# Validate the arguments of Bisection and return the number of iterations to bisect all the intervals for
+def get_iterations(intervals : Sequence, iterations : int = None, epsilon : float = None) -> int:
+    assert intervals[0][0] < intervals[0][1], "Lower limit should be strictly lesser than or equal to Upper limit"
+    assert not(iterations == None) or not(epsilon == None), "Either the number of iterations or the degree of accuracy should be specified, Both cannot be None"
+    # Domain Constraints
+    if not iterations == None:
+        assert isinstance(iterations, int) and iterations > 0, "Number of iterations should be an integer and should trivially be greater than zero"
+    if not epsilon == None:
+        iterations = 0 if iterations == None else iterations
+        for interval in intervals:
+            iterations = max(iterations, calculate_iterations(interval, epsilon))
+    return iterations
+
+def bracket_interval(func : Callable, intervals : Sequence, iterations : int = None, epsilon : float = None, vectorized : bool = False, hand_off : Callable = None) -> List[Tuple]:
+    if isinstance(intervals, tuple):
+        intervals = [intervals]
+    iterations = get_iterations(intervals, iterations, epsilon)
+    if vectorized:
+        return list(zip(*(array.tolist() for array in bracket_interval_vectorized(func, intervals, iterations, hand_off))))
+
+    # Every interval carries the function values at its end-points, so each half-interval only costs a single evaluation at the mid-point
+    # Intervals which have been handed off are flagged as done and passed through untouched, so that the order of the brackets is preserved
+    intervals = [(interval[0], interval[1]) + (tuple(interval[2:4]) if len(interval) == 4 else (func(interval[0]), func(interval[1]))) + (False,) for interval in intervals]
+    for i in range(iterations):
+        new_intervals = []
+        for lower, upper, f_lower, f_upper, done in intervals:
+            if done:
+                new_intervals.append((lower, upper, f_lower, f_upper, done))
+                continue
+            # Calculate the mid-point of the interval
+            mid_interval = lower + (upper - lower) / 2
+            f_mid = func(mid_interval)
+            done = not hand_off == None and bool(hand_off(lower, upper, f_lower, f_mid, f_upper))
+            # Same checks as has_root(func, (lower, mid_interval)) and has_root(func, (mid_interval, upper)) on the cached values
+            if f_lower == 0 or f_mid == 0 or sign(f_lower) * sign(f_mid) == -1:
+                new_intervals.append((lower, mid_interval, f_lower, f_mid, done))
+
+            # If the mid_interval turns out to be a real root, checking the second range is unnecessary
+            if not f_mid == 0 and (f_upper == 0 or sign(f_mid) * sign(f_upper) == -1):
+                new_intervals.append((mid_interval, upper, f_mid, f_upper, done))
+        intervals = new_intervals
+        if all(interval[4] for interval in intervals):
+            break
+
+    return [interval[:4] for interval in intervals]
+
+# Vectorized Bisection keeps all the live intervals in NumPy arrays (lower limits, upper limits and the cached function values at both)
+# Each iteration evaluates func exactly once over the array of mid-points and compacts the surviving half-intervals with boolean masks
+# Note: Surviving half-intervals are interleaved (left half before right half) so the brackets come out in the same order as the scalar Bisection
+# Note: Handed off intervals are kept in place as their own left half-interval, without evaluating func at their mid-points
+def bracket_interval_vectorized(func : Callable, intervals : Sequence, iterations : int, hand_off : Callable = None) -> Tuple:
+    import numpy as np
+    lower = np.array([interval[0] for interval in intervals], dtype = float)
+    upper = np.array([interval[1] for interval in intervals], dtype = float)
+    if all(len(interval) == 4 for interval in intervals):
+        f_lower = np.array([interval[2] for interval in intervals], dtype = float)
+        f_upper = np.array([interval[3] for interval in intervals], dtype = float)
+    else:
+        f_lower, f_upper = evaluate_batch(func, lower), evaluate_batch(func, upper)
+    done = np.zeros(len(lower), dtype = bool)
+    for i in range(iterations):
+        if done.all():
+            break
+        mid_interval = lower + (upper - lower) / 2
+        if hand_off == None:
+            f_mid = evaluate_batch(func, mid_interval)
+            handed_off = done
+        else:
+            active = ~done
+            mid_interval[done] = upper[done]
+            f_mid = f_upper.copy()
+            f_mid[active] = evaluate_batch(func, mid_interval[active])
+            handed_off = np.zeros(len(lower), dtype = bool)
+            handed_off[active] = hand_off(lower[active], upper[active], f_lower[active], f_mid[active], f_upper[active])
+        keep_left = (f_lower == 0) | (f_mid == 0) | (np.sign(f_lower) * np.sign(f_mid) == -1) | done
+        keep_right = (f_mid != 0) & ((f_upper == 0) | (np.sign(f_mid) * np.sign(f_upper) == -1)) & ~done
+        keep = np.stack((keep_left, keep_right), axis = 1).ravel()
+        lower = np.stack((lower, mid_interval), axis = 1).ravel()[keep]
+        upper = np.stack((mid_interval, upper), axis = 1).ravel()[keep]
+        f_lower = np.stack((f_lower, f_mid), axis = 1).ravel()[keep]
+        f_upper = np.stack((f_mid, f_upper), axis = 1).ravel()[keep]
+        done = np.repeat(done | handed_off, 2)[keep]
+
+    return lower, upper, f_lower, f_upper
+
+# Mid-points of the brackets along with the function values at them
+def evaluate_mid_intervals(func : Callable, brackets : Sequence[Tuple], vectorized : bool = False) -> Tuple[List, List]:
+    if len(brackets) == 0:
+        return [], []
+    mid_intervals = [bracket[0] + (bracket[1] - bracket[0]) / 2 for bracket in brackets]
+    if vectorized:
+        import numpy as np
+        values = evaluate_batch(func, np.array(mid_intervals, dtype = float)).tolist()
+    else:
+        values = [func(mid_interval) for mid_interval in mid_intervals]
+    return mid_intervals, values
+
+# List of initial approximations to the real roots of the function contained in the brackets
+# Note: Approximations rounding to the same key are merged, see ResultStorage.py for a store which keeps every one of them
+def approximate_brackets(func : Callable, brackets : Sequence[Tuple], digits : int = 5, vectorized : bool = False) -> Dict:
+    approximations = dict()
+    for approximation, value in zip(*evaluate_mid_intervals(func, brackets, vectorized)):
+        approximations[round(approximation, digits)] = value
+
+    return approximations
+
+# Note: Set vectorized to True to bisect all the intervals as NumPy arrays, which pays off for array-aware functions and large numbers of intervals
+def bisect_interval(func : Callable, intervals : Sequence, iterations : int = None, epsilon : float = None, digits : None = 5, vectorized : bool = False, hand_off : Callable = None) -> Dict:
+    return approximate_brackets(func, bracket_interval(func, intervals, iterations, epsilon, vectorized, hand_off), digits, vectorized)
+
+# Perform unit tests with the following examples
+# func = lambda x : x**2 - 5*x + 6
+# bisect_interval(func, (1, 4), 10) ->  {2.00049: -0.00048804283142089844, 2.99951: -0.00048804283142089844}
+# bisect_interval(func, (1, 4), epsilon = 1e-5) ->  {2.0: 9.536752259009518e-07, 3.0: 9.536752259009518e-07}
+# bisect_interval(func, (1, 4), epsilon = 1e-5, vectorized = True) ->  {2.0: 9.536752259009518e-07, 3.0: 9.536752259009518e-07}
+            
+    
+        
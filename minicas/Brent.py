@@ -0,0 +1,93 @@
+# TODO: Use Brent's Method for finding out the real roots of a function f.
+# Note: Brent's Method has a superlinear order of convergence (upto 1.839 with inverse quadratic interpolation) while being guaranteed to converge like Bisection
+# Note: Brent's Method uses a bracket [a, b] with f(a)f(b) < 0 instead of an initial approximation, see bracket_interval in Bisection.py
+
+# Method : At every iteration, propose the next value s with the fastest applicable interpolation
+#           Inverse quadratic interpolation (the inverse of Muller's parabola) through (a, f(a)), (b, f(b)) and (c, f(c)) when the three values differ
+#           s = a.f(b).f(c)/((f(a) - f(b))(f(a) - f(c))) + b.f(a).f(c)/((f(b) - f(a))(f(b) - f(c))) + c.f(a).f(b)/((f(c) - f(a))(f(c) - f(b)))
+#           The Secant Method (see SecantSolver.calculate_next_value) otherwise
+#           s = b - f(b) * (b - a) / (f(b) - f(a))
+# Method : Fall back to Bisection s = (a + b) / 2 whenever s leaves the part of the bracket between (3a + b)/4 and b, or the interpolation steps
+# stop shrinking fast enough (Dekker's safeguards as refined by Brent)
+# Method : Replace a or b with s so that the bracket keeps a sign change (Intermediate Value Theorem), b being the best approximation so far
+
+# Note: Stop iteration in one of three situations:
+#           |f(b)| < epsilon
+#           |b - a| < epsilon, which bounds the error of the root itself since the root always lies inside the bracket
+#           the budget of the root runs out, or the iterations are cancelled or stagnate (see Budget.py)
+
+# Note: Set manual brackets while calculating roots of f using init_brackets, as (lower-limit, upper-limit) tuples
+# Note: Instead of using manual brackets, set brackets of f using Bisection Method through self.set_approximations(*args, **kwargs), a handful of
+# iterations isolating the roots is enough since Brent's Method converges superlinearly from there on
+# Note: Warm starts (see NumericalMethod.py) hand over the bracket around the previous root, as Brent's Method needs nothing more
+
+from typing import Callable, Tuple, List, Sequence, Dict
+from .NumericalMethod import NumericalMethodSolver
+from .IntermediateValueTheorem import sign
+from .SolverStatistics import RootResult
+
+class BrentSolver(NumericalMethodSolver):
+    warm_start_points = 2
+
+    def find_root(self, bracket : Tuple) -> RootResult:
+        a, b = bracket[0], bracket[1]
+        f_a, f_b = (bracket[2], bracket[3]) if len(bracket) == 4 else (self.func(a), self.func(b))
+        assert f_a == 0 or f_b == 0 or sign(f_a) * sign(f_b) == -1, "The function should change its sign over the bracket (" + str(a) + ", " + str(b) + ")"
+        if abs(f_a) < abs(f_b):
+            a, b, f_a, f_b = b, a, f_b, f_a
+        c, f_c = a, f_a
+        d = c
+        bisected = True
+        monitor = self.get_monitor()
+        stop = None
+        iterations = 0
+        while(abs(f_b) >= self.epsilon and not self.is_small_step(b, a) and stop == None):
+            if not f_a == f_c and not f_b == f_c:
+                s = a * f_b * f_c / ((f_a - f_b) * (f_a - f_c)) + b * f_a * f_c / ((f_b - f_a) * (f_b - f_c)) + c * f_a * f_b / ((f_c - f_a) * (f_c - f_b))
+            else:
+                s = b - f_b * (b - a) / (f_b - f_a)
+
+            # Bisect whenever the interpolated step leaves the bracket or is not shrinking at least as fast as Bisection would
+            if (not min((3 * a + b) / 4, b) < s < max((3 * a + b) / 4, b)
+                or (bisected and abs(s - b) >= abs(b - c) / 2)
+                or (not bisected and abs(s - b) >= abs(c - d) / 2)
+                or (bisected and abs(b - c) < self.epsilon)
+                or (not bisected and abs(c - d) < self.epsilon)):
+                s = a + (b - a) / 2
+                bisected = True
+            else:
+                bisected = False
+
+            f_s = self.func(s)
+            d = c
+            c, f_c = b, f_b
+            if sign(f_a) * sign(f_s) == -1:
+                b, f_b = s, f_s
+            else:
+                a, f_a = s, f_s
+            if abs(f_a) < abs(f_b):
+                a, b, f_a, f_b = b, a, f_b, f_a
+            iterations += 1
+            if not self.callback == None:
+                self.callback(iterations, b, f_b)
+            stop = monitor.update(iterations, f_b)
+
+        return self.get_result(b, f_b, iterations, stop = stop)
+
+    def get_cold_approximations(self) -> List:
+        assert not self.brackets == None, "Brackets need to be set before calculating roots by calling self.set_approximations(*args, **kwargs)"
+        return self.brackets
+
+    def set_roots(self, init_brackets : Sequence[Tuple] = None) -> None:
+        if init_brackets == None:
+            init_brackets = self.get_initial_approximations()
+        elif isinstance(init_brackets, tuple):
+            init_brackets = [init_brackets]
+        self.map_roots(self.find_root, init_brackets)
+
+# Perform unit tests with the following examples
+# func = lambda x : x**3 - 2*x - 5
+# solver = BrentSolver(func, [(2, 3)], 1e-12)
+# solver.set_approximations(2)
+# solver.set_roots()
+# solver.get_roots() -> [2.0945514815423265]
@@ -0,0 +1,70 @@
+# TODO: Bound the work spent on every root, so that a single non-convergent approximation cannot hold up a whole batch of roots
+# Note: Every find_root(self, x_0) starts an IterationMonitor (see NumericalMethodSolver.set_budget(*args, **kwargs)) and stops iterating as soon
+# as the monitor reports a reason, in one of four situations:
+#           the number of iterations reaches max_iterations                                 -> BUDGET_EXHAUSTED
+#           the wall time spent on the root reaches max_time seconds                        -> BUDGET_EXHAUSTED
+#           the cancellation token is cancelled                                             -> CANCELLED
+#           the best |f(x)| so far has not halved over the last stall_iterations iterations -> STAGNATED
+# Note: Stagnation catches the iterations which crawl rather than converge, e.g. Regula-Falsi holding on to one end-point of its bracket, or
+# Newton-Rhapson's Method cycling between two points. A root of high multiplicity is approached slowly by any method, hence stall_iterations
+# should be raised rather than lowered for such functions
+# Note: Roots which run out of their budget are still reported with the last iterate, and their reason tells them apart from converged ones
+
+# Note: A CancellationToken is shared by all the roots (and the solvers) it is handed to, cancel() stops every one of them after its current
+# iteration, while the roots which were already calculated are kept. Call reset() before reusing the token
+# Note: The process backend pickles the token along with the solver, hence it needs an event which is shared across processes, e.g.
+# CancellationToken(multiprocessing.Manager().Event()). The default threading.Event covers the serial and thread backends
+
+from .SolverStatistics import BUDGET_EXHAUSTED, STAGNATED, CANCELLED
+import threading
+import time
+
+class CancellationToken():
+    def __init__(self, event = None) -> None:
+        self.event = threading.Event() if event == None else event
+
+    def cancel(self) -> None:
+        self.event.set()
+
+    def reset(self) -> None:
+        self.event.clear()
+
+    def is_cancelled(self) -> bool:
+        return self.event.is_set()
+
+class IterationMonitor():
+    def __init__(self, max_iterations : int = None, max_time : float = None, cancellation : CancellationToken = None, stall_iterations : int = None) -> None:
+        self.max_iterations = max_iterations
+        self.deadline = None if max_time == None else time.perf_counter() + max_time
+        self.cancellation = cancellation
+        self.stall_iterations = stall_iterations
+        self.best = None
+        self.best_iteration = 0
+
+    # Return the reason to stop iterating after the given number of iterations, or None to carry on, regardless of |f(x)|
+    def check(self, iterations : int) -> str:
+        if not self.cancellation == None and self.cancellation.is_cancelled():
+            return CANCELLED
+        if not self.max_iterations == None and iterations >= self.max_iterations:
+            return BUDGET_EXHAUSTED
+        if not self.deadline == None and time.perf_counter() >= self.deadline:
+            return BUDGET_EXHAUSTED
+        return None
+
+    # Record |f(x)| after the given number of iterations, and return the reason to stop iterating, or None to carry on
+    def update(self, iterations : int, f_x) -> str:
+        stop = self.check(iterations)
+        if not stop == None:
+            return stop
+        if not self.stall_iterations == None:
+            residual = abs(f_x)
+            if self.best == None or residual <= 0.5 * self.best:
+                self.best, self.best_iteration = residual, iterations
+            elif iterations - self.best_iteration >= self.stall_iterations:
+                return STAGNATED
+        return None
+
+# Perform unit tests with the following examples
+# monitor = IterationMonitor(stall_iterations = 3)
+# [monitor.update(i, 1.0 / (i + 1)) for i in range(1, 5)] -> [None, None, None, None]
+# [monitor.update(i, 0.2) for i in range(5, 9)] -> [None, 'stagnated', 'stagnated', 'stagnated']
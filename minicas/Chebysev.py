@@ -31,55 +31,52 @@
 #   x* - x_0 = -f(x_0)/f'(x_0) - (1/2).(f(x_0)/f'(x_0))^2.f''(x_0)/f'(x_0)
 #   x* = x_0 - f(x_0)/f'(x_0) - (1/2).f(x_0)^2.f''(x_0)/f'(x_0)^3
 
-# Note: Stop iteration in one of two situations:
+# Note: Stop iteration in one of three situations:
 #           |f(x)| < epsilon
 #           |x(k + 1) - x(k)| < epsilon
+#           the budget of the root runs out, or the iterations are cancelled or stagnate (see Budget.py)
+
+# Note: At a root of multiplicity m > 1 (see Multiplicity.py), the iterations switch to Chebysev's Method for multiple roots, which is of the third order again
+#           x_new = x - (m.(3 - m)/2).f(x)/f'(x) - (m^2/2).f(x)^2.f''(x)/f'(x)^3
+# and reduces to the above for m = 1
+
+# Note: der_func and der_der_func may be omitted, they are then derived from func (Polynomial or automatic differentiation) and f(x), f'(x) and f''(x)
+# are evaluated in a single pass
 
 # Note: Set manual approximations while calculating roots of f using init_approx
 # Note: Instead of using manual approximations, set approximations of f using Bisection Method through self.set_approximations(*args, **kwargs)
 
 from typing import Callable, Tuple, List, Sequence, Dict
-from NumericalMethodSolver import NumericalMethodSolver
-from NewtonRhapsonSolver import NewtonRhapsonSolver
+from .NumericalMethod import NumericalMethodSolver
+from .SolverStatistics import RootResult
+from .Multiplicity import MultiplicityEstimator
 
 class ChebysevSolver(NumericalMethodSolver):
-    def __init__(self, func : Callable, der_func : Callable, der_der_func : Callable, intervals : Sequence = None, epsilon : float = 1e-5) -> None:
+    def __init__(self, func : Callable, der_func : Callable = None, der_der_func : Callable = None, intervals : Sequence = None, epsilon : float = 1e-5) -> None:
         super(ChebysevSolver, self).__init__(func, intervals, epsilon)
-        self.der_func = der_func
-        self.der_der_func = der_der_func
+        self.der_func, self.der_der_func = self.resolve_derivatives(der_func, der_der_func)
     
-    def set_roots(self, init_approx : float = None) -> None:
-        if init_approx == None:
-            assert not self.approximations == None, "Approximations need to be set before calculating roots by calling self.set_approximations(*args, **kwargs)"
-            self.roots = []
-            for approximation in self.approximations.keys():
-                x_0 = approximation
-                f_x_k = self.func(x_0)
-                while(abs(f_x_k) >= self.epsilon):
-                    x_new, f_init_x, der_f_init_x, _ = NewtonRhapsonSolver.calculate_next_value(self.func, self.der_func, x_0, True)
-                    x_new -= 0.5 * f_init_x * f_init_x * self.der_der_func(x_0) / (der_f_init_x * der_f_init_x * der_f_init_x)
-                    if (x_new - x_0) < self.epsilon:
-                        x_0 = x_new
-                        break
-                    x_0 = x_new
-                    f_x_k = self.func(x_new)
-
-                self.roots.append(x_0)
-        else:
-            self.roots = []
-            if isinstance(init_approx, float) or isinstance(init_approx, int):
-                init_approx = [init_approx]
-            for i in range(len(init_approx)):
-                x_0 = init_approx[i]
-                f_x_k = self.func(x_0)
-                while(abs(f_x_k) >= self.epsilon):
-                    x_new, f_init_x, der_f_init_x, _ = NewtonRhapsonSolver.calculate_next_value(self.func, self.der_func, x_0, True)
-                    x_new -= 0.5 * f_init_x * f_init_x * self.der_der_func(x_0) / (der_f_init_x * der_f_init_x * der_f_init_x)
-                    if (x_new - x_0) < self.epsilon:
-                        x_0 = x_new
-                        break
-                    x_0 = x_new
-                    f_x_k = self.func(x_new)
+    # Note: f(x), f'(x) and f''(x) are evaluated together once per iteration
+    def find_root(self, x_0 : float) -> RootResult:
+        f_x_k, der_f_x_k, der_der_f_x_k = self.evaluate(x_0, 2)
+        estimator = MultiplicityEstimator() if self.detect_multiplicity else None
+        multiplicity = 1
+        monitor = self.get_monitor()
+        stop = None
+        iterations = 0
+        while(abs(f_x_k) >= self.epsilon and not der_f_x_k == 0 and stop == None):
+            if not estimator == None:
+                multiplicity = estimator.update(x_0, f_x_k, f_x_k / der_f_x_k)
+            x_new = x_0 - 0.5 * multiplicity * (3 - multiplicity) * f_x_k / der_f_x_k
+            x_new -= 0.5 * multiplicity * multiplicity * f_x_k * f_x_k * der_der_f_x_k / (der_f_x_k * der_f_x_k * der_f_x_k)
+            step_is_small = self.is_small_step(x_new, x_0)
+            x_0 = x_new
+            f_x_k, der_f_x_k, der_der_f_x_k = self.evaluate(x_new, 2)
+            iterations += 1
+            if not self.callback == None:
+                self.callback(iterations, x_0, f_x_k)
+            stop = monitor.update(iterations, f_x_k)
+            if step_is_small:
+                break
 
-                self.roots.append(x_0)
-        
+        return self.get_result(x_0, f_x_k, iterations, None if estimator == None else multiplicity, stop)
@@ -0,0 +1,146 @@
+# TODO: Approximate an expensive function f over an interval with a polynomial proxy p, and find all the roots of the proxy instead of f
+# Note: For smooth f, a handful of evaluations of f pins down every root in the interval to a few ulps (up to the tolerance), after which
+# a few steps of Newton Rhapson or Secant Method on f itself polish them, instead of the dozens of evaluations Bisection spends per root
+
+# Method : Sample f on the n + 1 Chebyshev points x(j) = cos(j.pi/n), j = 0, ..., n, mapped from [-1, 1] onto the interval
+# Method : The coefficients c(k) of the interpolant p(x) = c(0).T(0)(x) + ... + c(n).T(n)(x) in the Chebyshev basis are a discrete cosine
+# transform of the samples, computed with an FFT of their even extension
+# Method : Adaptive degree, starting from n = 16 and doubling n until the coefficients have decayed below tolerance (relative to the largest one)
+# over the last eighth of them. Doubling n keeps every previous point, hence only the n new points are evaluated. The trailing coefficients below
+# tolerance are then chopped off
+# Method : The roots of p are the eigenvalues of its colleague matrix (numpy.polynomial.chebyshev.chebroots), the real ones inside [-1, 1] being
+# mapped back onto the interval
+
+# Note: A root of multiplicity m is perturbed by about tolerance^(1/m), the eigenvalues of a double root turning into a complex pair, hence eigenvalues
+# within sqrt(tolerance) of the real axis are kept, and roots closer to each other than that are merged
+# Note: Functions which are not resolved with max_degree (discontinuities, singularities, very wide intervals) still get a proxy, whose roots are
+# then rough approximations only (see self.converged). Split such intervals into smaller ones
+# Note: Requires NumPy, like the vectorized Bisection. f is evaluated in batches, see evaluate_batch in Vectorization.py
+
+from typing import Callable, List, Sequence, Tuple
+from .Vectorization import evaluate_batch
+import math
+
+# Chebyshev points cos(j.pi/n) for j in indices, mapped onto [lower, upper]
+def chebyshev_points(n : int, lower : float, upper : float, indices = None):
+    import numpy as np
+    indices = np.arange(n + 1) if indices is None else indices
+    return lower + (upper - lower) * (np.cos(np.pi * indices / n) + 1) / 2
+
+# Coefficients of the interpolant through the values at the n + 1 Chebyshev points, in the Chebyshev basis
+def chebyshev_coefficients(values):
+    import numpy as np
+    n = len(values) - 1
+    coefficients = np.fft.rfft(np.concatenate((values, values[-2:0:-1]))).real / n
+    coefficients[0] /= 2
+    coefficients[n] /= 2
+    return coefficients[:n + 1]
+
+# Degree of the interpolant once its trailing coefficients have decayed below tolerance, or None when they have not decayed yet
+def get_degree(coefficients, tolerance : float):
+    import numpy as np
+    magnitudes = np.abs(coefficients)
+    scale = magnitudes.max()
+    if scale == 0:
+        return 0
+    significant = np.flatnonzero(magnitudes > tolerance * scale)
+    tail = max(2, len(coefficients) // 8)
+    if significant[-1] >= len(coefficients) - tail:
+        return None
+    return int(significant[-1])
+
+class ChebyshevProxy():
+    def __init__(self, func : Callable, interval : Tuple, tolerance : float = 1e-13, max_degree : int = 512) -> None:
+        import numpy as np
+        assert interval[0] < interval[1], "Lower limit should be strictly lesser than Upper limit"
+        assert tolerance > 0, "Tolerance should trivially be greater than zero"
+        assert isinstance(max_degree, int) and max_degree >= 16, "Maximum degree should be an integer and should be at least 16"
+        self.lower, self.upper = float(interval[0]), float(interval[1])
+        self.tolerance = tolerance
+        n = 16
+        values = evaluate_batch(func, chebyshev_points(n, self.lower, self.upper))
+        while(True):
+            assert np.all(np.isfinite(values)), "func should be finite over the interval (" + str(self.lower) + ", " + str(self.upper) + ")"
+            coefficients = chebyshev_coefficients(values)
+            degree = get_degree(coefficients, tolerance)
+            if not degree == None or 2 * n > max_degree:
+                break
+            # The points of 2n are the points of n (even indices) and the new odd ones
+            refined = np.empty(2 * n + 1)
+            refined[0::2] = values
+            refined[1::2] = evaluate_batch(func, chebyshev_points(2 * n, self.lower, self.upper, np.arange(1, 2 * n, 2)))
+            values, n = refined, 2 * n
+
+        self.evaluations = len(values)
+        self.converged = not degree == None
+        self.coefficients = coefficients if degree == None else coefficients[:degree + 1]
+
+    def degree(self) -> int:
+        return len(self.coefficients) - 1
+
+    # Map x from the interval onto [-1, 1] and back
+    def to_unit(self, x):
+        return (2 * x - self.lower - self.upper) / (self.upper - self.lower)
+
+    def from_unit(self, t):
+        return self.lower + (self.upper - self.lower) * (t + 1) / 2
+
+    # Evaluate the proxy (Clenshaw's recurrence), for numbers and arrays alike
+    def __call__(self, x):
+        from numpy.polynomial import chebyshev
+        return chebyshev.chebval(self.to_unit(x), self.coefficients)
+
+    def roots(self) -> List[float]:
+        import numpy as np
+        from numpy.polynomial import chebyshev
+        coefficients = np.trim_zeros(self.coefficients, "b")
+        if len(coefficients) < 2:
+            return []
+        spread = math.sqrt(self.tolerance)
+        eigenvalues = chebyshev.chebroots(coefficients)
+        roots = np.sort(eigenvalues[(np.abs(eigenvalues.imag) <= spread) & (np.abs(eigenvalues.real) <= 1 + spread)].real)
+        if len(roots) == 0:
+            return []
+        # Merge the roots of a multiple root
+        roots = roots[np.concatenate(([True], np.diff(roots) > spread))]
+        return self.from_unit(np.clip(roots, -1, 1)).tolist()
+
+# Roots of the proxies of func over every interval, as (root, p(root)) pairs, along with the proxies
+def approximate_roots(func : Callable, intervals : Sequence, tolerance : float = 1e-13, max_degree : int = 512) -> Tuple[List[ChebyshevProxy], List[Tuple]]:
+    if isinstance(intervals, tuple):
+        intervals = [intervals]
+    proxies, candidates = [], []
+    for interval in intervals:
+        proxy = ChebyshevProxy(func, interval, tolerance, max_degree)
+        roots = proxy.roots()
+        proxies.append(proxy)
+        candidates.extend((root, float(proxy(root))) for root in roots)
+    return proxies, candidates
+
+# Brackets (lower-limit, upper-limit, f(lower-limit), f(upper-limit)) around the roots inside every interval, reaching halfway to the neighbouring
+# roots (or up to the limits of the interval), which costs one evaluation of f per root and per interval. Only the brackets over which f changes its
+# sign are kept, hence roots of even multiplicity (or spurious roots of the proxy) are not bracketed
+def bracket_roots(func : Callable, intervals : Sequence, roots : Sequence[float]) -> List[Tuple]:
+    if isinstance(intervals, tuple):
+        intervals = [intervals]
+    brackets = []
+    for lower, upper in intervals:
+        inner = sorted(root for root in roots if lower <= root <= upper)
+        if len(inner) == 0:
+            continue
+        limits = [lower] + [a + (b - a) / 2 for a, b in zip(inner, inner[1:])] + [upper]
+        values = [func(limit) for limit in limits]
+        for i in range(len(inner)):
+            if values[i] == 0 or values[i + 1] == 0 or (values[i] < 0) != (values[i + 1] < 0):
+                brackets.append((limits[i], limits[i + 1], values[i], values[i + 1]))
+    return brackets
+
+# Perform unit tests with the following examples
+# func = lambda x : x * np.sin(x) - 1
+# proxies, candidates = approximate_roots(func, (0, 20))
+# [root for root, _ in candidates] -> [1.1141571408717221, 2.7726047082658623, 6.439117238417227, 9.317242941414785, 12.645532578789087, 15.64399737477316, 18.902483730342464]
+# proxies[0].degree(), proxies[0].evaluations -> (32, 65)
+# bracket_roots(lambda x : (x - 1)**2 * (x - 3), (0, 4), [1.0, 3.0]) -> [(2.0, 4, -1.0, 9)]      (the double root 1 is not bracketed)
+# solver = BrentSolver(func, [(0, 20)])
+# solver.set_approximations(chebyshev = True)
+# solver.set_roots() -> 7 roots, from the 7 brackets around the roots of the proxy
@@ -0,0 +1,320 @@
+# TODO: Represent real numbers with about 32 significant digits in pure Python, as the unevaluated sum of two floats hi + lo (double-double)
+# Note: Meant for the occasional ill-conditioned root, where the 16 digits of a float cannot resolve f near the root (clusters of roots,
+# polynomials with huge coefficients, ...). Every operation costs a few dozen float operations, hence it is far slower than float
+# Note: A DoubleDouble supports the arithmetic operators, comparisons and the elementary functions of AutomaticDifferentiation.py (as methods,
+# like Jets and Intervals), so the same func evaluates over floats and DoubleDoubles, and so do Polynomials and compiled expressions
+
+# Method : hi is the float nearest to the number and lo the remainder, |lo| <= ulp(hi)/2
+# Method : Error free transformations give the exact rounding error of a float operation as a float
+#           two_sum(a, b)   -> (s, e), s = fl(a + b) and a + b = s + e exactly (Knuth)
+#           two_prod(a, b)  -> (p, e), p = fl(a.b) and a.b = p + e exactly (Dekker, splitting a and b into 26 bit halves)
+# Method : Elementary functions reduce their argument and sum their Taylor series in double-double (exp, sin, cos, sinh), or polish the float
+# result with a single Newton-Rhapson step, which doubles its number of digits (sqrt, log, atan)
+
+# Note: Unit roundoff is 2^-105 (about 2.5e-32), hence eps (the spacing of DoubleDoubles at 1) is 2^-104, see NumericBackends.py
+# Note: Arguments of sin, cos and tan are reduced with pi/2 in double-double, which is accurate for |x| up to about 1e6
+# Note: Exact constants are given as strings, e.g. DoubleDouble("0.1"), since the float 0.1 is only accurate to 16 digits
+
+import math
+
+def two_sum(a : float, b : float):
+    s = a + b
+    v = s - a
+    return s, (a - (s - v)) + (b - v)
+
+# two_sum for |a| >= |b|
+def quick_two_sum(a : float, b : float):
+    s = a + b
+    return s, b - (s - a)
+
+def split(a : float):
+    c = 134217729.0 * a
+    hi = c - (c - a)
+    return hi, a - hi
+
+def two_prod(a : float, b : float):
+    p = a * b
+    if not math.isfinite(p):
+        return p, 0.0
+    a_hi, a_lo = split(a)
+    b_hi, b_lo = split(b)
+    return p, ((a_hi * b_hi - p) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+
+# DoubleDouble from its normalized parts, bypassing the conversions of __init__
+def make(hi : float, lo : float = 0.0) -> "DoubleDouble":
+    x = object.__new__(DoubleDouble)
+    x.hi, x.lo = hi, (lo if math.isfinite(hi) else 0.0)
+    return x
+
+# Convert numbers for the arithmetic operators, other types (Jets, arrays, complex numbers) are left to their own operators
+def to_double_double(value):
+    if isinstance(value, DoubleDouble):
+        return value
+    if isinstance(value, (int, float)):
+        return DoubleDouble(value)
+    return NotImplemented
+
+class DoubleDouble():
+    __slots__ = ("hi", "lo")
+
+    def __init__(self, value = 0.0, lo : float = 0.0) -> None:
+        if isinstance(value, DoubleDouble):
+            value, lo = value.hi, value.lo
+        elif isinstance(value, str):
+            import decimal
+            with decimal.localcontext() as context:
+                context.prec = 40
+                exact = decimal.Decimal(value)
+                value = float(exact)
+                lo = float(exact - decimal.Decimal(value)) if math.isfinite(value) else 0.0
+        elif isinstance(value, int):
+            # Integers beyond 2^53 keep their remaining bits in lo
+            integer = value
+            value = float(integer)
+            lo = float(integer - int(value)) if math.isfinite(value) else 0.0
+        hi, lo = two_sum(float(value), float(lo))
+        self.hi, self.lo = hi, (lo if math.isfinite(hi) else 0.0)
+
+    def __repr__(self) -> str:
+        return "DoubleDouble('" + self.to_string(34) + "')"
+
+    def __str__(self) -> str:
+        return self.to_string(32)
+
+    def to_string(self, digits : int) -> str:
+        if not math.isfinite(self.hi):
+            return repr(self.hi)
+        import decimal
+        with decimal.localcontext() as context:
+            context.prec = digits
+            return str(+(decimal.Decimal(self.hi) + decimal.Decimal(self.lo)))
+
+    def __float__(self) -> float:
+        return self.hi
+
+    def __complex__(self) -> complex:
+        return complex(self.hi)
+
+    def __bool__(self) -> bool:
+        return not self.hi == 0
+
+    def __round__(self, digits : int = None):
+        return round(self.hi, digits)
+
+    def __hash__(self) -> int:
+        return hash(self.hi) if self.lo == 0 else hash((self.hi, self.lo))
+
+    def __add__(self, other) -> "DoubleDouble":
+        other = to_double_double(other)
+        if other is NotImplemented:
+            return other
+        s, e = two_sum(self.hi, other.hi)
+        t, f = two_sum(self.lo, other.lo)
+        s, e = quick_two_sum(s, e + t)
+        return make(*quick_two_sum(s, e + f))
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "DoubleDouble":
+        return make(-self.hi, -self.lo)
+
+    def __pos__(self) -> "DoubleDouble":
+        return self
+
+    def __abs__(self) -> "DoubleDouble":
+        return -self if self.hi < 0 else self
+
+    def __sub__(self, other) -> "DoubleDouble":
+        other = to_double_double(other)
+        if other is NotImplemented:
+            return other
+        return self + (-other)
+
+    def __rsub__(self, other) -> "DoubleDouble":
+        other = to_double_double(other)
+        if other is NotImplemented:
+            return other
+        return other + (-self)
+
+    def __mul__(self, other) -> "DoubleDouble":
+        other = to_double_double(other)
+        if other is NotImplemented:
+            return other
+        p, e = two_prod(self.hi, other.hi)
+        return make(*quick_two_sum(p, e + (self.hi * other.lo + self.lo * other.hi)))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> "DoubleDouble":
+        other = to_double_double(other)
+        if other is NotImplemented:
+            return other
+        if other.hi == 0:
+            raise ZeroDivisionError("division by zero")
+        # Long division, one float digit at a time
+        q_1 = self.hi / other.hi
+        r = self - other * q_1
+        q_2 = r.hi / other.hi
+        r = r - other * q_2
+        return make(*quick_two_sum(q_1, q_2)) + r.hi / other.hi
+
+    def __rtruediv__(self, other) -> "DoubleDouble":
+        other = to_double_double(other)
+        if other is NotImplemented:
+            return other
+        return other / self
+
+    def __pow__(self, other) -> "DoubleDouble":
+        if isinstance(other, (int, float)) and float(other).is_integer():
+            # Exponentiation by squaring
+            n = abs(int(other))
+            result, power = make(1.0), self
+            while(n > 0):
+                if n % 2 == 1:
+                    result = result * power
+                power = power * power
+                n //= 2
+            return 1 / result if other < 0 else result
+        if isinstance(other, float) and other == 0.5:
+            return self.sqrt()
+        other = to_double_double(other)
+        if other is NotImplemented:
+            return other
+        return (other * self.log()).exp()
+
+    def __rpow__(self, other) -> "DoubleDouble":
+        other = to_double_double(other)
+        if other is NotImplemented:
+            return other
+        return (self * other.log()).exp()
+
+    def compare(self, other):
+        other = to_double_double(other)
+        if other is NotImplemented:
+            return other
+        return (self.hi > other.hi or (self.hi == other.hi and self.lo > other.lo)) - (self.hi < other.hi or (self.hi == other.hi and self.lo < other.lo))
+
+    def __eq__(self, other):
+        other = to_double_double(other)
+        if other is NotImplemented:
+            return other
+        return self.hi == other.hi and self.lo == other.lo
+
+    def __lt__(self, other):
+        comparison = self.compare(other)
+        return comparison if comparison is NotImplemented else comparison < 0
+
+    def __le__(self, other):
+        comparison = self.compare(other)
+        return comparison if comparison is NotImplemented else comparison <= 0
+
+    def __gt__(self, other):
+        comparison = self.compare(other)
+        return comparison if comparison is NotImplemented else comparison > 0
+
+    def __ge__(self, other):
+        comparison = self.compare(other)
+        return comparison if comparison is NotImplemented else comparison >= 0
+
+    # Scale by 2^k, which is exact
+    def ldexp(self, k : int) -> "DoubleDouble":
+        return make(math.ldexp(self.hi, k), math.ldexp(self.lo, k))
+
+    def sqrt(self) -> "DoubleDouble":
+        if self.hi <= 0:
+            if self.hi == 0:
+                return make(0.0)
+            raise ValueError("math domain error")
+        y = make(math.sqrt(self.hi))
+        return y + (self - y * y).hi * (0.5 / y.hi)
+
+    # exp(x) = 2^k.exp(r) with r = x - k.ln(2), and exp(r) = (exp(r / 2^10))^(2^10), squaring exp(r / 2^10) - 1 to keep its digits
+    def exp(self) -> "DoubleDouble":
+        if self.hi > 709.782712893384:
+            raise OverflowError("math range error")
+        if self.hi < -745.2:
+            return make(0.0)
+        k = round(self.hi / LN2.hi)
+        r = (self - LN2 * k).ldexp(-10)
+        s, term, n = r, r, 1
+        while(abs(term.hi) > TINY * abs(s.hi)):
+            n += 1
+            term = term * r / n
+            s = s + term
+        for i in range(10):
+            s = 2 * s + s * s
+        return (s + 1).ldexp(k)
+
+    def log(self) -> "DoubleDouble":
+        if self.hi <= 0:
+            raise ValueError("math domain error")
+        y = make(math.log(self.hi))
+        return y + self * (-y).exp() - 1
+
+    # sin(r) and cos(r) for |r| <= pi/4, from their Taylor series
+    def sin_cos(self):
+        k = round(self.hi / HALF_PI.hi)
+        r = self - HALF_PI * k
+        r_2 = r * r
+        sin_r, term, n = r, r, 1
+        while(abs(term.hi) > TINY * abs(sin_r.hi)):
+            term = -term * r_2 / ((n + 1) * (n + 2))
+            sin_r = sin_r + term
+            n += 2
+        cos_r, term, n = make(1.0), make(1.0), 0
+        while(abs(term.hi) > TINY):
+            term = -term * r_2 / ((n + 1) * (n + 2))
+            cos_r = cos_r + term
+            n += 2
+        # Rotate by the quadrant k
+        return ((sin_r, cos_r), (cos_r, -sin_r), (-sin_r, -cos_r), (-cos_r, sin_r))[k % 4]
+
+    def sin(self) -> "DoubleDouble":
+        return self.sin_cos()[0]
+
+    def cos(self) -> "DoubleDouble":
+        return self.sin_cos()[1]
+
+    def tan(self) -> "DoubleDouble":
+        sin_x, cos_x = self.sin_cos()
+        return sin_x / cos_x
+
+    def sinh(self) -> "DoubleDouble":
+        if abs(self.hi) < 0.5:
+            # (exp(x) - exp(-x)) / 2 cancels for small x
+            x_2 = self * self
+            s, term, n = self, self, 1
+            while(abs(term.hi) > TINY * abs(s.hi)):
+                term = term * x_2 / ((n + 1) * (n + 2))
+                s = s + term
+                n += 2
+            return s
+        exp_x = self.exp()
+        return (exp_x - 1 / exp_x).ldexp(-1)
+
+    def cosh(self) -> "DoubleDouble":
+        exp_x = self.exp()
+        return (exp_x + 1 / exp_x).ldexp(-1)
+
+    def tanh(self) -> "DoubleDouble":
+        if abs(self.hi) > 40:
+            return make(math.copysign(1.0, self.hi))
+        return self.sinh() / self.cosh()
+
+    # Newton-Rhapson step on tan(y) = x: y - (tan(y) - x).cos(y)^2 = y + cos(y).(x.cos(y) - sin(y))
+    def atan(self) -> "DoubleDouble":
+        y = make(math.atan(self.hi))
+        sin_y, cos_y = y.sin_cos()
+        return y + cos_y * (self * cos_y - sin_y)
+
+# Relative size of the last term of a series worth adding, below the unit roundoff
+TINY = 2.0 ** -110
+LN2 = make(0.6931471805599453, 2.3190468138462996e-17)
+HALF_PI = make(1.5707963267948966, 6.123233995736766e-17)
+
+# Perform unit tests with the following examples
+# x = DoubleDouble(2).sqrt()
+# x -> DoubleDouble('1.414213562373095048801688724209706')
+# x * x - 2 -> DoubleDouble('0')
+# DoubleDouble(1).exp() -> DoubleDouble('2.718281828459045235360287471352640')
+# 4 * DoubleDouble(1).atan() -> DoubleDouble('3.141592653589793238462643383279506')
@@ -0,0 +1,366 @@
+# TODO: Compile equations given as text (e.g. read from a configuration) into fast callables, along with their derivatives
+# Note: compile_expression("x**3 - 2*x - 5") returns a CompiledExpression, which can be passed wherever a func is expected. Like a Polynomial,
+# it evaluates itself and its derivatives in a single pass through derivatives(x, order), hence derivative based solvers (NewtonRhapsonSolver,
+# ChebysevSolver, MultipointSolver) need neither der_func nor der_der_func. Solvers also accept the text itself as func
+
+# Method : Parse the text with Python's own parser (ast), admitting only numbers, the variable, the constants pi and e, the operators
+# +, -, *, /, ** (or ^) and the elementary functions sin, cos, tan, exp, log, sqrt, sinh, cosh, tanh and atan. Nothing is ever passed to eval
+# Method : Build a directed acyclic graph of the expression in which every distinct subexpression is a single node (hash-consing), so that common
+# subexpressions are evaluated once. Constants are folded and trivial operations (0 + u, 1.u, u^1, ...) are simplified away on the fly
+# Method : Differentiate symbolically into the same graph, e.g. (sin(u))' = cos(u).u', hence f, f' and f'' share their subexpressions (cos(u) and u'
+# are only evaluated once for all three)
+# Method : Generate the straight-line Python code of every node f, f', ..., f^(order) depends on, one assignment per node, and compile it once per order
+
+# Note: Every order has up to three kernels, one on top of math for numbers, which is the fastest per call, one on top of NumPy (imported on first use)
+# for arrays and complex numbers, which evaluates a whole batch (see Vectorization.py) in a single call, and one for objects implementing the
+# elementary functions as methods, e.g. intervals (see IntervalArithmetic.py)
+# Note: Compiled expressions are cached by their text (and variable), so that solving the same equation again costs no compilation at all,
+# and their kernels are only compiled when first needed
+# Note: Equations may be written as lhs = rhs, which is compiled as lhs - (rhs)
+# Note: Compiled expressions are pickled by their text and compiled again (once) in every worker process
+
+from typing import Callable, Dict, List, Sequence, Tuple
+from functools import lru_cache, partial
+from .AutomaticDifferentiation import apply
+import ast
+import io
+import math
+import re
+import tokenize
+
+functions = ("sin", "cos", "tan", "exp", "log", "sqrt", "sinh", "cosh", "tanh", "atan")
+constants = {"pi" : math.pi, "e" : math.e}
+# Names of the elementary functions in NumPy, where they differ from math
+numpy_names = {"atan" : "arctan"}
+
+binary_operators = {ast.Add : "add", ast.Sub : "sub", ast.Mult : "mul", ast.Div : "div", ast.Pow : "pow"}
+symbols = {"add" : "+", "sub" : "-", "mul" : "*", "div" : "/", "pow" : "**"}
+
+# A directed acyclic graph of nodes, every node being a tuple (operation, arguments...) whose arguments are the indices of other nodes
+# Note: Nodes are only ever appended after their arguments, hence the indices are a topological order of the graph
+class ExpressionGraph():
+    def __init__(self) -> None:
+        self.nodes = []
+        self.indices = dict()
+        self.derivatives = dict()
+
+    def add_node(self, node : Tuple) -> int:
+        index = self.indices.get(node)
+        if index == None:
+            index = len(self.nodes)
+            self.nodes.append(node)
+            self.indices[node] = index
+        return index
+
+    def constant(self, value) -> int:
+        return self.add_node(("const", value))
+
+    def variable(self) -> int:
+        return self.add_node(("var",))
+
+    def get_constant(self, index : int):
+        node = self.nodes[index]
+        return node[1] if node[0] == "const" else None
+
+    def apply(self, operation : str, *arguments : int) -> int:
+        values = [self.get_constant(argument) for argument in arguments]
+        if all(not value == None for value in values):
+            try:
+                value = fold(operation, *values)
+                if isinstance(value, (int, float)) and math.isfinite(value):
+                    return self.constant(value)
+            except (ArithmeticError, ValueError):
+                pass
+        simplified = self.simplify(operation, arguments, values)
+        if not simplified == None:
+            return simplified
+        # Commutative operations are keyed by their sorted arguments, so that u + v and v + u are the same node
+        if operation in ("add", "mul"):
+            arguments = tuple(sorted(arguments))
+        return self.add_node((operation,) + tuple(arguments))
+
+    def simplify(self, operation : str, arguments : Tuple, values : List) -> int:
+        if operation == "add":
+            if values[0] == 0:
+                return arguments[1]
+            if values[1] == 0:
+                return arguments[0]
+        elif operation == "sub":
+            if values[1] == 0:
+                return arguments[0]
+            if arguments[0] == arguments[1]:
+                return self.constant(0)
+            if values[0] == 0:
+                return self.apply("neg", arguments[1])
+        elif operation == "mul":
+            if values[0] == 0 or values[1] == 0:
+                return self.constant(0)
+            if values[0] == 1:
+                return arguments[1]
+            if values[1] == 1:
+                return arguments[0]
+        elif operation == "div":
+            if values[0] == 0:
+                return self.constant(0)
+            if values[1] == 1:
+                return arguments[0]
+        elif operation == "pow":
+            if values[1] == 0:
+                return self.constant(1)
+            if values[1] == 1:
+                return arguments[0]
+        elif operation == "neg":
+            node = self.nodes[arguments[0]]
+            if node[0] == "neg":
+                return node[1]
+        return None
+
+    # Index of the node of the derivative of the node at index with respect to the variable
+    def differentiate(self, index : int) -> int:
+        if index in self.derivatives:
+            return self.derivatives[index]
+        node = self.nodes[index]
+        operation = node[0]
+        if operation == "const":
+            derivative = self.constant(0)
+        elif operation == "var":
+            derivative = self.constant(1)
+        else:
+            u = node[1]
+            der_u = self.differentiate(u)
+            if operation == "neg":
+                derivative = self.apply("neg", der_u)
+            elif operation in ("add", "sub"):
+                derivative = self.apply(operation, der_u, self.differentiate(node[2]))
+            elif operation == "mul":
+                v = node[2]
+                derivative = self.apply("add", self.apply("mul", der_u, v), self.apply("mul", u, self.differentiate(v)))
+            elif operation == "div":
+                # (u/v)' = u'/v - (u/v).v'/v
+                v = node[2]
+                derivative = self.apply("sub", self.apply("div", der_u, v), self.apply("div", self.apply("mul", index, self.differentiate(v)), v))
+            elif operation == "pow":
+                v = node[2]
+                exponent = self.get_constant(v)
+                if not exponent == None:
+                    # (u^c)' = c.u^(c - 1).u'
+                    derivative = self.apply("mul", self.apply("mul", v, self.apply("pow", u, self.constant(exponent - 1))), der_u)
+                else:
+                    # (u^v)' = u^v.(v'.log(u) + v.u'/u)
+                    derivative = self.apply("mul", index, self.apply("add", self.apply("mul", self.differentiate(v), self.apply("log", u)),
+                                                                     self.apply("div", self.apply("mul", v, der_u), u)))
+            else:
+                derivative = self.apply("mul", self.differentiate_function(operation, u, index), der_u)
+        self.derivatives[index] = derivative
+        return derivative
+
+    # Index of the node of g'(u), g being the elementary function called name and index the node of g(u)
+    def differentiate_function(self, name : str, u : int, index : int) -> int:
+        one = self.constant(1)
+        if name == "sin":
+            return self.apply("cos", u)
+        elif name == "cos":
+            return self.apply("neg", self.apply("sin", u))
+        elif name == "tan":
+            return self.apply("add", one, self.apply("mul", index, index))
+        elif name == "exp":
+            return index
+        elif name == "log":
+            return self.apply("div", one, u)
+        elif name == "sqrt":
+            return self.apply("div", self.constant(0.5), index)
+        elif name == "sinh":
+            return self.apply("cosh", u)
+        elif name == "cosh":
+            return self.apply("sinh", u)
+        elif name == "tanh":
+            return self.apply("sub", one, self.apply("mul", index, index))
+        return self.apply("div", one, self.apply("add", one, self.apply("mul", u, u)))
+
+# Evaluate the operation on constants
+def fold(operation : str, *values):
+    if operation == "neg":
+        return -values[0]
+    elif operation == "add":
+        return values[0] + values[1]
+    elif operation == "sub":
+        return values[0] - values[1]
+    elif operation == "mul":
+        return values[0] * values[1]
+    elif operation == "div":
+        return values[0] / values[1]
+    elif operation == "pow":
+        return values[0] ** values[1]
+    return getattr(math, operation)(values[0])
+
+# Split an equation lhs = rhs into lhs - (rhs), leaving comparisons (==, <=, >=, !=) alone
+def get_expression_text(text : str) -> str:
+    sides = re.split(r"(?<![=<>!])=(?!=)", text)
+    assert len(sides) <= 2, "An equation should have at most one '='"
+    return text if len(sides) == 1 else "(" + sides[0] + ") - (" + sides[1] + ")"
+
+# Replace every ^ token of text by **, so that ^ binds tighter than *, / and unary - and groups right to left as a power (ast parses it as a xor)
+def get_power_text(text : str) -> str:
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(text).readline))
+    except tokenize.TokenError:
+        # Unbalanced brackets, left to ast.parse to report as a SyntaxError
+        return text
+    return tokenize.untokenize((token.type, "**" if token.type == tokenize.OP and token.string == "^" else token.string) for token in tokens)
+
+# Parse the text into graph and return the index of its root node
+def parse_expression(text : str, graph : ExpressionGraph, variable : str = "x") -> int:
+    tree = ast.parse(get_power_text(get_expression_text(text).strip()), mode = "eval")
+
+    def visit(node) -> int:
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return graph.constant(node.value)
+        elif isinstance(node, ast.Name):
+            if node.id == variable:
+                return graph.variable()
+            elif node.id in constants:
+                return graph.constant(constants[node.id])
+            raise ValueError("Unknown name '" + node.id + "', expressions may only use the variable '" + variable + "' and the constants " + ", ".join(constants))
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand = visit(node.operand)
+            return graph.apply("neg", operand) if isinstance(node.op, ast.USub) else operand
+        elif isinstance(node, ast.BinOp) and type(node.op) in binary_operators:
+            return graph.apply(binary_operators[type(node.op)], visit(node.left), visit(node.right))
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in functions and len(node.args) == 1 and not node.keywords:
+            return graph.apply(node.func.id, visit(node.args[0]))
+        raise ValueError("Unsupported syntax '" + ast.unparse(node) + "', expressions may only use numbers, +, -, *, /, ** and the functions " + ", ".join(functions))
+
+    return visit(tree.body)
+
+# Generate the source of a kernel returning the values of the nodes at outputs, see the note on code generation above
+def generate_source(graph : ExpressionGraph, outputs : Sequence[int], variable : str = "x") -> str:
+    needed = set()
+    stack = list(outputs)
+    while(len(stack) > 0):
+        index = stack.pop()
+        if index in needed:
+            continue
+        needed.add(index)
+        stack.extend(argument for argument in graph.nodes[index][1:] if graph.nodes[index][0] not in ("const", "var"))
+
+    names = dict()
+    lines = ["def kernel(" + variable + "):"]
+    for index in sorted(needed):
+        node = graph.nodes[index]
+        operation = node[0]
+        if operation == "const":
+            # Negative constants are parenthesised, since -2 ** x reads as -(2 ** x)
+            names[index] = repr(node[1]) if node[1] >= 0 else "(" + repr(node[1]) + ")"
+            continue
+        elif operation == "var":
+            names[index] = variable
+            continue
+        elif operation == "neg":
+            value = "(-" + names[node[1]] + ")"
+        elif operation in symbols:
+            value = names[node[1]] + " " + symbols[operation] + " " + names[node[2]]
+        else:
+            value = operation + "(" + names[node[1]] + ")"
+        names[index] = "t" + str(index)
+        lines.append("    " + names[index] + " = " + value)
+    # Constant outputs take the shape of the variable, for arrays
+    values = [names[index] if not graph.nodes[index][0] == "const" else names[index] + " + 0 * " + variable for index in outputs]
+    lines.append("    return (" + ", ".join(values) + ",)")
+    return "\n".join(lines)
+
+def compile_kernel(source : str, namespace : Dict) -> Callable:
+    namespace = dict(namespace)
+    exec(compile(source, "<expression>", "exec"), namespace)
+    return namespace["kernel"]
+
+math_namespace = {name : getattr(math, name) for name in functions}
+# Objects implementing the elementary functions as methods, e.g. Intervals (see IntervalArithmetic.py) and Jets (see AutomaticDifferentiation.py)
+object_namespace = {name : partial(apply, name) for name in functions}
+
+def get_numpy_namespace() -> Dict:
+    import numpy as np
+    return {name : getattr(np, numpy_names.get(name, name)) for name in functions}
+
+# Kind of kernel evaluating x, see the note on kernels above
+def get_kind(x) -> str:
+    if isinstance(x, (int, float)):
+        return "math"
+    elif hasattr(x, "sin"):
+        return "object"
+    return "numpy"
+
+class CompiledExpression():
+    def __init__(self, text : str, variable : str = "x") -> None:
+        self.text = text
+        self.variable = variable
+        self.graph = ExpressionGraph()
+        # Indices of the nodes of f, f', f'', ... as far as they have been derived
+        self.orders = [parse_expression(text, self.graph, variable)]
+        # Kernels by (order, kind)
+        self.kernels = dict()
+
+    def __call__(self, x):
+        return self.derivatives(x, 0)[0]
+
+    def __repr__(self) -> str:
+        return "CompiledExpression(" + repr(self.text) + ")"
+
+    # Pickled by the text, see the note on the process backend above
+    def __reduce__(self):
+        return (compile_expression, (self.text, self.variable))
+
+    def get_source(self, order : int = 1) -> str:
+        while(len(self.orders) <= order):
+            self.orders.append(self.graph.differentiate(self.orders[-1]))
+        return generate_source(self.graph, self.orders[:order + 1], self.variable)
+
+    def get_kernel(self, order : int, kind : str) -> Callable:
+        kernel = self.kernels.get((order, kind))
+        if kernel == None:
+            namespace = math_namespace if kind == "math" else object_namespace if kind == "object" else get_numpy_namespace()
+            kernel = compile_kernel(self.get_source(order), namespace)
+            self.kernels[(order, kind)] = kernel
+        return kernel
+
+    # Return (f(x), f'(x), ..., f^(order)(x)) in a single pass
+    def derivatives(self, x, order : int = 1) -> Tuple:
+        assert isinstance(order, int) and order >= 0, "Order of the derivatives should be an integer and should trivially be non-negative"
+        return self.get_kernel(order, get_kind(x))(x)
+
+    def derivative(self, order : int = 1) -> "ExpressionDerivative":
+        return ExpressionDerivative(self, order)
+
+class ExpressionDerivative():
+    def __init__(self, expression : CompiledExpression, order : int = 1) -> None:
+        self.expression = expression
+        self.order = order
+
+    def __call__(self, x):
+        return self.expression.derivatives(x, self.order)[self.order]
+
+@lru_cache(maxsize = 256)
+def get_compiled_expression(text : str, variable : str) -> CompiledExpression:
+    return CompiledExpression(text, variable)
+
+# Compile the text once, see the note on caching above
+def compile_expression(text : str, variable : str = "x") -> CompiledExpression:
+    return get_compiled_expression(text, variable)
+
+# Perform unit tests with the following examples
+# func = compile_expression("x * sin(x) = 1")
+# func.derivatives(1.0, 2) -> (-0.1585290151921035, 1.3817732906760363, 0.23913362692838303)
+# print(func.get_source(1)) ->
+# def kernel(x):
+#     t1 = sin(x)
+#     t2 = x * t1
+#     t4 = t2 - 1
+#     t5 = cos(x)
+#     t6 = x * t5
+#     t7 = t1 + t6
+#     return (t4, t7,)
+# NewtonRhapsonSolver("x * sin(x) = 1", intervals = (0, 2)) needs no der_func
+# compile_expression("x^2 - 2")(2.0) -> 2.0
+# compile_expression("2*x^2")(3.0) -> 18.0
+# compile_expression("x^2^3")(2.0) -> 256.0
+# compile_expression("-x^2")(3.0) -> -9.0
+# compile_expression("(-2)**x")(2.0) -> 4.0
@@ -0,0 +1,64 @@
+# TODO: Memoize the evaluations of a function so that expensive functions are never evaluated twice at the same point
+# Note: Iterative methods evaluate the same points over and over again, e.g. has_root evaluates both end-points of every half-interval and
+# SecantSolver.calculate_next_value evaluates f(x_0) and f(x_1) even though both were evaluated during the previous iterations
+
+# Note: The cache is keyed by the point x and bounded by maxsize, once full the least recently used evaluation is evicted (LRU)
+# Note: Set maxsize to None for an unbounded cache
+# Note: Functions of several arguments, e.g. Polynomial.derivatives(x, order), are keyed by the tuple of their arguments
+# Note: Unhashable arguments such as NumPy arrays (vectorized modes) bypass the cache and are evaluated directly
+# Note: Hits and misses are counted so that the effectiveness of the cache can be checked through cache_info()
+
+from typing import Callable, Tuple
+from collections import OrderedDict
+import threading
+
+class MemoizedFunction():
+    def __init__(self, func : Callable, maxsize : int = 1024) -> None:
+        assert maxsize == None or (isinstance(maxsize, int) and maxsize > 0), "Size of the cache should be an integer and should trivially be greater than zero"
+        self.func = func
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, *args):
+        key = args[0] if len(args) == 1 else args
+        try:
+            hash(key)
+        except TypeError:
+            return self.func(*args)
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return self.cache[key]
+
+        # Evaluate outside of the lock so that the thread backend can evaluate different points concurrently
+        value = self.func(*args)
+        with self.lock:
+            self.misses += 1
+            self.cache[key] = value
+            if not self.maxsize == None and len(self.cache) > self.maxsize:
+                self.cache.popitem(last = False)
+        return value
+
+    # Returns (hits, misses, maxsize, currsize) in the spirit of functools.lru_cache
+    def cache_info(self) -> Tuple:
+        return self.hits, self.misses, self.maxsize, len(self.cache)
+
+    def cache_clear(self) -> None:
+        with self.lock:
+            self.cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    # Locks cannot be pickled, which the process backend of NumericalMethodSolver relies on
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
@@ -2,7 +2,7 @@
 # Theorem: If a function f satisfies the condition f(a)f(b) < 0 where a < b, then the function f has (atleast) one or a odd number of real roots in the closed
 # interval [a, b]
 from typing import Tuple, Callable
-sign = lambda x: (x > 0) - (x < 0)
+sign = lambda x: int(x > 0) - int(x < 0)
 
 # Check whether either interval is a zero of the function and return None, root
 # Check whether the interval satisfies the Intermediate Value Theorem 
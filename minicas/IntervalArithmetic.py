@@ -0,0 +1,212 @@
+# TODO: Evaluate functions over whole intervals, returning an interval which is guaranteed to contain every value of the function over it
+# Note: An Interval [lower, upper] supports the arithmetic operators and the elementary functions of AutomaticDifferentiation.py (as methods, hence
+# sin(X) works on an Interval X just as on a Jet), so the same func evaluates over numbers and over intervals. Polynomials and compiled expressions
+# (see Expression.py) evaluate over intervals as well
+# Note: Every result is rounded outwards by one unit in the last place at either end (math.nextafter), so that rounding errors never make the
+# enclosure miss a value. Enclosures are not the exact range of the function: every occurrence of X is treated independently (dependency problem,
+# e.g. X - X = [lower - upper, upper - lower]), hence they overestimate the range, less and less as the interval shrinks
+
+# Rules of interval arithmetic:
+#   [a, b] + [c, d] = [a + c, b + d]                        [a, b] - [c, d] = [a - d, b - c]
+#   [a, b].[c, d] = [min(ac, ad, bc, bd), max(ac, ad, bc, bd)]
+#   [a, b] / [c, d] = [a, b].[1/d, 1/c] when 0 is not in [c, d], and (-inf, inf) otherwise
+#   g([a, b]) = [g(a), g(b)] for increasing g (exp, log, sqrt, sinh, tanh, atan, tan between its poles), and the extrema of g inside [a, b]
+#   are added for the others (sin, cos, cosh, even powers)
+
+# Note: Functions which are undefined over a part of the interval (log, sqrt) are enclosed over the part where they are defined, and raise ValueError
+# like math does when they are undefined over the whole interval
+# Note: Comparisons of intervals are ambiguous, hence functions which branch on x cannot be evaluated over intervals
+
+from typing import Tuple
+import math
+
+inf = math.inf
+
+# Round the end-points outwards
+def round_out(lower : float, upper : float) -> "Interval":
+    return Interval(math.nextafter(lower, -inf), math.nextafter(upper, inf))
+
+# Product of end-points with 0.inf = 0, since an infinite end-point only bounds the values from one side
+def multiply(a : float, b : float) -> float:
+    return 0.0 if a == 0 or b == 0 else a * b
+
+# Evaluate an increasing function at the end-points, values which overflow being infinite
+def increasing(function, lower : float, upper : float) -> "Interval":
+    try:
+        lower = function(lower)
+    except OverflowError:
+        lower = -inf if lower < 0 else inf
+    try:
+        upper = function(upper)
+    except OverflowError:
+        upper = inf if upper > 0 else -inf
+    return round_out(lower, upper)
+
+# Whether the interval contains phase + k.period for some integer k, erring on the side of yes (which only loosens the enclosure)
+def contains_phase(lower : float, upper : float, phase : float, period : float) -> bool:
+    k = math.ceil((lower - phase) / period - 1e-12)
+    return phase + k * period <= upper + 1e-12 * max(1.0, abs(upper))
+
+class Interval():
+    __slots__ = ("lower", "upper")
+    __hash__ = None
+
+    def __init__(self, lower : float, upper : float = None) -> None:
+        upper = lower if upper == None else upper
+        assert lower <= upper, "Lower limit should be lesser than or equal to Upper limit"
+        self.lower = float(lower)
+        self.upper = float(upper)
+
+    def __repr__(self) -> str:
+        return "Interval(" + repr(self.lower) + ", " + repr(self.upper) + ")"
+
+    def __iter__(self):
+        return iter((self.lower, self.upper))
+
+    def __contains__(self, value : float) -> bool:
+        return self.lower <= value <= self.upper
+
+    def width(self) -> float:
+        return self.upper - self.lower
+
+    def mid(self) -> float:
+        if math.isinf(self.lower) or math.isinf(self.upper):
+            return 0.0 if self.lower < 0 < self.upper else (self.upper if math.isinf(self.lower) else self.lower)
+        return self.lower + (self.upper - self.lower) / 2
+
+    # Split at the fraction ratio of the interval (at the mid-point by default, and always for unbounded intervals)
+    def split(self, ratio : float = 0.5) -> Tuple["Interval", "Interval"]:
+        mid = self.mid() if math.isinf(self.lower) or math.isinf(self.upper) else self.lower + ratio * (self.upper - self.lower)
+        return Interval(self.lower, mid), Interval(mid, self.upper)
+
+    # Whether other lies strictly inside the interval
+    def contains_interior(self, other : "Interval") -> bool:
+        return self.lower < other.lower and other.upper < self.upper
+
+    # Common part of both intervals, None when they are disjoint
+    def intersect(self, other : "Interval") -> "Interval":
+        lower, upper = max(self.lower, other.lower), min(self.upper, other.upper)
+        return Interval(lower, upper) if lower <= upper else None
+
+    def __add__(self, other) -> "Interval":
+        other = to_interval(other)
+        return round_out(self.lower + other.lower, self.upper + other.upper)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "Interval":
+        return Interval(-self.upper, -self.lower)
+
+    def __pos__(self) -> "Interval":
+        return self
+
+    def __sub__(self, other) -> "Interval":
+        other = to_interval(other)
+        return round_out(self.lower - other.upper, self.upper - other.lower)
+
+    def __rsub__(self, other) -> "Interval":
+        return to_interval(other) - self
+
+    def __mul__(self, other) -> "Interval":
+        other = to_interval(other)
+        products = [multiply(a, b) for a in (self.lower, self.upper) for b in (other.lower, other.upper)]
+        return round_out(min(products), max(products))
+
+    __rmul__ = __mul__
+
+    def reciprocal(self) -> "Interval":
+        if self.lower <= 0 <= self.upper:
+            return Interval(-inf, inf)
+        return round_out(1 / self.upper, 1 / self.lower)
+
+    def __truediv__(self, other) -> "Interval":
+        return self * to_interval(other).reciprocal()
+
+    def __rtruediv__(self, other) -> "Interval":
+        return to_interval(other) * self.reciprocal()
+
+    def __pow__(self, other) -> "Interval":
+        if isinstance(other, Interval) or not float(other).is_integer():
+            return (to_interval(other) * self.log()).exp()
+        n = int(other)
+        if n < 0:
+            return (self ** -n).reciprocal()
+        if n == 0:
+            return Interval(1.0)
+        # Odd powers are increasing, even ones are increasing in |x|
+        if n % 2 == 1:
+            return increasing(lambda x : x ** n, self.lower, self.upper)
+        enclosure = abs(self)
+        enclosure = increasing(lambda x : x ** n, enclosure.lower, enclosure.upper)
+        return Interval(max(enclosure.lower, 0.0), enclosure.upper)
+
+    def __rpow__(self, other) -> "Interval":
+        return (self * to_interval(other).log()).exp()
+
+    def __abs__(self) -> "Interval":
+        if self.lower <= 0 <= self.upper:
+            return Interval(0.0, max(-self.lower, self.upper))
+        return Interval(min(abs(self.lower), abs(self.upper)), max(abs(self.lower), abs(self.upper)))
+
+    # sin has its maxima at pi/2 + 2k.pi and its minima at -pi/2 + 2k.pi
+    def sin(self) -> "Interval":
+        return self.periodic(math.sin, math.pi / 2, -math.pi / 2)
+
+    # cos has its maxima at 2k.pi and its minima at pi + 2k.pi
+    def cos(self) -> "Interval":
+        return self.periodic(math.cos, 0.0, math.pi)
+
+    def periodic(self, function, maximum : float, minimum : float) -> "Interval":
+        if not self.width() < 2 * math.pi:
+            return Interval(-1.0, 1.0)
+        values = (function(self.lower), function(self.upper))
+        upper = 1.0 if contains_phase(self.lower, self.upper, maximum, 2 * math.pi) else max(values)
+        lower = -1.0 if contains_phase(self.lower, self.upper, minimum, 2 * math.pi) else min(values)
+        enclosure = round_out(lower, upper)
+        return Interval(max(enclosure.lower, -1.0), min(enclosure.upper, 1.0))
+
+    # tan is increasing between its poles at pi/2 + k.pi
+    def tan(self) -> "Interval":
+        if not self.width() < math.pi or contains_phase(self.lower, self.upper, math.pi / 2, math.pi):
+            return Interval(-inf, inf)
+        return increasing(math.tan, self.lower, self.upper)
+
+    def exp(self) -> "Interval":
+        enclosure = increasing(math.exp, self.lower, self.upper)
+        return Interval(max(enclosure.lower, 0.0), enclosure.upper)
+
+    def log(self) -> "Interval":
+        if self.upper <= 0:
+            raise ValueError("math domain error, log is undefined over " + repr(self))
+        return increasing(lambda x : -inf if x <= 0 else math.log(x), self.lower, self.upper)
+
+    def sqrt(self) -> "Interval":
+        if self.upper < 0:
+            raise ValueError("math domain error, sqrt is undefined over " + repr(self))
+        enclosure = increasing(math.sqrt, max(self.lower, 0.0), self.upper)
+        return Interval(max(enclosure.lower, 0.0), enclosure.upper)
+
+    def sinh(self) -> "Interval":
+        return increasing(math.sinh, self.lower, self.upper)
+
+    # cosh has its minimum at 0
+    def cosh(self) -> "Interval":
+        enclosure = abs(self)
+        enclosure = increasing(math.cosh, enclosure.lower, enclosure.upper)
+        return Interval(max(enclosure.lower, 1.0), enclosure.upper)
+
+    def tanh(self) -> "Interval":
+        enclosure = increasing(math.tanh, self.lower, self.upper)
+        return Interval(max(enclosure.lower, -1.0), min(enclosure.upper, 1.0))
+
+    def atan(self) -> "Interval":
+        return increasing(math.atan, self.lower, self.upper)
+
+def to_interval(value) -> Interval:
+    return value if isinstance(value, Interval) else Interval(value)
+
+# Perform unit tests with the following examples
+# X = Interval(1, 2)
+# X * X - 2 * X -> Interval(-3.0000000000000013, 2.0000000000000013)
+# (X - 1) ** 2 -> Interval(0.0, 1.0000000000000007)
+# Interval(0, 4).sin() -> Interval(-0.7568024953079283, 1.0)
@@ -0,0 +1,138 @@
+# TODO: Isolate all the real roots of a function f in intervals with interval arithmetic (see IntervalArithmetic.py), certifying the intervals which contain
+# exactly one root, instead of relying on sign changes at the end-points like Bisection does
+# Note: Sign changes miss every interval containing an even number of roots, and bisecting a flat region never ends, while an enclosure F(X) of f
+# over a box X which does not contain 0 proves that X is free of roots, whatever the number of sign changes
+
+# Method : Evaluate F(X) and F'(X), enclosures of f and f' over the box X, in a single pass (f' comes from f itself, see below)
+# Method : Discard X when 0 is not in F(X)
+# Method : Krawczyk's operator, with m the mid-point of X and y = 1/mid(F'(X)) an approximation of 1/f'(m)
+#           K(X) = m - y.f(m) + (1 - y.F'(X)).(X - m)
+# Every root of f in X is also in K(X), hence
+#           K(X) and X are disjoint                 -> X is free of roots and discarded
+#           K(X) lies in the interior of X          -> X contains exactly one root (certified), and K(X) is contracted further with K(K(X)), ...
+#                                                      until it is narrower than epsilon
+#           otherwise                               -> X is replaced with the intersection of X and K(X), and bisected unless it shrank by half
+# Note: Boxes are bisected slightly off their mid-point (see split_ratio), since a root on the boundary of a box is never in the interior of K(X),
+# and roots often sit on round numbers such as 0, the mid-point of a symmetric interval
+# Note: Certified boxes hold a unique simple root, guaranteed by the arithmetic itself (up to the accuracy of math, see IntervalArithmetic.py), which makes
+# them fit for verified results
+# Note: Boxes narrower than epsilon which could not be certified are returned as uncertain, e.g. multiple roots (f' vanishes at the root, hence
+# F'(X) always contains 0) or clusters of roots closer than epsilon. Rounding makes f appear to vanish over a whole neighbourhood of a multiple root,
+# which leaves a spray of uncertain boxes with gaps in between, hence uncertain boxes less than 100.epsilon apart are merged
+
+# Note: func needs to evaluate over Intervals, i.e. to be written with arithmetic operators and the elementary functions of AutomaticDifferentiation.py,
+# or to be a Polynomial or a compiled expression (see Expression.py). F'(X) is taken from der_func, or func.derivatives(X, 1) (Polynomial,
+# compiled expressions, automatic differentiation), in which case F(X) and F'(X) cost a single evaluation
+# Note: Functions undefined over a whole box (e.g. log of negative numbers) have no real roots there, and the box is discarded
+
+from typing import Callable, List, Sequence, Tuple
+from .IntervalArithmetic import Interval, to_interval
+from .AutomaticDifferentiation import DifferentiableFunction
+import math
+
+# Fraction of a box at which it is bisected, irrational so that the bisection points of intervals with round limits are not round themselves
+split_ratio = 0.5 - math.sqrt(2) / 32
+
+# Return a function evaluating (F(X), F'(X)) over a box X
+def get_interval_derivatives(func : Callable, der_func : Callable = None) -> Callable:
+    if not der_func == None:
+        return lambda X : (func(X), der_func(X))
+    if not hasattr(func, "derivatives"):
+        func = DifferentiableFunction(func)
+    return lambda X : func.derivatives(X, 1)
+
+# Krawczyk's operator K(X), see the note above
+def krawczyk(func : Callable, X : Interval, der_F : Interval) -> Interval:
+    m = X.mid()
+    y = 1 / der_F.mid()
+    return m - y * to_interval(func(Interval(m))) + (1 - y * der_F) * (X - m)
+
+# Contract a certified box K until it is narrower than epsilon, or until it stops shrinking (the limits of floating point)
+def contract(func : Callable, derivatives : Callable, K : Interval, epsilon : float) -> Interval:
+    while(K.width() >= epsilon):
+        der_F = to_interval(derivatives(K)[1])
+        if 0 in der_F:
+            break
+        K_new = K.intersect(krawczyk(func, K, der_F))
+        if K_new == None or not K_new.width() < K.width():
+            break
+        K = K_new
+    return K
+
+def isolate_roots(func : Callable, intervals : Sequence, epsilon : float = 1e-8, der_func : Callable = None, max_boxes : int = 100000) -> Tuple[List[Tuple], List[Tuple]]:
+    assert epsilon > 0, "Accuracy should trivially be greater than zero"
+    assert isinstance(max_boxes, int) and max_boxes > 0, "Number of boxes should be an integer and should trivially be greater than zero"
+    if isinstance(intervals, tuple):
+        intervals = [intervals]
+    derivatives = get_interval_derivatives(func, der_func)
+    certified, uncertain = [], []
+    stack = [Interval(interval[0], interval[1]) for interval in reversed(intervals)]
+    boxes = 0
+    while(len(stack) > 0):
+        X = stack.pop()
+        boxes += 1
+        assert boxes <= max_boxes, "Isolation needed more than " + str(max_boxes) + " boxes, func may be too flat for epsilon " + str(epsilon)
+        try:
+            F, der_F = (to_interval(value) for value in derivatives(X))
+        except ValueError:
+            # func is undefined over the whole box
+            continue
+        except TypeError as error:
+            raise TypeError("func needs to evaluate over Intervals, see the note on func in IntervalIsolation.py") from error
+        if not 0 in F:
+            continue
+
+        if not 0 in der_F and der_F.width() < float("inf"):
+            K = krawczyk(func, X, der_F)
+            if X.contains_interior(K):
+                K = contract(func, derivatives, K, epsilon)
+                certified.append((K.lower, K.upper))
+                continue
+            X_new = X.intersect(K)
+            if X_new == None:
+                continue
+            if X_new.width() <= X.width() / 2:
+                stack.append(X_new)
+                continue
+            X = X_new
+
+        if X.width() < epsilon:
+            uncertain.append((X.lower, X.upper))
+        else:
+            lower, upper = X.split(split_ratio)
+            stack.append(upper)
+            stack.append(lower)
+
+    return certified, merge_boxes(uncertain, certified, 100 * epsilon)
+
+# Merge uncertain boxes less than gap apart, dropping those which overlap a certified box
+def merge_boxes(boxes : List[Tuple], certified : List[Tuple], gap : float) -> List[Tuple]:
+    merged = []
+    for lower, upper in sorted(boxes):
+        if any(lower <= certified_upper and certified_lower <= upper for certified_lower, certified_upper in certified):
+            continue
+        if len(merged) > 0 and lower - merged[-1][1] < gap:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], upper))
+        else:
+            merged.append((lower, upper))
+    return merged
+
+# Hand the boxes over to the solvers in the format of scan_interval in Scanning.py: a bracket (lower-limit, upper-limit, f(lower-limit), f(upper-limit))
+# for every box over which f changes its sign (or vanishes at an end-point), and a candidate root (mid-point, f(mid-point)) for the others, i.e. the
+# uncertain boxes and the certified boxes so narrow that rounding hides the sign change
+def bracket_boxes(func : Callable, boxes : Sequence[Tuple]) -> Tuple[List[Tuple], List[Tuple]]:
+    brackets, candidates = [], []
+    for lower, upper in boxes:
+        f_lower, f_upper = func(lower), func(upper)
+        if f_lower == 0 or f_upper == 0 or (f_lower < 0) != (f_upper < 0):
+            brackets.append((lower, upper, f_lower, f_upper))
+        else:
+            mid = lower + (upper - lower) / 2
+            candidates.append((mid, func(mid)))
+    return brackets, candidates
+
+# Perform unit tests with the following examples
+# func = lambda x : (x - 1)**2 * (x - 3) * (x - 3.001)
+# isolate_roots(func, (-10, 10), 1e-10) -> ([(2.999999999999999, 3.000000000000001), (3.000999999999989, 3.001000000000011)], [(0.9999999999584998, 1.0000000000333418)])
+# isolate_roots(Polynomial([1, -2, 1]), (0, 2), 1e-10) -> ([], [(0.9999999807088628, 1.0000000202106043)])      (double root, uncertain)
+# isolate_roots(lambda x : x.sin() - 0.5 * x, (-10, 10)) -> 3 certified boxes, around -1.895494267033981, 0 and 1.895494267033981
@@ -0,0 +1,191 @@
+# TODO: Use the Muller's Method for finding out the real roots of a function f.
+# Note: Muller's Method has a superlinear order of convergence (1.8)
+# Note: Muller's Method is used in cases where f' or f'' doesnot exist.
+
+# Disclaimer:
+# Muller's Method is sensitive to initial approximations unlike Newton-Rhapson's Method or Secant Method, since while solving quadratic equations
+# the value of the discriminant might end up negative, i.e. the parabola does not meet the X-axis at all, or even worse the value of the determinant
+# might end up to be 0 leading to a zero-division error. To account for the latter, restart iterations with the acquired roots as the initial
+# approximations to the roots, at most max_restarts times per root.
+# With a negative discriminant, the real mode drops the quadratic term and takes the Newton-Rhapson step x_2 - a0/a1 on the parabola instead
+
+# Note: Muller's Method is naturally a complex root finder, since the parabola through three real points may only meet the X-axis at complex points
+# Set complex_roots to True to iterate with complex arithmetic (cmath), which finds complex roots directly. Roots whose imaginary part is below
+# epsilon are returned as real numbers
+# Note: All the roots of a Polynomial, real and complex, are found in sequence through self.set_polynomial_roots(*args, **kwargs): every root found
+# is polished on the Polynomial itself, which is then deflated (divided by (x - root)) before looking for the next root
+
+# Muller's Method can be proved in the following way:
+#   When the function meets the X-axis, the function can be approximated with a quadratic curve(parabola) in an infinitesimally small neighborhood (a2.x^2 + a1.x + a0)
+#   A quadratic curve can be written as f(x) = a2.x^2 + a1.x + a0
+#   Given, x_0, x_1 and x_2 are the initial approximations to the root,
+#   For the purpose of the proof, f(x) can also be written as a2.(x - x_2)^2 + a1.(x - x_2) + a0, where x_2 is the third initial approximation to the root
+#   f(x) = a2.(x - x_2)^2 + a1.(x - x_2) + a0 = 0           -(0)
+#   f(x_2) = a0                                             -(1)
+#   Using (1),
+#   f(x_1) - f(x_2) = a2.(x_1 - x_2)^2 + a1.(x_1 - x_2)     -(2)
+#   f(x_0) - f(x_2) = a2.(x_0 - x_2)^2 + a1.(x_0 - x_2)     -(3)
+#   Solving the system of linear equations (2) and (3) using Cramer's rule,
+#   a2 = ((f(x_1) - f(x_2)).(x_0 - x_2) - (f(x_0) - f(x_2)).(x_1 - x_2)) / D
+#   a1 = ((f(x_0) - f(x_2)).(x_1 - x_2)^2 - (f(x_1) - f(x_2)).(x_0 - x_2)^2) / D
+#   where, D = det|(x_1 - x_2)^2    (x_1 - x_2)| = (x_2 - x_0)(x_2 - x_1)(x_1 - x_0)
+#                 |(x_0 - x_2)^2    (x_0 - x_2)|
+#   Using Shreedharacharya's Method for (0) and placing the values of the coefficients,
+#   x_new = x_2 + (-a1 +- (a1^2 - 4.a2.a0)^(1/2))/(2.a2)
+#   Discard the solution farthest away from x_2
+
+# Note: Stop iteration in one of three situations:
+#           |f(x)| < epsilon
+#           |x(k + 1) - x(k)| < epsilon
+#           the budget of the root runs out, or the iterations are cancelled or stagnate (see Budget.py)
+
+# Note: Set manual approximations while calculating roots of f using init_approx
+# Note: Instead of using manual approximations, set approximations of f using Bisection Method through self.set_approximations(*args, **kwargs)
+# Note: An approximation can also be a triple (x_0, x_1, x_2) of initial approximations, which is how warm starts hand over the bracket around the
+# previous root along with the previous root itself. Otherwise x_1 and x_2 are random perturbations of x_0, as they are when iterations are restarted
+
+from typing import Callable, Tuple, List, Sequence, Dict
+from .NumericalMethod import NumericalMethodSolver
+from .IntermediateValueTheorem import sign
+from .SolverStatistics import RootResult, CANCELLED
+from .Polynomials import Polynomial
+from .AutomaticDifferentiation import sqrt
+import cmath
+import copy
+import random
+
+class MullerSolver(NumericalMethodSolver):
+    warm_start_points = 3
+
+    def __init__(self, func : Callable, intervals : Sequence = None, epsilon : float = 1e-5, complex_roots : bool = False, max_restarts : int = 10) -> None:
+        super(MullerSolver, self).__init__(func, intervals, epsilon)
+        assert isinstance(max_restarts, int) and max_restarts >= 0, "Number of restarts should be an integer and should trivially be non-negative"
+        self.complex_roots = complex_roots
+        self.max_restarts = max_restarts
+
+    @staticmethod
+    def get_det(arr : List[List[float]]) -> float:
+        return arr[0][0] * arr[1][1] - arr[0][1] * arr[1][0]
+
+    @staticmethod
+    def calculate_roots_sd(a : float, b : float, c : float, complex_roots : bool = False) -> float:
+        # Since, we discard the root farthest away from the current iteration value, we need not solve the entire equation
+        # Rather, we choose the denominator of the rationalized Shreedharacharya's equation depending on the sign of b
+        # x* = x - (1/2).(b -+ (b*b - 4*a*c)^(1/2))/a
+        # Upon rationalizing the equation, x* = x - 2*c/(b +- (b*b - 4*a*c)^(1/2))
+        # With complex numbers, the sign of b generalizes to the denominator of the larger magnitude
+
+        if complex_roots:
+            d = cmath.sqrt(b*b - 4*a*c)
+            denominator = b + d if abs(b + d) >= abs(b - d) else b - d
+        else:
+            discriminant = b*b - 4*a*c
+            # Dropping the quadratic term (d = |b|) reduces the step to -c/b. sqrt keeps the type of the numeric backend
+            d = sqrt(discriminant) if discriminant >= 0 else abs(b)
+            denominator = b + d if sign(b) >= 0 else b - d
+
+        # A vanishing denominator leaves the iteration where it is, which the next determinant turns into a restart
+        return 0 if denominator == 0 else - 2 * c / denominator
+
+    # Roots whose imaginary part is negligible are reported as real numbers
+    def get_root(self, x : complex) -> float:
+        if isinstance(x, complex) and abs(x.imag) < self.epsilon:
+            return x.real
+        return x
+    
+    def find_root(self, x_0 : float) -> RootResult:
+        iterations = 0
+        restarts = 0
+        # The budget spans all the restarts
+        monitor = self.get_monitor()
+        stop = None
+        seeds = x_0 if isinstance(x_0, tuple) else None
+        while(True):
+            if seeds == None:
+                x_1 = x_0 + 1e-01 * random.random()
+                x_2 = x_0 + 1e-01 * random.random()
+            else:
+                x_0, x_1, x_2 = seeds
+                seeds = None
+
+            a_0 = self.func(x_2)
+            f_x_0 = self.func(x_0)
+            f_x_1 = self.func(x_1)
+            
+            det_is_zero = False
+            while(abs(a_0) >= self.epsilon and stop == None):
+                det = (x_2 - x_0) * (x_2 - x_1) * (x_1 - x_0)
+                
+                # Create a matrix for ease of determinant calculation
+                iter_matrix = [[f_x_0 - a_0, f_x_1 - a_0], [(x_0 - x_2)**2, (x_1 - x_2)**2]]
+                if det == 0:
+                    det_is_zero = True
+                    break
+                a_1 = self.get_det(iter_matrix) / det
+
+                iter_matrix = [[f_x_1 - a_0, f_x_0 - a_0], [x_1 - x_2, x_0 - x_2]]
+                a_2 = self.get_det(iter_matrix) / det
+
+                x_new = x_2 + self.calculate_roots_sd(a_2, a_1, a_0, self.complex_roots)
+                f_x_new = self.func(x_new)
+
+                # Swap variables (along with their function values) for the next iteration
+                f_x_0 = f_x_1
+                f_x_1 = a_0
+                a_0 = f_x_new
+                x_0 = x_1
+                x_1 = x_2
+                x_2 = x_new
+                iterations += 1
+                if not self.callback == None:
+                    self.callback(iterations, x_2, a_0)
+                stop = monitor.update(iterations, a_0)
+                if self.is_small_step(x_2, x_1):
+                    break
+
+            if not det_is_zero or restarts == self.max_restarts:
+                return self.get_result(self.get_root(x_2), self.get_root(a_0), iterations, stop = stop)
+            # Restart iterations with the acquired root as the initial approximation to the root
+            restarts += 1
+            x_0 = x_2
+
+    # Find all the roots of the Polynomial func starting from x_0, see the note on deflation above
+    # Note: Deflated roots accumulate the rounding errors of all the previous deflations, hence every root is polished by iterating once more on func
+    # starting from the deflated root, and the polished root is only kept when it is at least as close to a root of func
+    def find_polynomial_roots(self, x_0 : float = 0.0) -> List[RootResult]:
+        assert isinstance(self.func, Polynomial), "Deflation needs the function to be a Polynomial"
+        solver = copy.copy(self)
+        solver.complex_roots = True
+        solver.callback = None
+        polynomial = self.func
+        results = []
+        while(polynomial.degree > 0):
+            solver.func = polynomial
+            root = solver.find_root(x_0).root
+            h = 1e-03 * max(1.0, abs(root))
+            solver.func = self.func
+            result = solver.find_root((root - h, root + h, root))
+            if not abs(result.residual) <= abs(self.func(root)):
+                result = self.get_result(self.get_root(root), self.get_root(self.func(root)), result.iterations)
+            results.append(result)
+            polynomial, _ = polynomial.deflate(root)
+            if not self.callback == None:
+                self.callback(len(results), result.root, result.residual)
+            # Keep the roots found so far
+            if result.reason == CANCELLED:
+                break
+
+        return results
+
+    def set_polynomial_roots(self, x_0 : float = 0.0) -> None:
+        results = self.find_polynomial_roots(x_0)
+        self.set_results([x_0] * len(results), [results])
+
+# Perform unit tests with the following examples
+# func = Polynomial([1, 0, 0, 0, 0, -1])
+# solver = MullerSolver(func, epsilon = 1e-12)
+# solver.set_polynomial_roots()
+# solver.get_roots() -> [1.0, (-0.809016994374947-0.587785252292479j), (0.309016994374949+0.951056516295157j), ...]
+# solver = MullerSolver(lambda x : x**2 + 1, epsilon = 1e-12, complex_roots = True)
+# solver.set_roots([0.5])
+# solver.get_roots() -> [1j] (up to rounding)
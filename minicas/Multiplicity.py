@@ -0,0 +1,81 @@
+# TODO: Estimate the multiplicity of a root on the fly, from the iterations of a derivative based method
+# Note: Close to a root x* of multiplicity m, f(x) = (x - x*)^m.g(x) with g(x*) != 0, hence the Newton-Rhapson correction f(x)/f'(x) = (x - x*)/m + O((x - x*)^2)
+# Newton-Rhapson's Method then only converges linearly, the error shrinking by a factor of (m - 1)/m every iteration, and the higher order methods
+# divide by a vanishing f'(x) long before |f(x)| < epsilon
+
+# Method : m = (x(k) - x(k - 1)) / (delta(k) - delta(k - 1)), where delta(k) = f(x(k))/f'(x(k))
+# Note: The estimate only depends on two successive iterations and their corrections, not on the method which generated them
+# Note: An estimate is only trusted once two successive estimates round to the same m, so that simple roots keep their unmodified iterations
+# Estimates far from the root are rough, hence the multiplicity keeps being estimated and corrected as the iterations close in on the root
+# The trusted multiplicity is released for good as soon as |f(x)| grows, e.g. when a cluster of nearby simple roots was mistaken for a multiple root,
+# or when the iterations started far out where every polynomial of degree n looks like x^n, a root of multiplicity n at 0 as far as the estimate is
+# concerned. Estimating again after a release could send the iterations around the same cycle over and over
+
+# Note: Knowing m, the modified Newton-Rhapson step x - m.f(x)/f'(x) (Newton-Rhapson's Method on f^(1/m), which has a simple root at x*) converges
+# quadratically again, see NewtonRhapson.py, Chebysev.py and Multipoint.py for how every method uses it
+
+import math
+
+class MultiplicityEstimator():
+    def __init__(self) -> None:
+        self.multiplicity = 1
+        self.estimate = None
+        self.released = False
+        self.x = None
+        self.f_x = None
+        self.delta = None
+
+    # Record the iteration x, f(x) and the correction delta = f(x)/f'(x), and return the multiplicity to iterate with
+    def update(self, x : float, f_x : float, delta : float) -> int:
+        if self.multiplicity > 1 and abs(f_x) > abs(self.f_x):
+            self.multiplicity = 1
+            self.released = True
+        elif not self.released and not self.x == None and not delta == self.delta:
+            estimate = (x - self.x) / (delta - self.delta)
+            estimate = round(estimate) if math.isfinite(estimate) and estimate >= 0.5 else None
+            if not estimate == None and estimate == self.estimate:
+                self.multiplicity = estimate
+            self.estimate = estimate
+        self.x, self.f_x, self.delta = x, f_x, delta
+        return self.multiplicity
+
+# Same estimates as MultiplicityEstimator, for many lanes at once (see the vectorized NewtonRhapsonSolver), missing estimates being NaN
+class MultiplicityEstimatorLanes():
+    def __init__(self, lanes : int) -> None:
+        import numpy as np
+        self.multiplicity = np.ones(lanes, dtype = int)
+        self.estimate = np.full(lanes, np.nan)
+        self.released = np.zeros(lanes, dtype = bool)
+        self.started = np.zeros(lanes, dtype = bool)
+        self.x = np.zeros(lanes)
+        self.f_x = np.zeros(lanes)
+        self.delta = np.zeros(lanes)
+
+    # Record the iterations x, f(x) and the corrections delta of the lanes (indices), and return the multiplicities to iterate them with
+    def update(self, lanes, x, f_x, delta):
+        import numpy as np
+        release = (self.multiplicity[lanes] > 1) & (np.abs(f_x) > np.abs(self.f_x[lanes]))
+        estimating = ~release & ~self.released[lanes] & self.started[lanes] & (delta != self.delta[lanes])
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            estimate = (x - self.x[lanes]) / (delta - self.delta[lanes])
+        estimate = np.where(np.isfinite(estimate) & (estimate >= 0.5), np.round(estimate), np.nan)
+        trusted = estimating & (estimate == self.estimate[lanes])
+        self.multiplicity[lanes[trusted]] = estimate[trusted]
+        self.multiplicity[lanes[release]] = 1
+        self.released[lanes[release]] = True
+        self.estimate[lanes[estimating]] = estimate[estimating]
+        self.x[lanes], self.f_x[lanes], self.delta[lanes] = x, f_x, delta
+        self.started[lanes] = True
+        return self.multiplicity[lanes]
+
+# Perform unit tests with the following examples
+# estimator = MultiplicityEstimator()
+# func = lambda x : (x - 1)**3
+# der_func = lambda x : 3*(x - 1)**2
+# x = 2
+# for i in range(3):
+#     x = x - estimator.update(x, func(x), func(x) / der_func(x)) * func(x) / der_func(x)
+# estimator.multiplicity -> 3
+# solver = NewtonRhapsonSolver(Polynomial([1, -3, 3, -1]))
+# solver.set_roots([0.0, 2.5], vectorized = True)     (same roots and iterations as solver.set_roots([0.0, 2.5]))
+# solver.store.get_column("multiplicity") -> array('h', [3, 3])
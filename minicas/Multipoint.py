@@ -0,0 +1,99 @@
+# TODO: Use the Multipoint Iteration Method for finding out the real roots of a function f.
+# Note: The Multipoint Iteration Method has a third order of convergence (3)
+# Note: |The Multipoint Iteration Method is used in cases where f'' does not exist but we would still like to have a third order of convergence
+
+# The Multipoint Iteration Method can be proved in the following way:
+# Using Taylor's expansion, f(x) = f(x_0) + (x - x_0).f'(x_0) + (x - x_0)^2.f''(x_0) + O(x), where O(x) stands for higher order functions which can be ignored for the purpose of this proof
+# x - x_0 = -f(x_0) / (f'(x_0) + (1/2).(x - x_0).f''(x_0))                                    -(0)
+# Expanding f'(x) about x_0 using Taylor's series about x_0,
+# f'(x) = f'(x_0) + (x - x_0).f''(x_0) + Z(x), where Z(x) stands for higher order polynomials which can be ignored for the purpose of this proof
+# f'(x_0 + (1/2).(x* - x_0)) = f'(x_0) + (1/2).(x* - x_0).f''(x_0) which is the denominator of (0)
+# Therefore, x_new = x_0 - f(x_0)/f'(x_0 + (1/2).(x_new - x_0)), where x_new - x_0 can be approximated using the Newton-Rhapson Method
+
+# Note: Stop iteration in one of three situations:
+#           |f(x)| < epsilon
+#           |x(k + 1) - x(k)| < epsilon
+#           the budget of the root runs out, or the iterations are cancelled or stagnate (see Budget.py)
+
+# Note: At a root of multiplicity m > 1 (see Multiplicity.py), both variants fall back to the modified Newton-Rhapson step x - m.f(x)/f'(x), which
+# converges quadratically, since their own third order only holds at simple roots
+
+# Note: der_func may be omitted, it is then derived from func (Polynomial or automatic differentiation) and f(x) and f'(x) are evaluated in a single pass
+
+# Note: Set manual approximations while calculating roots of f using init_approx
+# Note: Instead of using manual approximations, set approximations of f using Bisection Method through self.set_approximations(*args, **kwargs)
+
+from typing import Callable, Tuple, List, Sequence, Dict
+from .NumericalMethod import NumericalMethodSolver
+from .SolverStatistics import RootResult
+from .Multiplicity import MultiplicityEstimator
+import random
+
+class MultipointSolver(NumericalMethodSolver):
+    def __init__(self, func : Callable, der_func : Callable = None, intervals : Sequence = None, epsilon : float = 1e-5) -> None:
+        super(MultipointSolver, self).__init__(func, intervals, epsilon)
+        self.der_func, = self.resolve_derivatives(der_func)
+   
+    def find_root_1(self, x_0 : float) -> RootResult:
+        f_x_k, der_f_x_k = self.evaluate(x_0, 1)
+        estimator = MultiplicityEstimator() if self.detect_multiplicity else None
+        multiplicity = 1
+        monitor = self.get_monitor()
+        stop = None
+        iterations = 0
+        step_is_small = False
+        while(abs(f_x_k) >= self.epsilon and not der_f_x_k == 0 and not step_is_small and stop == None):
+            if not estimator == None:
+                multiplicity = estimator.update(x_0, f_x_k, f_x_k / der_f_x_k)
+            if multiplicity > 1:
+                x_new = x_0 - multiplicity * f_x_k / der_f_x_k
+            else:
+                x_new = x_0 - f_x_k / self.der_func(x_0 - 0.5 * (f_x_k / der_f_x_k))
+            step_is_small = self.is_small_step(x_new, x_0)
+            x_0 = x_new
+            f_x_k, der_f_x_k = self.evaluate(x_new, 1)
+            iterations += 1
+            if not self.callback == None:
+                self.callback(iterations, x_0, f_x_k)
+            stop = monitor.update(iterations, f_x_k)
+
+        return self.get_result(x_0, f_x_k, iterations, None if estimator == None else multiplicity, stop)
+
+    def find_root_2(self, x_0 : float) -> RootResult:
+        f_x_k, der_f_x_k = self.evaluate(x_0, 1)
+        estimator = MultiplicityEstimator() if self.detect_multiplicity else None
+        multiplicity = 1
+        monitor = self.get_monitor()
+        stop = None
+        iterations = 0
+        step_is_small = False
+        while(abs(f_x_k) >= self.epsilon and not der_f_x_k == 0 and not step_is_small and stop == None):
+            if not estimator == None:
+                multiplicity = estimator.update(x_0, f_x_k, f_x_k / der_f_x_k)
+            x_inter = f_x_k / der_f_x_k
+            if multiplicity > 1:
+                x_new = x_0 - multiplicity * x_inter
+            else:
+                x_new = x_0 - x_inter - self.func(x_0 - x_inter) / der_f_x_k
+            
+            step_is_small = self.is_small_step(x_new, x_0)
+            x_0 = x_new
+            f_x_k, der_f_x_k = self.evaluate(x_new, 1)
+            iterations += 1
+            if not self.callback == None:
+                self.callback(iterations, x_0, f_x_k)
+            stop = monitor.update(iterations, f_x_k)
+
+        return self.get_result(x_0, f_x_k, iterations, None if estimator == None else multiplicity, stop)
+
+    def set_roots_1(self, init_approx : float = None) -> None:
+        self.map_roots(self.find_root_1, self.get_initial_approximations(init_approx))
+                
+    def set_roots_2(self, init_approx : float = None) -> None:
+        self.map_roots(self.find_root_2, self.get_initial_approximations(init_approx))
+
+    def set_roots(self, init_approx : float = None, use_method : int = 0) -> None:
+        if use_method:
+            self.set_roots_2(init_approx)
+        else:
+            self.set_roots_1(init_approx)
@@ -0,0 +1,144 @@
+# TODO: Use the Newton-Rhapson Method for finding out the real roots of a function f.
+# Note: Newton-Rhapson Method has a second order of convergence (2)
+
+# Method : b = a - f(a) / f'(a), where a is the initial approximation to the root
+# Method : Replace a with b for the next iteration
+# Note: Newton-Rhapson Method uses one initial approximation to the root
+
+# Newton-Rhapson Method can be proved in one of the following two ways:
+#   When the curve meets the X-axis, the curve can be approximated with a straight line (a1.x + a0) in an infinitesimally small neighborhood
+#   f(x) = a1.x + a0 ==> f'(x) = a1 ==> a0 = f(x) - f'(x).x ==> x = -a0 /a1 ==> x_new = x - f(x) / f'(x)
+
+#   If x* is the exact real root of a function f, an approximation x can be written as x = x* - h, without loss of generality
+#   Using Taylor's expansion Theorem of f at x_0: f(x) = f(x_0) + (x - x_0).f'(x_0) + O(x), where O(x) stands for higher order functions which can be ignored for the purpose of the proof
+#   f(x*) = f(x_0) + (x* - x_0)f'(x_0) = 0, since f(x*) = 0 ==> x* - x_0 = -f(x_0) / f'(x_0) ==> x* = x_0 - f(x_0) / f'(x_0)
+
+# Note: In an iterative numerical method, we find the next approximation using a function g(x), where you could think of g as a generator function which generates the next(hopefully, more accurate) approximation of a root to a function f
+# Note: In Newton-Rhapson Method, g(x) = x - f(x) / f'(x)
+# Note: The two very important properties of the generator function are namely:
+#           g(x*) = x*
+#           g'(x) < tan(pi/4), In this case it's 0
+
+# Note: Stop iteration in one of three situations:
+#           |f(x)| < epsilon
+#           |x(k + 1) - x(k)| < epsilon
+#           the budget of the root runs out, or the iterations are cancelled or stagnate (see Budget.py)
+
+# Note: der_func may be omitted, it is then derived from func (Polynomial or automatic differentiation) and f(x) and f'(x) are evaluated in a single pass
+
+# Note: Set manual approximations while calculating roots of f using init_approx
+# Note: Instead of using manual approximations, set approximations of f using Bisection Method through self.set_approximations(*args, **kwargs)
+
+from typing import Callable, Tuple, List, Sequence, Dict
+from .NumericalMethod import NumericalMethodSolver
+from .SolverStatistics import RootResult
+from .ResultStorage import ResultStore, reasons
+from .Multiplicity import MultiplicityEstimator, MultiplicityEstimatorLanes
+from .Vectorization import evaluate_batch, evaluate_batch_fused
+
+class NewtonRhapsonSolver(NumericalMethodSolver):
+    def __init__(self, func : Callable, der_func : Callable = None, intervals : Sequence = None, epsilon : float = 1e-5) -> None:
+        super(NewtonRhapsonSolver, self).__init__(func, intervals, epsilon)
+        self.der_func, = self.resolve_derivatives(der_func)
+
+    @staticmethod
+    def calculate_next_value(func : Callable, der_func : Callable, init_x : float, cache_value : bool = False) -> float:
+        f_init_x = func(init_x)
+        der_f_init_x = der_func(init_x)
+
+        _ = f_init_x / der_f_init_x
+        x_new = init_x - _
+        
+        if cache_value:
+            # Provision for Chebysev's Method
+            return x_new, f_init_x, der_f_init_x, _
+        else:
+            return x_new
+    
+    # (f(x), f'(x)) over the lanes x, in a single pass like self.evaluate(x, 1) when func knows its own derivatives
+    def evaluate_lanes(self, x) -> Tuple:
+        if not self.fused_func == None:
+            return evaluate_batch_fused(self.fused_func, x, 1)
+        return evaluate_batch(self.func, x), evaluate_batch(self.der_func, x)
+
+    # Lockstep Newton-Rhapson Method: all the approximations advance together as a NumPy array
+    # Every iteration evaluates func and der_func exactly once on the lanes that have not converged yet, converged lanes are masked out
+    # Note: Every lane stops on the same conditions as self.find_root(x_0) (residual, step, vanishing derivative) and estimates the multiplicity of its
+    # root the same way (see MultiplicityEstimatorLanes in Multiplicity.py), hence both modes give the same roots and numbers of iterations
+    # Note: The lanes which are still active share the budget (see Budget.py), which stops all of them at once. Stagnation is not detected per lane
+    # Note: Lanes run in the dtype of the numeric backend, e.g. float32 for screening (see NumericBackends.py)
+    # Returns the roots along with their residuals, numbers of iterations, reasons the budget stopped them (None for the others) and multiplicities
+    def calculate_roots_vectorized(self, approximations : Sequence[float]) -> Tuple[List, List, List, List, List]:
+        import numpy as np
+        x = np.array(approximations, dtype = self.get_dtype())
+        f_x, der_f_x = self.evaluate_lanes(x)
+        iterations = np.zeros(len(x), dtype = int)
+        stops = [None] * len(x)
+        estimator = MultiplicityEstimatorLanes(len(x)) if self.detect_multiplicity else None
+        monitor = self.get_monitor()
+        sweeps = 0
+        active = np.flatnonzero((np.abs(f_x) >= self.epsilon) & (der_f_x != 0))
+        while(len(active) > 0):
+            x_old = x[active]
+            with np.errstate(divide = "ignore", invalid = "ignore"):
+                delta = f_x[active] / der_f_x[active]
+            # Cast to the dtype of the lanes, since integer arrays would promote float32 lanes to float64
+            multiplicity = 1 if estimator == None else estimator.update(active, x_old, f_x[active], delta).astype(x.dtype)
+            x_active = x_old - multiplicity * delta
+            f_x_active, der_f_x_active = self.evaluate_lanes(x_active)
+            x[active], f_x[active], der_f_x[active] = x_active, f_x_active, der_f_x_active
+            iterations[active] += 1
+            active = active[(np.abs(f_x_active) >= self.epsilon) & (der_f_x_active != 0) & ~self.is_small_step(x_active, x_old)]
+            sweeps += 1
+            stop = monitor.check(sweeps)
+            if not stop == None:
+                for i in active.tolist():
+                    stops[i] = stop
+                break
+
+        multiplicities = [0] * len(x) if estimator == None else estimator.multiplicity.tolist()
+        return x.tolist(), f_x.tolist(), iterations.tolist(), stops, multiplicities
+
+    # Note: f(x) and f'(x) are evaluated together once per iteration, so that f(x) is not evaluated a second time by self.calculate_next_value(*args, **kwargs)
+    # Note: Once the root turns out to have a multiplicity m > 1, the modified step x - m.f(x)/f'(x) restores the quadratic convergence
+    def find_root(self, x_0 : float) -> RootResult:
+        f_x_k, der_f_x_k = self.evaluate(x_0, 1)
+        estimator = MultiplicityEstimator() if self.detect_multiplicity else None
+        multiplicity = 1
+        monitor = self.get_monitor()
+        stop = None
+        iterations = 0
+        step_is_small = False
+        while(abs(f_x_k) >= self.epsilon and not der_f_x_k == 0 and not step_is_small and stop == None):
+            if not estimator == None:
+                multiplicity = estimator.update(x_0, f_x_k, f_x_k / der_f_x_k)
+            x_new = x_0 - multiplicity * f_x_k / der_f_x_k
+            step_is_small = self.is_small_step(x_new, x_0)
+            x_0 = x_new
+            f_x_k, der_f_x_k = self.evaluate(x_new, 1)
+            iterations += 1
+            if not self.callback == None:
+                self.callback(iterations, x_0, f_x_k)
+            stop = monitor.update(iterations, f_x_k)
+
+        return self.get_result(x_0, f_x_k, iterations, None if estimator == None else multiplicity, stop)
+
+    # Note: Set vectorized to True to solve for all the approximations in lockstep, which pays off for array-aware functions and many approximations
+    def set_roots(self, init_approx : float = None, vectorized : bool = False) -> None:
+        if vectorized:
+            approximations = self.get_initial_approximations(init_approx)
+            roots, residuals, iterations, stops, multiplicities = self.calculate_roots_vectorized(approximations)
+            self.store = ResultStore(complex_roots = any(isinstance(root, complex) for root in roots))
+            self.store.add(approximations, roots, residuals, iterations, [reasons.index(self.get_reason(residual, stop)) for residual, stop in zip(residuals, stops)],
+                           multiplicities)
+            if self.backend == None:
+                self.results, self.roots = None, self.store.get_roots()
+            else:
+                # The lanes run in the dtype of the backend, whose roots are kept in that type as with the scalar path (see set_results)
+                self.results = self.store.get_results()
+                for result in self.results:
+                    result.root = self.backend.convert(result.root)
+                self.roots = [result.root for result in self.results]
+            self.update_warm_start()
+        else:
+            self.map_roots(self.find_root, self.get_initial_approximations(init_approx))
@@ -0,0 +1,73 @@
+# TODO: Run the same solvers in different floating point types, trading precision for speed explicitly
+# Note: A backend converts the approximations into its type before the iterations start, after which all the arithmetic of the solvers (and of
+# func, as long as it is written with arithmetic operators and the elementary functions of AutomaticDifferentiation.py) stays in that type
+#           float32         : NumPy float32, half the memory and up to twice the throughput of the vectorized modes, for screening
+#           float64         : Python floats, the usual
+#           double_double   : DoubleDouble (see DoubleDoubleArithmetic.py), about 32 digits in pure Python, for ill-conditioned roots
+# Note: The vectorized modes need a NumPy type, hence they do not support double_double
+
+# Note: Tolerances are derived from the machine epsilon eps of the type (the spacing of the numbers at 1), instead of the fixed default of 1e-5
+# which is too strict for float32 and far too loose for double_double
+#           epsilon = 16.eps        tolerance on |f(x)|
+#           rtol = 4.eps            tolerance on the relative step |x(k + 1) - x(k)| <= rtol.|x(k + 1)|
+# The relative step stops the iterations once x stops moving beyond the last few digits of the type, whatever the scale of f, like Brent's
+# tolerance 2.eps.|x|. Iterations which cannot reach it since f is too noisy near the root stagnate (see Budget.py)
+
+import sys
+
+class NumericBackend():
+    def __init__(self, name : str, eps : float, dtype : str = None, scalar : type = None) -> None:
+        assert not dtype == None or not scalar == None, "A backend needs either a NumPy dtype or a scalar type"
+        self.name = name
+        self.eps = eps
+        self.dtype = dtype
+        self.scalar = scalar
+        self.epsilon = 16 * eps
+        self.rtol = 4 * eps
+
+    def __repr__(self) -> str:
+        return "NumericBackend(" + repr(self.name) + ")"
+
+    # Convert an approximation, or every value of a bracket, into the type of the backend. Complex approximations are left as they are
+    def convert(self, x):
+        if isinstance(x, tuple):
+            return tuple(self.convert(value) for value in x)
+        if isinstance(x, complex):
+            return x
+        if self.scalar == None:
+            import numpy as np
+            return np.dtype(self.dtype).type(x)
+        return self.scalar(x)
+
+def get_double_double() -> type:
+    from .DoubleDoubleArithmetic import DoubleDouble
+    return DoubleDouble
+
+# Convert into DoubleDouble, which is only imported along with the first conversion
+def to_double_double(x):
+    return get_double_double()(x)
+
+backends = {
+    "float32" : NumericBackend("float32", 2.0 ** -23, dtype = "float32"),
+    "float64" : NumericBackend("float64", sys.float_info.epsilon, dtype = "float64", scalar = float),
+    "double_double" : NumericBackend("double_double", 2.0 ** -104, scalar = to_double_double),
+}
+
+# Return the backend registered as name, or backend itself when it already is a NumericBackend
+def get_backend(backend) -> NumericBackend:
+    if isinstance(backend, NumericBackend):
+        return backend
+    assert backend in backends, "Backend should be one of " + ", ".join(backends)
+    return backends[backend]
+
+# Register a backend, e.g. NumericBackend("float16", 2.0 ** -10, dtype = "float16")
+def register_backend(backend : NumericBackend) -> None:
+    backends[backend.name] = backend
+
+# Perform unit tests with the following examples
+# backend = get_backend("float32")
+# backend.epsilon, backend.rtol -> (1.9073486328125e-06, 4.76837158203125e-07)
+# backend.convert((1, 2.5)) -> (np.float32(1.0), np.float32(2.5))
+# get_backend("double_double").convert(0.1) -> DoubleDouble('0.1000000000000000055511151231257827')
+# solver = NewtonRhapsonSolver(lambda x : x*x - 2, lambda x : 2*x), solver.set_backend("double_double"), solver.set_roots(1.5)
+# solver.get_roots() -> [DoubleDouble('1.414213562373095048801688724209706')], as well as solver.roots and solver.get_results()[0].root, without statistics
@@ -0,0 +1,459 @@
+# A generic Solver Interface that needs to be implemented by any class which aims at solving Non-linear Algaebric Equations for helper functions
+# In order to extend the interface, the abstract method find_root(self, x_0) needs to be implemented, which iterates a single initial approximation
+# to a root and returns a RootResult through self.get_result(*args, **kwargs). Solvers with several variants may instead override set_roots(self, *args, **kwargs) and dispatch to their own find_root methods.
+
+# Note: Intervals and approximations are processed by an execution backend, set through self.set_executor(*args, **kwargs)
+#           serial  : one after the other in the current thread (default)
+#           thread  : sharded across a concurrent.futures.ThreadPoolExecutor, useful when func releases the GIL or waits on I/O
+#           process : sharded across a concurrent.futures.ProcessPoolExecutor, useful for expensive pure-Python functions
+# Note: Work is dispatched in chunks to amortize the dispatch (and pickling) overhead, and results are always collected in submission order,
+# so self.approximations and self.roots come out in exactly the same order as with the serial backend
+# Note: The process backend pickles the solver, hence func and its derivatives need to be picklable (module-level functions, not lambdas)
+
+# Note: Derivative based solvers take their derivatives from func itself when they are not passed in, see self.resolve_derivatives(*args, **kwargs)
+# Such a func (e.g. Polynomial) evaluates itself and its derivatives in a single pass, through self.fused_func(x, order) -> (f(x), f'(x), ...)
+# Any other func is differentiated automatically (see AutomaticDifferentiation.py), which requires it to use the elementary functions of that module
+# Note: func may also be given as text, e.g. "x * sin(x) = 1", which is compiled along with its derivatives into a single kernel (see Expression.py)
+
+# Note: Evaluations of func and its derivatives (der_func, der_der_func, fused_func) can be memoized with a bounded LRU cache through self.set_memoization(maxsize)
+# Note: With the process backend, every worker process fills its own copy of the cache
+
+# Note: Per-root statistics (iterations, residual, reason, call counts and wall time) are available through self.get_results()
+# Note: Call counts and wall time are only measured after enabling them through self.set_statistics(), since counting requires wrapping every function
+# Note: The callback passed to self.set_statistics(*args, **kwargs) is invoked as callback(iteration, x, f(x)) after every iteration of find_root
+# Note: With memoization enabled, call counts include cache hits, the actual evaluations are reported by self.get_cache_info()
+
+# Note: Approximations and roots are kept in array backed stores (see ResultStorage.py), self.approximations and self.store respectively, whose columns
+# are read without copying through get_column(name) or to_numpy(). self.roots stays a list of the roots, and self.get_approximations(),
+# self.get_roots() and self.get_results() return the usual dict and lists as copies
+# Note: self.results only keeps the RootResult of every root when statistics are enabled, since call counts and wall times have no column, or when a
+# numeric backend is set, since its roots may not fit in floats (see NumericBackends.py)
+
+# Note: When func drifts slightly between solves, enable warm starts through self.set_warm_start() and swap the function in with self.set_func(*args, **kwargs)
+# Every solve then starts from the previous roots instead of Bisection and random perturbations: each previous root r is checked to still be bracketed
+# by a sign change over (r - h, r + h), widening h geometrically when it is not, where h is twice the drift of r over the last solve (at least 10 * epsilon, and sqrt(epsilon) right after a cold solve)
+# The bracket is handed to the solver as its starting state (see warm_start_points), and only if some root cannot be bracketed any more
+# the approximations are set again with the arguments of the last call to self.set_approximations(*args, **kwargs)
+
+# Note: Every root is iterated within a budget set through self.set_budget(*args, **kwargs), at most max_iterations iterations (1000 by default)
+# and max_time seconds, until a cancellation token is cancelled, or until |f(x)| stagnates (see Budget.py). A batch of roots thus finishes in
+# bounded time, and the reason of every root (see SolverStatistics.py) tells the converged ones apart from the others
+
+# Note: The arithmetic of the iterations runs in Python floats, unless a numeric backend (float32, float64 or double_double, see NumericBackends.py)
+# is set through self.set_backend(*args, **kwargs), which converts the approximations into its type and sets epsilon from its machine epsilon
+# Note: Steps are then small once they are relative, |x(k + 1) - x(k)| <= rtol.|x(k + 1)|, instead of |x(k + 1) - x(k)| < epsilon, see self.is_small_step(*args)
+# Note: With a numeric backend set, self.roots, self.get_roots() and self.get_results() give the roots in the type of the backend, with or without
+# statistics, the store only keeping them as floats (its root column is float64, and double_double roots lose their low part there)
+
+from typing import Dict, List, Callable, Sequence, Tuple
+from functools import partial
+from .Bisection import bracket_interval, evaluate_mid_intervals, get_iterations, is_nearly_linear
+from .ResultStorage import ResultStore
+from .IntermediateValueTheorem import sign
+from .SolverStatistics import RootResult, CountingFunction, CONVERGED, STEP_TOLERANCE, NON_FINITE
+import cmath
+import copy
+import math
+import os
+import time
+
+memoized_functions = ("func", "der_func", "der_der_func", "fused_func")
+# Pools of concurrent.futures, which is only imported along with the first pool (see get_executor) since it pulls in multiprocessing
+executors = {"thread" : "ThreadPoolExecutor", "process" : "ProcessPoolExecutor"}
+
+def get_executor(executor : str) -> Callable:
+    import concurrent.futures
+    return getattr(concurrent.futures, executors[executor])
+
+# Compile func when it is given as text (see Expression.py, which is only imported then)
+def get_func(func : Callable) -> Callable:
+    if isinstance(func, str):
+        from .Expression import compile_expression
+        return compile_expression(func)
+    return func
+
+# Calculate the roots for a chunk of approximations, one after the other
+def find_roots(find_root : Callable, approximations : Sequence) -> List:
+    return [find_root(approximation) for approximation in approximations]
+
+class NumericalMethodSolver():
+    # Number of points find_root expects from a warm start: the previous root (1), a bracket (lower, upper) around it (2),
+    # or the bracket followed by the previous root (3)
+    warm_start_points = 1
+
+    def __init__(self, func : Callable, intervals : Sequence = None, epsilon : float = 1e-5) -> None:
+        self.func = get_func(func)
+        self.intervals = intervals
+        self.epsilon = epsilon
+        self.approximations = None
+        self.brackets = None
+        self.enclosures = None
+        self.proxies = None
+        self.roots = None
+        self.store = None
+        self.fused_func = None
+        self.results = None
+        self.statistics = False
+        self.callback = None
+        self.executor = "serial"
+        self.max_workers = None
+        self.chunksize = None
+        self.approximation_kwargs = None
+        self.warm_start = False
+        self.warm_roots = None
+        self.warm_widths = None
+        self.max_expansions = 16
+        self.detect_multiplicity = True
+        self.max_iterations = 1000
+        self.max_time = None
+        self.cancellation = None
+        self.stall_iterations = 50
+        self.backend = None
+        self.rtol = None
+    
+    def get_approximations(self) -> Dict:
+        assert not self.approximations == None, "Approximations need to be set by calling self.set_approximations(*args, **kwargs)"
+        return self.approximations.get_approximations()
+
+    def get_enclosures(self) -> List[Tuple]:
+        assert not self.enclosures == None, "Enclosures need to be set by calling self.set_approximations(interval = True)"
+        return list(self.enclosures)
+
+    def get_roots(self) -> List:
+        assert not self.store == None, "Roots need to be calculated by calling self.set_roots(*args, **kwargs)"
+        return list(self.roots)
+
+    def get_results(self) -> List[RootResult]:
+        assert not self.store == None, "Roots need to be calculated by calling self.set_roots(*args, **kwargs)"
+        return self.store.get_results() if self.results == None else self.results
+
+    def set_intervals(self, intervals:  Sequence) ->None:
+        self.intervals = intervals
+
+    def set_executor(self, executor : str = "serial", max_workers : int = None, chunksize : int = None) -> None:
+        assert executor == "serial" or executor in executors, "Executor should be one of serial, " + ", ".join(executors)
+        assert max_workers == None or (isinstance(max_workers, int) and max_workers > 0), "Number of workers should be an integer and should trivially be greater than zero"
+        assert chunksize == None or (isinstance(chunksize, int) and chunksize > 0), "Chunk size should be an integer and should trivially be greater than zero"
+        self.executor = executor
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+
+    # Note: Set max_expansions to the number of times the bracket around a previous root may be widened fourfold before re-bracketing with Bisection
+    def set_warm_start(self, warm_start : bool = True, max_expansions : int = 16) -> None:
+        assert isinstance(max_expansions, int) and max_expansions >= 0, "Number of expansions should be an integer and should trivially be non-negative"
+        self.warm_start = warm_start
+        self.max_expansions = max_expansions
+        self.warm_roots = None
+        self.warm_widths = None
+
+    # Swap in a new function (along with its derivatives, in increasing order of derivation) while keeping the roots of the previous one for warm starts
+    # Note: Memoization is dropped since the cached values belong to the previous function, call self.set_memoization(maxsize) again if needed
+    def set_func(self, func : Callable, *der_funcs : Callable) -> None:
+        self.func = get_func(func)
+        self.fused_func = None
+        names = [name for name in ("der_func", "der_der_func") if hasattr(self, name)]
+        assert len(der_funcs) <= len(names), "Expected at most " + str(len(names)) + " derivatives"
+        der_funcs = der_funcs + (None,) * (len(names) - len(der_funcs))
+        for name, der_func in zip(names, self.resolve_derivatives(*der_funcs)):
+            setattr(self, name, der_func)
+
+    # Note: Derivative based solvers estimate the multiplicity of every root and accelerate their iterations at multiple roots (see Multiplicity.py),
+    # set detect to False to iterate with the unmodified methods
+    def set_multiplicity_detection(self, detect : bool = True) -> None:
+        self.detect_multiplicity = detect
+
+    # Note: Set max_iterations, max_time (seconds per root) or stall_iterations to None to lift the respective limit
+    def set_budget(self, max_iterations : int = 1000, max_time : float = None, cancellation : "CancellationToken" = None, stall_iterations : int = 50) -> None:
+        assert max_iterations == None or (isinstance(max_iterations, int) and max_iterations > 0), "Number of iterations should be an integer and should trivially be greater than zero"
+        assert max_time == None or max_time > 0, "Time budget should trivially be greater than zero"
+        assert stall_iterations == None or (isinstance(stall_iterations, int) and stall_iterations > 0), "Number of stalled iterations should be an integer and should trivially be greater than zero"
+        self.max_iterations = max_iterations
+        self.max_time = max_time
+        self.cancellation = cancellation
+        self.stall_iterations = stall_iterations
+
+    # A fresh monitor for the iterations of a single root
+    def get_monitor(self) -> "IterationMonitor":
+        from .Budget import IterationMonitor
+        return IterationMonitor(self.max_iterations, self.max_time, self.cancellation, self.stall_iterations)
+
+    # Set backend to None for Python floats with an absolute step tolerance again. epsilon and rtol default to the ones of the backend, or epsilon to
+    # the one in effect before a backend was set when backend is None
+    def set_backend(self, backend = "float64", epsilon : float = None, rtol : float = None) -> None:
+        if self.backend == None:
+            self.float_epsilon = self.epsilon
+        if backend == None:
+            self.backend, self.rtol = None, None
+            self.epsilon = self.float_epsilon if epsilon == None else epsilon
+            return
+        from .NumericBackends import get_backend
+        self.backend = get_backend(backend)
+        self.epsilon = self.backend.epsilon if epsilon == None else epsilon
+        self.rtol = self.backend.rtol if rtol == None else rtol
+        assert self.epsilon > 0 and self.rtol > 0, "Tolerances should trivially be greater than zero"
+
+    # Whether the step from x_old to x_new is small enough to stop iterating, see the note on backends above
+    def is_small_step(self, x_new, x_old) -> bool:
+        if self.rtol == None:
+            return abs(x_new - x_old) < self.epsilon
+        return abs(x_new - x_old) <= self.rtol * abs(x_new)
+
+    # NumPy dtype of the vectorized modes
+    def get_dtype(self) -> str:
+        if self.backend == None:
+            return "float64"
+        assert not self.backend.dtype == None, "Vectorized modes need a NumPy backend, " + self.backend.name + " is not one"
+        return self.backend.dtype
+
+    def set_statistics(self, statistics : bool = True, callback : Callable = None) -> None:
+        self.statistics = statistics
+        self.callback = callback
+
+    # Note: Set maxsize to 0 to remove the caches again, or to None for unbounded caches
+    def set_memoization(self, maxsize : int = 1024) -> None:
+        from .FunctionCache import MemoizedFunction
+        for name in memoized_functions:
+            func = getattr(self, name, None)
+            if func == None:
+                continue
+            if isinstance(func, MemoizedFunction):
+                func = func.func
+            setattr(self, name, func if maxsize == 0 else MemoizedFunction(func, maxsize))
+
+    # Returns the (hits, misses, maxsize, currsize) of the cache of every memoized function
+    def get_cache_info(self) -> Dict:
+        from .FunctionCache import MemoizedFunction
+        cache_info = dict()
+        for name in memoized_functions:
+            func = getattr(self, name, None)
+            if isinstance(func, MemoizedFunction):
+                cache_info[name] = func.cache_info()
+        return cache_info
+
+    # Split the items into chunks, apply function to every chunk using the execution backend and return the results of the chunks in order
+    def map_chunks(self, function : Callable, items : Sequence) -> List:
+        items = list(items)
+        if self.executor == "serial" or len(items) <= 1:
+            return [function(items)]
+        max_workers = self.max_workers or os.cpu_count() or 1
+        # By default, hand out roughly four chunks per worker to balance the load without paying the dispatch overhead per item
+        chunksize = self.chunksize or math.ceil(len(items) / (4 * max_workers))
+        chunks = [items[i : i + chunksize] for i in range(0, len(items), chunksize)]
+        with get_executor(self.executor)(max_workers = max_workers) as executor:
+            return list(executor.map(function, chunks))
+
+    # Note: Set vectorized to True to bisect all the intervals as NumPy arrays, which pays off for array-aware functions and large numbers of intervals
+    # Note: Besides the approximations, the brackets (lower-limit, upper-limit, f(lower-limit), f(upper-limit)) they were taken from are kept in self.brackets
+    # Note: Set adaptive to True to stop bisecting every interval as soon as self.can_hand_off(*args, **kwargs) expects the solver to converge from there,
+    # iterations and epsilon then only bound the number of iterations of Bisection
+    # Note: Set samples to scan the intervals for all of their roots first (see scan_interval in Scanning.py), instead of relying on every half-interval
+    # to contain an odd number of roots. The brackets found are then bisected as usual, or kept as they are when neither iterations nor epsilon are given,
+    # and the candidate roots of even multiplicity are appended to the approximations (BrentSolver only iterates the brackets)
+    # Note: Set interval to True to isolate the roots with interval arithmetic instead (see isolate_roots in IntervalIsolation.py), which discards the
+    # root-free parts of the intervals whatever their sign changes, and certifies boxes narrower than epsilon (self.epsilon by default) which hold exactly one root
+    # The boxes are kept as brackets, or as candidate roots when f does not change its sign over them (e.g. multiple roots), and self.get_enclosures()
+    # returns them as (lower-limit, upper-limit, certified). func (and der_func when passed) needs to evaluate over Intervals, see IntervalIsolation.py
+    # Note: Set chebyshev to True for expensive functions, to take the approximations from the roots of a Chebyshev interpolant of f over every interval
+    # (see ChebyshevApproximation.py), of degree at most max_degree, which costs a fixed number of evaluations of f (65 for x.sin(x) = 1 over (0, 20)) whatever
+    # the number of roots. Newton Rhapson or Secant Method then polish them on f itself within a few iterations. The brackets are taken around these roots
+    # (see bracket_roots in ChebyshevApproximation.py) for BrentSolver, at one more evaluation of f per root. The proxies are kept in self.proxies
+    def set_approximations(self, iterations : int = None, epsilon : float = None, digits : int = 5, vectorized : bool = False, adaptive : bool = False,
+                           samples : int = None, depth : int = 16, interval : bool = False, chebyshev : bool = False, max_degree : int = 512) -> None:
+        assert not self.intervals == None, "Intervals need to be set for estimating approximations using self.set_intervals(*args, **kwargs)"
+        intervals = [self.intervals] if isinstance(self.intervals, tuple) else list(self.intervals)
+        hand_off = self.can_hand_off if adaptive else None
+        self.approximation_kwargs = {"iterations" : iterations, "epsilon" : epsilon, "digits" : digits, "vectorized" : vectorized, "adaptive" : adaptive,
+                                     "samples" : samples, "depth" : depth, "interval" : interval, "chebyshev" : chebyshev, "max_degree" : max_degree}
+        self.approximations = ResultStore(digits)
+        candidates = []
+        if chebyshev:
+            from .ChebyshevApproximation import approximate_roots, bracket_roots
+            self.proxies, candidates = approximate_roots(self.func, intervals, max_degree = max_degree)
+            # The roots of the proxies are the approximations themselves, rather than the mid-points of the brackets
+            self.brackets = bracket_roots(self.func, intervals, [root for root, _ in candidates])
+            if len(candidates) > 0:
+                self.approximations.add_approximations(*zip(*candidates))
+            return
+        if interval:
+            from .IntervalIsolation import isolate_roots, bracket_boxes
+            # The derivative passed by the user, if any, or else the fused derivatives of func (func.derivatives), see self.resolve_derivatives(*args)
+            der_func = getattr(self, "der_func", None) if self.fused_func == None else None
+            certified, uncertain = isolate_roots(self.func, intervals, self.epsilon if epsilon == None else epsilon, der_func)
+            self.enclosures = sorted([box + (True,) for box in certified] + [box + (False,) for box in uncertain])
+            intervals, candidates = bracket_boxes(self.func, [box[:2] for box in self.enclosures])
+        elif not samples == None:
+            from .Scanning import scan_interval
+            intervals, candidates = scan_interval(self.func, intervals, samples, depth)
+
+        if interval or len(intervals) == 0 or (not samples == None and iterations == None and epsilon == None):
+            self.brackets = intervals
+        elif self.executor == "serial":
+            self.brackets = bracket_interval(self.func, intervals, iterations, epsilon, vectorized, hand_off)
+        else:
+            # Every chunk needs to be bisected for the same number of iterations as the whole set of intervals would have been
+            # No iterations at all (epsilon wider than every interval) are left to epsilon, which bisects none of the chunks either, as in the serial path
+            iterations = get_iterations(intervals, iterations, epsilon) or None
+            self.brackets = []
+            for brackets in self.map_chunks(partial(bracket_interval, self.func, iterations = iterations, epsilon = epsilon, vectorized = vectorized,
+                                                    hand_off = hand_off), intervals):
+                self.brackets.extend(brackets)
+        for approximations, values in self.map_chunks(partial(evaluate_mid_intervals, self.func, vectorized = vectorized), self.brackets):
+            self.approximations.add_approximations(approximations, values)
+        if len(candidates) > 0:
+            self.approximations.add_approximations(*zip(*candidates))
+
+    # Return the derivatives of func, der_funcs being the ones passed by the user (None when missing) in increasing order of derivation
+    # Missing derivatives are derived from func when it knows its own derivatives (Polynomial), or else by automatic differentiation of func
+    # Either way f(x) and all the derivatives are evaluated in a single pass through self.fused_func, provided that none of the derivatives were passed in
+    def resolve_derivatives(self, *der_funcs : Callable) -> List[Callable]:
+        if any(der_func == None for der_func in der_funcs) and not hasattr(self.func, "derivative"):
+            from .AutomaticDifferentiation import DifferentiableFunction, supports_jets
+            # Fail here rather than deep inside self.set_roots(*args, **kwargs) when func calls math, which cannot be differentiated automatically
+            assert supports_jets(self.func, self.get_probe_point()), "Derivatives of func need to be passed in, unless func uses the functions of AutomaticDifferentiation.py instead of math"
+            self.func = DifferentiableFunction(self.func)
+        resolved = []
+        for order, der_func in enumerate(der_funcs, 1):
+            if der_func == None:
+                der_func = self.func.derivative(order)
+            resolved.append(der_func)
+        if all(der_func == None for der_func in der_funcs) and hasattr(self.func, "derivatives"):
+            self.fused_func = self.func.derivatives
+        return resolved
+
+    # A point to probe func at, the mid-point of the first interval, or 1.0 without intervals
+    def get_probe_point(self) -> float:
+        intervals = [self.intervals] if isinstance(self.intervals, tuple) else self.intervals
+        if intervals == None or len(intervals) == 0:
+            return 1.0
+        return intervals[0][0] + (intervals[0][1] - intervals[0][0]) / 2
+
+    # Return (f(x), f'(x), ..., f^(order)(x)) for order 1 or 2, in a single pass when func supports it
+    def evaluate(self, x : float, order : int = 1) -> Tuple:
+        if not self.fused_func == None:
+            return self.fused_func(x, order)
+        if order == 1:
+            return self.func(x), self.der_func(x)
+        return self.func(x), self.der_func(x), self.der_der_func(x)
+
+    # Criterion of the adaptive Bisection for handing off an interval to the solver, given the function values at its end-points and mid-point
+    # Note: Receives NumPy arrays with the vectorized Bisection, see is_nearly_linear in Bisection.py. Solvers may override it with a criterion
+    # tailored to their own generator function g(x)
+    def can_hand_off(self, lower : float, upper : float, f_lower : float, f_mid : float, f_upper : float) -> bool:
+        return is_nearly_linear(lower, upper, f_lower, f_mid, f_upper)
+
+    # Return the initial approximations to iterate, either the ones passed manually through init_approx, the ones warm started from the previous roots
+    # or the ones set by Bisection
+    def get_initial_approximations(self, init_approx : Sequence[float] = None) -> List:
+        if init_approx == None:
+            if self.warm_start and not self.warm_roots == None:
+                return self.get_warm_approximations()
+            return self.get_cold_approximations()
+        if isinstance(init_approx, float) or isinstance(init_approx, int):
+            return [init_approx]
+        return list(init_approx)
+
+    def get_cold_approximations(self) -> List:
+        assert not self.approximations == None, "Approximations need to be set before calculating roots by calling self.set_approximations(*args, **kwargs)"
+        return self.approximations.get_column("approximation").tolist()
+
+    # Return a sign-changing bracket (lower, upper) around a previous root r, starting with the half-width h and widening it fourfold
+    # at most self.max_expansions times, or None when the root cannot be bracketed any more
+    def find_warm_bracket(self, r : float, h : float) -> Tuple:
+        for _ in range(self.max_expansions + 1):
+            f_lower, f_upper = self.func(r - h), self.func(r + h)
+            if f_lower == 0 or f_upper == 0 or sign(f_lower) * sign(f_upper) == -1:
+                return r - h, r + h
+            h *= 4
+        return None
+
+    # Seed every root from the previous one, see warm_start_points. Falls back to the approximations set by Bisection when any of the roots
+    # cannot be bracketed, or to the bare previous roots when there is no Bisection to fall back to
+    def get_warm_approximations(self) -> List:
+        approximations = []
+        for r, h in zip(self.warm_roots, self.warm_widths):
+            # Complex roots (see Muller.py) cannot be bracketed by a sign change
+            bracket = self.find_warm_bracket(r, h) if not isinstance(r, complex) and math.isfinite(r) else None
+            if bracket == None:
+                if self.approximation_kwargs == None:
+                    return list(self.warm_roots)
+                self.set_approximations(**self.approximation_kwargs)
+                return self.get_cold_approximations()
+            lower, upper = bracket
+            approximations.append(r if self.warm_start_points == 1 else (lower, upper) if self.warm_start_points == 2 else (lower, upper, r))
+        return approximations
+
+    # Keep the roots for the next warm start, along with the width of the bracket to check them with, twice the drift of every root since the last solve
+    def update_warm_start(self) -> None:
+        if not self.warm_start:
+            return
+        if self.warm_roots == None or not len(self.warm_roots) == len(self.roots):
+            self.warm_widths = [max(math.sqrt(self.epsilon), 10 * self.epsilon)] * len(self.roots)
+        else:
+            self.warm_widths = [max(2 * abs(root - previous), 10 * self.epsilon) if cmath.isfinite(root - previous) else 10 * self.epsilon
+                                for root, previous in zip(self.roots, self.warm_roots)]
+        self.warm_roots = list(self.roots)
+
+    # Calculate the root for every approximation using find_root and the execution backend, and set self.store, self.roots and self.results
+    def map_roots(self, find_root : Callable, approximations : Sequence) -> None:
+        if self.statistics:
+            find_root = partial(self.measure_root, find_root.__name__)
+        self.set_results(approximations, self.map_chunks(partial(find_roots, find_root), self.convert_approximations(approximations)))
+
+    # Convert the approximations into the type of the numeric backend, the store keeps the original ones
+    def convert_approximations(self, approximations : Sequence) -> Sequence:
+        if self.backend == None:
+            return approximations
+        return [self.backend.convert(approximation) for approximation in approximations]
+
+    # Store the results of the approximations, given as chunks of RootResults in the order of the approximations
+    def set_results(self, approximations : Sequence, chunks : Sequence[List[RootResult]]) -> None:
+        chunks = list(chunks)
+        self.store = ResultStore(complex_roots = any(isinstance(result.root, complex) for chunk in chunks for result in chunk))
+        # The store keeps floats only, hence the RootResults are kept as well for the roots of a backend
+        keep_results = self.statistics or not self.backend == None
+        self.results = [] if keep_results else None
+        start = 0
+        for chunk in chunks:
+            self.store.add_results(approximations[start : start + len(chunk)], chunk)
+            if keep_results:
+                self.results.extend(chunk)
+            start += len(chunk)
+        # A list, as it has always been, complex roots being rebuilt from both columns, and the roots of a backend being kept in its type
+        self.roots = self.store.get_roots() if self.backend == None else [result.root for result in self.results]
+        self.update_warm_start()
+
+    # Run find_root on a shallow copy of the solver whose functions count their calls, so that concurrent roots do not share the counters
+    def measure_root(self, find_root : str, x_0 : float) -> RootResult:
+        solver = copy.copy(self)
+        for name in memoized_functions:
+            func = getattr(self, name, None)
+            if not func == None:
+                setattr(solver, name, CountingFunction(func))
+        start = time.perf_counter()
+        result = getattr(solver, find_root)(x_0)
+        result.wall_time = time.perf_counter() - start
+        result.func_calls = solver.func.calls + (solver.fused_func.calls if not solver.fused_func == None else 0)
+        result.der_func_calls = solver.der_func.calls if hasattr(solver, "der_func") else None
+        result.der_der_func_calls = solver.der_der_func.calls if hasattr(solver, "der_der_func") else None
+        return result
+
+    # Wrap up the iterations of find_root into a RootResult, the reason is inferred from the residual f(x), unless the iterations were stopped
+    # by their monitor (stop) before converging
+    def get_result(self, x : float, f_x : float, iterations : int, multiplicity : int = None, stop : str = None) -> RootResult:
+        return RootResult(x, f_x, iterations, self.get_reason(f_x, stop), multiplicity)
+
+    def get_reason(self, f_x : float, stop : str = None) -> str:
+        if abs(f_x) < self.epsilon:
+            return CONVERGED
+        elif not cmath.isfinite(f_x):
+            return NON_FINITE
+        elif not stop == None:
+            return stop
+        return STEP_TOLERANCE
+
+    def set_roots(self, init_approx : Sequence[float] = None) -> None:
+        assert hasattr(self, "find_root"), "Solvers need to implement find_root(self, x_0) or override set_roots(self, *args, **kwargs)"
+        self.map_roots(self.find_root, self.get_initial_approximations(init_approx))
+
+    def print_roots(self, *args, **kwargs) -> None:
+        print(self.get_roots()) 
@@ -0,0 +1,154 @@
+# TODO: Solve a whole family of equations f(x; p) = 0 for a large matrix of parameter sets in a single vectorized pass
+# Note: Every row of the parameter matrix is an independent lane, all the lanes advance together as NumPy arrays
+
+# Method : Each lane uses exactly the same iteration as the corresponding scalar solver, including the modified steps at multiple roots (see Multiplicity.py)
+#   newton      : NewtonRhapsonSolver, b = a - m.f(a) / f'(a)
+#   secant      : SecantSolver, c = b - f(b) * (b - a) / (f(b) - f(a))
+#   chebysev    : ChebysevSolver, b = a - (1/2).m.(3 - m).f(a)/f'(a) - (1/2).m^2.f(a)^2.f''(a)/f'(a)^3
+#   multipoint  : MultipointSolver.set_roots_1, b = a - f(a) / f'(a - (1/2).f(a)/f'(a)), or a - m.f(a)/f'(a) at a multiple root
+#   multipoint_2: MultipointSolver.set_roots_2, b = a - f(a)/f'(a) - f(a - f(a)/f'(a))/f'(a), or a - m.f(a)/f'(a) at a multiple root
+
+# Note: func, der_func and der_der_func are called as func(x, params), where x is an array of shape (m,) and params holds the matching m rows of
+# the parameter matrix, hence they need to be array-aware (arithmetic operators and NumPy ufuncs)
+# Note: Converged lanes are masked out, so every iteration only evaluates the lanes which are still active
+# Note: Stop iteration of a lane on the same conditions as the scalar solvers, which also give the reason of every lane (see SolverStatistics.py):
+#           |f(x)| < epsilon
+#           |x(k + 1) - x(k)| < epsilon, or relative to x(k + 1) with a numeric backend (see self.is_small_step(*args))
+#           f'(x) vanishes (derivative based methods)
+#           the lane becomes non-finite (division by a vanishing derivative), in which case it is reported as not converged
+# Note: The budget (self.set_budget(*args, **kwargs)), the numeric backend (self.set_backend(*args, **kwargs), NumPy backends only) and the multiplicity
+# detection (self.set_multiplicity_detection(detect)) are the ones of the scalar solvers, see NumericalMethod.py
+# Note: Unlike the scalar solvers, the lanes which are still active share the budget, max_time bounds the whole batch and stagnation is not detected
+# per lane, like the vectorized NewtonRhapsonSolver
+
+from typing import Callable, List, Sequence
+from .NumericalMethod import NumericalMethodSolver
+from .Multiplicity import MultiplicityEstimatorLanes
+from .ResultStorage import ResultStore, reasons
+from .SolverStatistics import CONVERGED
+
+class ParametricSolver():
+    methods = ("newton", "secant", "chebysev", "multipoint", "multipoint_2")
+
+    def __init__(self, func : Callable, params : Sequence, method : str = "newton", der_func : Callable = None, der_der_func : Callable = None, epsilon : float = 1e-5) -> None:
+        import numpy as np
+        assert method in self.methods, "Method should be one of " + ", ".join(self.methods)
+        assert method == "secant" or not der_func == None, "The derivative of the function is required for the " + method + " method"
+        assert not method == "chebysev" or not der_der_func == None, "The second derivative of the function is required for the chebysev method"
+        self.func = func
+        self.der_func = der_func
+        self.der_der_func = der_der_func
+        self.params = np.asarray(params, dtype = float)
+        self.method = method
+        self.epsilon = epsilon
+        self.detect_multiplicity = True
+        self.set_budget()
+        self.backend = None
+        self.rtol = None
+        self.store = None
+        self.roots = None
+        self.residuals = None
+
+    # Shared with the scalar solvers, see NumericalMethod.py
+    set_budget = NumericalMethodSolver.set_budget
+    get_monitor = NumericalMethodSolver.get_monitor
+    set_backend = NumericalMethodSolver.set_backend
+    is_small_step = NumericalMethodSolver.is_small_step
+    get_dtype = NumericalMethodSolver.get_dtype
+    set_multiplicity_detection = NumericalMethodSolver.set_multiplicity_detection
+    get_reason = NumericalMethodSolver.get_reason
+
+    def get_roots(self):
+        assert not self.store == None, "Roots need to be calculated by calling self.set_roots(*args, **kwargs)"
+        return self.roots
+
+    # Whether |f(x)| < epsilon for every lane, the reasons of the others are given by self.get_results()
+    def get_converged(self):
+        import numpy as np
+        assert not self.store == None, "Roots need to be calculated by calling self.set_roots(*args, **kwargs)"
+        return np.asarray(self.store.get_column("status")) == reasons.index(CONVERGED)
+
+    def get_results(self) -> List:
+        assert not self.store == None, "Roots need to be calculated by calling self.set_roots(*args, **kwargs)"
+        return self.store.get_results()
+
+    # init_approx is either a single initial approximation shared by all the lanes or one initial approximation per lane
+    def set_roots(self, init_approx) -> None:
+        import numpy as np
+        n = len(self.params)
+        dtype = self.get_dtype()
+        func, der_func, der_der_func = self.func, self.der_func, self.der_der_func
+        params = self.params.astype(dtype)
+        x = np.array(np.broadcast_to(np.asarray(init_approx, dtype = dtype), (n,)))
+        approximations = x.tolist()
+        if self.method == "secant":
+            # Same perturbation as SecantSolver for the second initial approximation
+            x_prev, x = x, (x + 1e-01 * np.random.random(n)).astype(dtype)
+            f_x_prev = func(x_prev, params)
+            stepping = ~self.is_small_step(x, x_prev)
+        else:
+            der_f_x = der_func(x, params)
+            stepping = der_f_x != 0
+        f_x = func(x, params)
+
+        iterations = np.zeros(n, dtype = int)
+        stops = [None] * n
+        estimator = MultiplicityEstimatorLanes(n) if self.detect_multiplicity and not self.method == "secant" else None
+        monitor = self.get_monitor()
+        sweeps = 0
+        active = np.flatnonzero((np.abs(f_x) >= self.epsilon) & stepping)
+        with np.errstate(divide = "ignore", invalid = "ignore", over = "ignore"):
+            while(len(active) > 0):
+                p, x_k, f_x_k = params[active], x[active], f_x[active]
+                if self.method == "secant":
+                    x_new = x_k - f_x_k * (x_k - x_prev[active]) / (f_x_k - f_x_prev[active])
+                    x_prev[active], f_x_prev[active] = x_k, f_x_k
+                    f_x_new = func(x_new, p)
+                    stepping = ~self.is_small_step(x_new, x_k)
+                else:
+                    der_f_x_k = der_f_x[active]
+                    delta = f_x_k / der_f_x_k
+                    # Cast to the dtype of the lanes, since integer arrays would promote float32 lanes to float64
+                    m = 1 if estimator == None else estimator.update(active, x_k, f_x_k, delta).astype(dtype)
+                    if self.method == "newton":
+                        x_new = x_k - m * delta
+                    elif self.method == "chebysev":
+                        x_new = x_k - 0.5 * m * (3 - m) * delta - 0.5 * m * m * f_x_k * f_x_k * der_der_func(x_k, p) / (der_f_x_k * der_f_x_k * der_f_x_k)
+                    elif self.method == "multipoint":
+                        x_new = np.where(m > 1, x_k - m * delta, x_k - f_x_k / der_func(x_k - 0.5 * delta, p))
+                    else:
+                        x_new = np.where(m > 1, x_k - m * delta, x_k - delta - func(x_k - delta, p) / der_f_x_k)
+                    f_x_new, der_f_x_new = func(x_new, p), der_func(x_new, p)
+                    der_f_x[active] = der_f_x_new
+                    stepping = (der_f_x_new != 0) & ~self.is_small_step(x_new, x_k)
+
+                x[active], f_x[active] = x_new, f_x_new
+                iterations[active] += 1
+                active = active[(np.abs(f_x_new) >= self.epsilon) & stepping & np.isfinite(x_new) & np.isfinite(f_x_new)]
+                sweeps += 1
+                stop = monitor.check(sweeps)
+                if not stop == None:
+                    for i in active.tolist():
+                        stops[i] = stop
+                    break
+
+        residuals = f_x.tolist()
+        self.store = ResultStore()
+        self.store.add(approximations, x.tolist(), residuals, iterations.tolist(), [reasons.index(self.get_reason(residual, stop)) for residual, stop in zip(residuals, stops)],
+                       None if estimator == None else estimator.multiplicity.tolist())
+        self.roots = x
+        self.residuals = f_x
+
+    def print_roots(self, *args, **kwargs) -> None:
+        print(self.get_roots())
+
+# Perform unit tests with the following examples
+# func = lambda x, p : x**2 - p[:, 0]
+# der_func = lambda x, p : 2*x
+# solver = ParametricSolver(func, [[2.0], [3.0], [4.0]], "newton", der_func)
+# solver.set_roots(1.0)
+# solver.get_roots() -> array([1.41421356, 1.73205081, 2.        ])
+# solver.get_converged() -> array([ True,  True,  True])
+# solver = ParametricSolver(lambda x, p : (x - p[:, 0])**2, [[1.0], [2.0]], "newton", lambda x, p : 2*(x - p[:, 0]))
+# solver.set_roots(0.0)     (double roots, the same 3 iterations per lane as NewtonRhapsonSolver.find_root(0.0) on (x - 1)**2)
+# solver.set_budget(max_iterations = 2) then solver.set_roots(0.0) -> solver.get_results()[0].reason == 'budget_exhausted'
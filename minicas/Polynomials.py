@@ -0,0 +1,107 @@
+# TODO: Represent a polynomial p(x) = c_0.x^n + c_1.x^(n-1) + ... + c_n by its coefficients, highest degree first (same order as numpy.polyval)
+# Note: A Polynomial can be passed wherever a func is expected, and derivative based solvers (NewtonRhapsonSolver, ChebysevSolver, MultipointSolver)
+# then need neither der_func nor der_der_func, since the Polynomial evaluates itself and its derivatives in a single pass through derivatives(x, order)
+
+# Horner's Method evaluates p(x) with n multiplications and n additions: p(x) = (...((c_0.x + c_1).x + c_2)...).x + c_n
+# Note: Horner's Method extends to the derivatives in the same pass over the coefficients, since dividing p(x) by (x - a) repeatedly yields the
+# Taylor coefficients of p at a, p^(k)(a) / k!, after k + 1 synthetic divisions
+# Note: Evaluation only uses arithmetic operators, so x may equally well be a complex number or a NumPy array (vectorized evaluation)
+
+# All the roots (real and complex) of p are the eigenvalues of its companion matrix
+#   | -c_1/c_0  -c_2/c_0  ...  -c_(n-1)/c_0  -c_n/c_0 |
+#   |     1         0     ...       0            0    |
+#   |     0         1     ...       0            0    |
+#   |    ...       ...    ...      ...          ...   |
+#   |     0         0     ...       1            0    |
+# Note: Eigenvalues are accurate to the conditioning of the eigenvalue problem, hence roots(*args, **kwargs) polishes them with a few Newton-Rhapson
+# iterations on p itself
+
+from typing import List, Sequence, Tuple
+import math
+
+class Polynomial():
+    def __init__(self, coefficients : Sequence[float]) -> None:
+        coefficients = list(coefficients)
+        # Leading zeros do not change the polynomial, but would make the companion matrix singular
+        while(len(coefficients) > 1 and coefficients[0] == 0):
+            coefficients.pop(0)
+        assert len(coefficients) > 0, "A polynomial needs at least one coefficient"
+        self.coefficients = coefficients
+
+    @property
+    def degree(self) -> int:
+        return len(self.coefficients) - 1
+
+    def __call__(self, x):
+        value = self.coefficients[0] * x if self.degree > 0 else self.coefficients[0] + 0 * x
+        for coefficient in self.coefficients[1:-1]:
+            value = (value + coefficient) * x
+        return value + self.coefficients[-1] if self.degree > 0 else value
+
+    # Return p(x), p'(x), ..., p^(order)(x) in a single Horner pass
+    def derivatives(self, x, order : int = 1) -> Tuple:
+        values = [self.coefficients[0] + 0 * x] + [0 * x] * order
+        for coefficient in self.coefficients[1:]:
+            for k in range(order, 0, -1):
+                values[k] = values[k] * x + values[k - 1]
+            values[0] = values[0] * x + coefficient
+        # values[k] holds p^(k)(x) / k!
+        return tuple(values[k] * math.factorial(k) for k in range(order + 1))
+
+    def derivative(self, order : int = 1) -> "Polynomial":
+        coefficients = self.coefficients
+        for i in range(order):
+            n = len(coefficients) - 1
+            coefficients = [coefficient * (n - j) for j, coefficient in enumerate(coefficients[:-1])] or [0]
+        return Polynomial(coefficients)
+
+    # Divide p(x) by (x - root) through synthetic division (Horner's Method), return the quotient and the remainder p(root)
+    def deflate(self, root) -> Tuple["Polynomial", float]:
+        assert self.degree > 0, "A constant polynomial cannot be deflated"
+        quotient = [self.coefficients[0]]
+        for coefficient in self.coefficients[1:]:
+            quotient.append(quotient[-1] * root + coefficient)
+        remainder = quotient.pop()
+        return Polynomial(quotient), remainder
+
+    def get_companion_matrix(self):
+        import numpy as np
+        n = self.degree
+        companion_matrix = np.diag(np.ones(n - 1), -1)
+        companion_matrix[0, :] = -np.array(self.coefficients[1:], dtype = float) / self.coefficients[0]
+        return companion_matrix
+
+    # Return all the roots of p, counted with multiplicity
+    # Note: Set polish to the number of Newton-Rhapson iterations on p for every root (0 to skip polishing), iterations stop early once a step is negligible
+    # Note: Set real to True for the real roots only (imaginary part below tolerance), sorted in increasing order, and interval to keep only the ones within
+    def roots(self, polish : int = 3, real : bool = False, tolerance : float = 1e-8, interval : Tuple = None) -> List:
+        import numpy as np
+        if self.degree < 1:
+            return []
+        roots = np.linalg.eigvals(self.get_companion_matrix()).tolist()
+        for i in range(len(roots)):
+            for j in range(polish):
+                f_x, der_f_x = self.derivatives(roots[i], 1)
+                if der_f_x == 0:
+                    break
+                step = f_x / der_f_x
+                roots[i] -= step
+                if abs(step) <= 1e-15 * max(1.0, abs(roots[i])):
+                    break
+
+        if real:
+            roots = sorted(root.real for root in roots if abs(root.imag) <= tolerance * max(1.0, abs(root)))
+        if not interval == None:
+            roots = [root for root in roots if interval[0] <= root.real <= interval[1]]
+        return roots
+
+    def __repr__(self) -> str:
+        return "Polynomial(" + repr(self.coefficients) + ")"
+
+# Perform unit tests with the following examples
+# func = Polynomial([1, -5, 6])
+# func(2.5) -> -0.25
+# func.derivatives(2.5, 2) -> (-0.25, 0.0, 2)
+# func.roots(real = True) -> [2.0000000000000004, 2.9999999999999996]
+# func.deflate(2) -> (Polynomial([1, -3]), 0)
+# NewtonRhapsonSolver(func, intervals = (1, 4)) needs no der_func
@@ -0,0 +1,48 @@
+# TODO: Use the Regula-Falsi Method for finding out the real roots of a function f.
+# Note: Regula-Falsi Method has a first order of convergence (1)
+
+# Method : c = b - f(b) * (b - a) / (f(b) - f(a)), where a, b are intital approximations to the real root of the function
+# Method : Replace a with b and b with c for the next iteration if f(b)f(c) < 1 else Retain a and replace b with c for the next iteration
+# Note: Regula-Falsi Method uses two initial approximations to the root
+
+# Regula-Falsi Method can be proved in the following way:
+#   When the curve meets the X-axis, the curve can be approximated with a straight line (a1.x + a0) in an infinitesimally small neighborhood
+#   Calculate the values of the coefficients(a0, a1) by solving the following system of equations : a1.a + a0 = f(a), a1.b + a0 = f(b): c = -a0 / a1
+
+# Note: Stop iteration in one of three situations:
+#           |f(x)| < epsilon
+#           |x(k + 1) - x(k)| < epsilon
+#           the budget of the root runs out, or the iterations are cancelled or stagnate (see Budget.py)
+# Note: When f is convex or concave around the root, the same end-point is retained over and over and the iterations crawl towards the root
+# from one side only. Such a one-sided stall is reported as stagnated once |f(x)| stops halving (see Budget.py)
+
+# Note: Set manual approximations while calculating roots of f using init_approx
+# Note: Instead of using manual approximations, set approximations of f using Bisection Method through self.set_approximations(*args, **kwargs)
+
+
+# Note: Regula-Falsi Method is simply a variation of the Secant Method where we use Intermediate Value Theorem to decide the next interval
+
+from typing import Callable, Tuple, List, Sequence, Dict
+from .Secant import SecantSolver
+from .SolverStatistics import RootResult
+import random
+
+class Regula_FalsiSolver(SecantSolver):
+    def find_root(self, x_0 : float) -> RootResult:
+        x_0, x_1 = x_0 if isinstance(x_0, tuple) else (x_0, x_0 + 1e-01 * random.random())
+        f_x_k = self.func(x_1)
+        monitor = self.get_monitor()
+        stop = None
+        iterations = 0
+        while(not self.is_small_step(x_1, x_0) and abs(f_x_k) >= self.epsilon and stop == None):
+            x_new, f_x_k, has_root_ = super(Regula_FalsiSolver, self).calculate_next_value(self.func, x_0, x_1, True)
+            # Adding an if statement simply changes the Secant Solver to a Regula-Falsi Solver
+            if has_root_:
+                x_0 = x_1
+            x_1 = x_new
+            iterations += 1
+            if not self.callback == None:
+                self.callback(iterations, x_1, f_x_k)
+            stop = monitor.update(iterations, f_x_k)
+
+        return self.get_result(x_1, f_x_k, iterations, stop = stop)
@@ -0,0 +1,115 @@
+# TODO: Keep the approximations and roots of a solver in a compact, column oriented store instead of dicts and lists of Python floats
+# Note: Every entry is one approximation along with the root it was iterated to, the residual, the number of iterations, a status flag and the
+# multiplicity of the root (0 when it was not estimated)
+# Note: Every column is an array.array of machine types (8 bytes per float, 8 per iteration count, 1 per status), so millions of roots cost
+# tens of megabytes instead of a Python object (and a RootResult) per value
+# Note: Columns support the buffer protocol, hence memoryview(store.get_column(name)) or numpy.asarray(store.get_column(name)) read them without copying.
+# to_numpy() returns all of them at once. While such a view is alive, the store cannot grow (BufferError), which guards the views against reallocation
+# Note: An add which fails (BufferError, or a value which does not fit its column) leaves every column as it was, so the columns keep the same length
+
+# Note: Approximations (set by Bisection) are entries which have not been iterated yet, their root is the approximation itself, their residual
+# is f(approximation) and their status is UNSOLVED
+# Note: Unlike the dict of bisect_interval, which is keyed by the approximation rounded to 'digits' digits, every bracket keeps its own entry,
+# so that nearby roots are never merged. get_approximations() still returns that dict, for compatibility
+
+# Note: Complex roots (see Muller.py) need a store with complex_roots set to True, which keeps the imaginary parts of the roots and the
+# residuals in two more columns, root_imag and residual_imag
+
+# Note: Bracket approximations (lower-limit, upper-limit, ...) and warm started approximations (see NumericalMethod.py) are recorded by the
+# mid-point of their first two values
+# Note: Complex approximations (warm starts from complex roots) are recorded by their real part
+
+from typing import Dict, List, Sequence
+from array import array
+from .SolverStatistics import RootResult, CONVERGED, STEP_TOLERANCE, NON_FINITE, BUDGET_EXHAUSTED, STAGNATED, CANCELLED, SINGULAR
+
+# Status flags, the index of the reason in reasons
+UNSOLVED = -1
+reasons = (CONVERGED, STEP_TOLERANCE, NON_FINITE, BUDGET_EXHAUSTED, STAGNATED, CANCELLED, SINGULAR)
+
+columns = (("approximation", "d"), ("root", "d"), ("residual", "d"), ("iterations", "q"), ("status", "b"), ("multiplicity", "h"))
+
+# Reduce an approximation to the point it is recorded by
+def get_point(approximation) -> float:
+    if isinstance(approximation, tuple):
+        approximation = approximation[0] + (approximation[1] - approximation[0]) / 2
+    return approximation.real if isinstance(approximation, complex) else approximation
+
+class ResultStore():
+    def __init__(self, digits : int = 5, complex_roots : bool = False) -> None:
+        self.digits = digits
+        self.complex_roots = complex_roots
+        self.columns = {name : array(typecode) for name, typecode in columns}
+        if complex_roots:
+            self.columns["root_imag"] = array("d")
+            self.columns["residual_imag"] = array("d")
+
+    def __len__(self) -> int:
+        return len(self.columns["root"])
+
+    def get_column(self, name : str) -> array:
+        assert name in self.columns, "Column should be one of " + ", ".join(self.columns)
+        return self.columns[name]
+
+    def add(self, approximations : Sequence, roots : Sequence[float], residuals : Sequence[float], iterations : Sequence[int], statuses : Sequence[int],
+            multiplicities : Sequence[int] = None) -> None:
+        lengths = {name : len(column) for name, column in self.columns.items()}
+        try:
+            self.columns["approximation"].extend(get_point(approximation) for approximation in approximations)
+            if self.complex_roots:
+                roots, residuals = [complex(root) for root in roots], [complex(residual) for residual in residuals]
+                self.columns["root_imag"].extend(root.imag for root in roots)
+                self.columns["residual_imag"].extend(residual.imag for residual in residuals)
+                roots, residuals = [root.real for root in roots], [residual.real for residual in residuals]
+            self.columns["root"].extend(roots)
+            self.columns["residual"].extend(residuals)
+            self.columns["iterations"].extend(iterations)
+            self.columns["status"].extend(statuses)
+            self.columns["multiplicity"].extend([0] * len(statuses) if multiplicities == None else multiplicities)
+        except Exception:
+            # Shrink the columns which did grow back to their length, the column which failed is the first one which could not grow
+            for name, column in self.columns.items():
+                del column[lengths[name]:]
+            raise
+        assert len(set(len(column) for column in self.columns.values())) == 1, "All the columns should have the same length"
+
+    def add_approximations(self, approximations : Sequence[float], values : Sequence[float]) -> None:
+        self.add(approximations, approximations, values, [0] * len(approximations), [UNSOLVED] * len(approximations))
+
+    def add_results(self, approximations : Sequence, results : Sequence[RootResult]) -> None:
+        self.add(approximations, [result.root for result in results], [result.residual for result in results],
+                 [result.iterations for result in results], [reasons.index(result.reason) for result in results],
+                 [result.multiplicity or 0 for result in results])
+
+    # Zero-copy NumPy views of all the columns
+    def to_numpy(self) -> Dict:
+        import numpy as np
+        return {name : np.asarray(column) for name, column in self.columns.items()}
+
+    # Compatibility views, which do copy
+    def get_approximations(self) -> Dict:
+        return {round(approximation, self.digits) : value for approximation, value in zip(self.columns["approximation"], self.columns["residual"])}
+
+    def get_roots(self) -> List:
+        return self.get_complex_column("root")
+
+    def get_results(self) -> List[RootResult]:
+        return [RootResult(root, residual, iterations, None if status == UNSOLVED else reasons[status], multiplicity or None)
+                for root, residual, iterations, status, multiplicity in zip(self.get_complex_column("root"), self.get_complex_column("residual"),
+                                                                            *(self.columns[name] for name, _ in columns[3:]))]
+
+    # Values of the root or residual column, combined with their imaginary parts for complex roots (real ones are kept as floats)
+    def get_complex_column(self, name : str) -> List:
+        if not self.complex_roots:
+            return self.columns[name].tolist()
+        return [real if imag == 0 else complex(real, imag) for real, imag in zip(self.columns[name], self.columns[name + "_imag"])]
+
+# Perform unit tests with the following examples
+# store = ResultStore()
+# store.add_approximations([1.99951, 3.00049], [0.00049, 0.00049])
+# store.get_approximations() -> {1.99951: 0.00049, 3.00049: 0.00049}
+# store.to_numpy()["status"] -> array([-1, -1], dtype=int8)
+# roots = np.asarray(store.get_column("root"))
+# store.add_approximations([4.0], [0.0]) -> BufferError, and len(store.get_column("approximation")) -> 2 like every other column
+# del roots
+# store.add_approximations([4.0], [0.0]) then len(store) -> 3
@@ -0,0 +1,88 @@
+# TODO: Scan a large domain for all the real roots of a function f, instead of relying on intervals with an odd number of roots per half-interval
+# Scanning helps in discovering the brackets to hand over to Bisection or the iterative methods, without curating the intervals manually
+
+# Method : Sample every interval uniformly at 'samples' + 1 points, all evaluated at once through evaluate_batch (see Vectorization.py)
+# Method : Refine adaptively, up to 'depth' times: a sample x(j) is suspicious when f has a local extremum there without changing its sign,
+# while |f(x(j))| is no larger than the change of f towards either neighbour. A pair of nearby roots or a root of even multiplicity could then
+# be hiding between the neighbours, hence both cells around x(j) are halved (all the new mid-points are again evaluated at once)
+# Method : Emit a bracket (lower-limit, upper-limit, f(lower-limit), f(upper-limit)) for every cell over which f changes its sign (or vanishes at
+# the lower-limit), in the same format as bracket_interval in Bisection.py
+# Method : Samples which remain suspicious after the last refinement are candidate roots of even multiplicity (e.g. double roots), which no sign
+# change can bracket. They are emitted as (x, f(x)), x being the vertex of the parabola through the sample and its neighbours
+
+# Note: Smooth extrema well away from zero stop being suspicious after a few refinements, since |f(x(j))| stays put while the changes shrink
+# Note: Cells over which f is nan or inf are neither bracketed nor refined
+# Note: Requires NumPy, like the vectorized Bisection
+
+from typing import Callable, List, Sequence, Tuple
+from .Vectorization import evaluate_batch
+
+# Boolean mask of the interior samples x(1), ..., x(n - 1) which are suspicious, see the note on refinement above
+def get_suspicious(f):
+    import numpy as np
+    d_left, d_right = np.diff(f)[:-1], np.diff(f)[1:]
+    f_left, f_mid, f_right = f[:-2], f[1:-1], f[2:]
+    extremum = (d_left * d_right <= 0) & ~((d_left == 0) & (d_right == 0))
+    same_sign = (np.sign(f_left) == np.sign(f_mid)) & (np.sign(f_mid) == np.sign(f_right)) & (f_mid != 0)
+    small = np.abs(f_mid) <= np.maximum(np.abs(d_left), np.abs(d_right))
+    return extremum & same_sign & small
+
+# Abscissa of the vertex of the parabola through (x_0, f_0), (x_1, f_1) and (x_2, f_2), or x_1 when the three points are collinear
+def get_vertex(x_0, x_1, x_2, f_0, f_1, f_2):
+    import numpy as np
+    numerator = (x_1 - x_0)**2 * (f_1 - f_2) - (x_1 - x_2)**2 * (f_1 - f_0)
+    denominator = (x_1 - x_0) * (f_1 - f_2) - (x_1 - x_2) * (f_1 - f_0)
+    with np.errstate(divide = "ignore", invalid = "ignore"):
+        vertex = x_1 - numerator / (2 * denominator)
+    return np.where((denominator == 0) | ~np.isfinite(vertex), x_1, vertex)
+
+def scan_samples(func : Callable, interval : Tuple, samples : int, depth : int) -> Tuple:
+    import numpy as np
+    x = np.linspace(interval[0], interval[1], samples + 1)
+    f = evaluate_batch(func, x)
+    for i in range(depth):
+        suspicious = get_suspicious(f)
+        if not suspicious.any():
+            break
+        # Halve both the cells around every suspicious sample, cells shared by two of them are halved once
+        refine = np.zeros(len(x) - 1, dtype = bool)
+        refine[:-1] |= suspicious
+        refine[1:] |= suspicious
+        cells = np.flatnonzero(refine)
+        mid_intervals = x[cells] + (x[cells + 1] - x[cells]) / 2
+        x = np.insert(x, cells + 1, mid_intervals)
+        f = np.insert(f, cells + 1, evaluate_batch(func, mid_intervals))
+
+    return x, f
+
+def scan_interval(func : Callable, intervals : Sequence, samples : int = 64, depth : int = 16) -> Tuple[List[Tuple], List[Tuple]]:
+    import numpy as np
+    assert isinstance(samples, int) and samples > 1, "Number of samples should be an integer and should trivially be greater than one"
+    assert isinstance(depth, int) and depth >= 0, "Depth of refinement should be an integer and should trivially be non-negative"
+    if isinstance(intervals, tuple):
+        intervals = [intervals]
+    brackets, candidates = [], []
+    for interval in intervals:
+        assert interval[0] < interval[1], "Lower limit should be strictly lesser than or equal to Upper limit"
+        x, f = scan_samples(func, interval, samples, depth)
+        has_root = (f[:-1] == 0) | (np.sign(f[:-1]) * np.sign(f[1:]) == -1)
+        has_root[-1] |= f[-1] == 0
+        cells = np.flatnonzero(has_root)
+        brackets.extend(zip(x[cells].tolist(), x[cells + 1].tolist(), f[cells].tolist(), f[cells + 1].tolist()))
+
+        suspicious = np.flatnonzero(get_suspicious(f)) + 1
+        if len(suspicious) == 0:
+            continue
+        vertices = get_vertex(x[suspicious - 1], x[suspicious], x[suspicious + 1], f[suspicious - 1], f[suspicious], f[suspicious + 1])
+        f_vertices = evaluate_batch(func, vertices)
+        # Keep the sample itself whenever the parabola does not improve on it
+        better = np.abs(f_vertices) < np.abs(f[suspicious])
+        candidates.extend(zip(np.where(better, vertices, x[suspicious]).tolist(), np.where(better, f_vertices, f[suspicious]).tolist()))
+
+    return brackets, candidates
+
+# Perform unit tests with the following examples
+# func = lambda x : (x - 1)**2 * (x - 3) * (x - 3.001)
+# brackets, candidates = scan_interval(func, (-10, 10))
+# brackets -> [(2.998046875, 3.00048828125, 2.3026249953544773e-05, -9.999387561945363e-07), (3.00048828125, 3.0029296875, -9.999387561945363e-07, 2.267982447665547e-05)]
+# candidates -> [(1.000000000010002, 4.0036003426865103e-22)]
@@ -0,0 +1,59 @@
+# TODO: Use the Secant/Chord Method for finding out the real roots of a function f.
+# Note: Secant Method has a superlinear order of convergence (1.618033), more commonly known as phi(golden ratio)
+
+# Method : c = b - f(b) * (b - a) / (f(b) - f(a)), where a, b are intital approximations to the real root of the function
+# Method : Replace a with b and b with c for the next iteration
+# Note: Secant Method uses two initial approximations to the root
+
+# Secant Method can be proved in the following way:
+#   When the curve meets the X-axis, the curve can be approximated with a straight line (a1.x + a0) in an infinitesimally small neighborhood
+#   Calculate the values of the coefficients(a0, a1) by solving the following system of equations : a1.a + a0 = f(a), a1.b + a0 = f(b): c = -a0 / a1
+
+# Note: Stop iteration in one of three situations:
+#           |f(x)| < epsilon
+#           |x(k + 1) - x(k)| < epsilon
+#           the budget of the root runs out, or the iterations are cancelled or stagnate (see Budget.py)
+
+# Note: Set manual approximations while calculating roots of f using init_approx
+# Note: Instead of using manual approximations, set approximations of f using Bisection Method through self.set_approximations(*args, **kwargs)
+# Note: An approximation can also be a pair (x_0, x_1) of initial approximations, which is how warm starts hand over the bracket around the previous root
+# Otherwise x_1 is a random perturbation of x_0
+
+from typing import Callable, Tuple, List, Sequence, Dict
+from .NumericalMethod import NumericalMethodSolver
+from .SolverStatistics import RootResult
+from .IntermediateValueTheorem import sign
+import random
+
+class SecantSolver(NumericalMethodSolver):
+    warm_start_points = 2
+
+    @staticmethod
+    def calculate_next_value(func : Callable, x_0 : float, x_1 : float, check_for_root : bool = False) -> float:
+        f_x_0, f_x_1 = func(x_0), func(x_1)
+        x_new = x_1 - f_x_1 * (x_1 - x_0) / (f_x_1 - f_x_0)
+
+        # Provision for Regula-Falsi Method
+        if check_for_root:
+            f_x_new = func(x_new)
+            return x_new, f_x_new, sign(f_x_new * f_x_1) == -1
+        else:
+            return x_new
+        
+    def find_root(self, x_0 : float) -> RootResult:
+        x_0, x_1 = x_0 if isinstance(x_0, tuple) else (x_0, x_0 + 1e-01 * random.random())
+        f_x_k = self.func(x_1)
+        monitor = self.get_monitor()
+        stop = None
+        iterations = 0
+        while(not self.is_small_step(x_1, x_0) and abs(f_x_k) >= self.epsilon and stop == None):
+            x_new = self.calculate_next_value(self.func, x_0, x_1)
+            x_0 = x_1
+            x_1 = x_new
+            f_x_k = self.func(x_new)
+            iterations += 1
+            if not self.callback == None:
+                self.callback(iterations, x_1, f_x_k)
+            stop = monitor.update(iterations, f_x_k)
+
+        return self.get_result(x_1, f_x_k, iterations, stop = stop)
@@ -0,0 +1,52 @@
+# TODO: Describe how much work a solver did for every root it calculated
+# Note: Every find_root(self, x_0) returns a RootResult, which records the root, the residual f(root), the number of iterations and the reason
+# the iterations stopped
+# Note: Call counts of func, der_func and der_der_func and the wall time are only measured once statistics are enabled through
+# NumericalMethodSolver.set_statistics(*args, **kwargs), otherwise they are None
+# Note: Solvers which estimate the multiplicity of the root (see Multiplicity.py) report it, others leave it None
+
+# Reasons for the iterations to stop
+CONVERGED = "converged"                 # |f(x)| < epsilon
+STEP_TOLERANCE = "step_tolerance"       # |x(k + 1) - x(k)| < epsilon
+NON_FINITE = "non_finite"               # f(x) turned into nan or inf, e.g. after dividing by a vanishing derivative (the iterations diverged)
+BUDGET_EXHAUSTED = "budget_exhausted"   # the iterations ran out of their max_iterations or max_time, see Budget.py
+STAGNATED = "stagnated"                 # |f(x)| stopped decreasing, see Budget.py
+CANCELLED = "cancelled"                 # the cancellation token was cancelled, see Budget.py
+SINGULAR = "singular"                   # the Jacobian of a system turned singular, see SystemSolver.py
+
+from typing import Callable
+
+class RootResult():
+    __slots__ = ("root", "residual", "iterations", "reason", "multiplicity", "func_calls", "der_func_calls", "der_der_func_calls", "wall_time")
+
+    def __init__(self, root : float, residual : float, iterations : int, reason : str, multiplicity : int = None) -> None:
+        self.root = root
+        self.residual = residual
+        self.iterations = iterations
+        self.reason = reason
+        self.multiplicity = multiplicity
+        self.func_calls = None
+        self.der_func_calls = None
+        self.der_der_func_calls = None
+        self.wall_time = None
+
+    def __repr__(self) -> str:
+        return "RootResult(" + ", ".join(name + "=" + repr(getattr(self, name)) for name in self.__slots__) + ")"
+
+    # Slotted classes need explicit state for pickling, which the process backend relies on
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+# Count the number of times a function is called
+class CountingFunction():
+    def __init__(self, func : Callable) -> None:
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.func(*args)
@@ -0,0 +1,75 @@
+# TODO: Solve a (possibly endless) stream of equations lazily, yielding the roots of every equation as soon as they have been calculated
+# Note: Every job of the stream is a (func, intervals) pair, which is solved by a fresh instance of any NumericalMethodSolver subclass (the engine)
+# through set_approximations(*args, **kwargs) and set_roots(*args, **kwargs), exactly as one would do by hand
+# Note: At most max_in_flight jobs are pulled from the stream and not yet yielded at any time, so memory stays constant whatever the length of the
+# stream, and jobs are only pulled from the stream as fast as the consumer takes the results (backpressure)
+# Note: Set ordered to False to yield the results as they converge instead of in the order of the stream
+# Note: Jobs run on a concurrent.futures.ThreadPoolExecutor by default, set executor to process for a ProcessPoolExecutor (func and the engine need to be
+# picklable then), or to serial to solve the jobs one after the other in the consuming thread
+# Note: The engine needs to be constructible as engine(func, intervals = intervals, **solver_kwargs), derivative based solvers get their derivatives
+# through automatic differentiation then (see NumericalMethodSolver.resolve_derivatives)
+
+from typing import Dict, Iterable, Iterator, List, Tuple, Type
+from concurrent.futures import FIRST_COMPLETED, wait
+from .NumericalMethod import NumericalMethodSolver, executors, get_executor
+from .Secant import SecantSolver
+from .SolverStatistics import RootResult
+
+# Solve a single job of the stream and return its results, one RootResult per root
+def solve_job(engine : Type[NumericalMethodSolver], solver_kwargs : Dict, approximation_kwargs : Dict, root_kwargs : Dict, job : Tuple) -> List[RootResult]:
+    func, intervals = job
+    solver = engine(func, intervals = intervals, **solver_kwargs)
+    solver.set_approximations(**approximation_kwargs)
+    solver.set_roots(**root_kwargs)
+    return solver.get_results()
+
+# Yield (index, results) for every job of the stream, index being the position of the job in the stream
+def solve_stream(jobs : Iterable[Tuple], engine : Type[NumericalMethodSolver] = SecantSolver, max_in_flight : int = 16, ordered : bool = True,
+                 executor : str = "thread", max_workers : int = None, solver_kwargs : Dict = None, approximation_kwargs : Dict = None,
+                 root_kwargs : Dict = None) -> Iterator[Tuple[int, List[RootResult]]]:
+    assert isinstance(max_in_flight, int) and max_in_flight > 0, "Number of jobs in flight should be an integer and should trivially be greater than zero"
+    assert executor == "serial" or executor in executors, "Executor should be one of serial, " + ", ".join(executors)
+    solver_kwargs = dict() if solver_kwargs == None else solver_kwargs
+    # Bisect the intervals for a handful of iterations by default, which isolates the roots well enough for the iterative methods
+    approximation_kwargs = {"iterations" : 5} if approximation_kwargs == None else approximation_kwargs
+    root_kwargs = dict() if root_kwargs == None else root_kwargs
+
+    if executor == "serial":
+        for index, job in enumerate(jobs):
+            yield index, solve_job(engine, solver_kwargs, approximation_kwargs, root_kwargs, job)
+        return
+
+    jobs = enumerate(jobs)
+    with get_executor(executor)(max_workers = max_workers) as pool:
+        pending = dict()
+        # Results of jobs which have converged before the jobs preceding them in the stream (only for ordered streams)
+        completed = dict()
+        next_index = 0
+        exhausted = False
+        while(True):
+            # Pull jobs from the stream as long as there is room in flight
+            while(not exhausted and len(pending) + len(completed) < max_in_flight):
+                try:
+                    index, job = next(jobs)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[pool.submit(solve_job, engine, solver_kwargs, approximation_kwargs, root_kwargs, job)] = index
+            if len(pending) == 0 and len(completed) == 0:
+                return
+
+            if len(pending) > 0:
+                done, _ = wait(pending, return_when = FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    if ordered:
+                        completed[index] = future.result()
+                    else:
+                        yield index, future.result()
+            while(next_index in completed):
+                yield next_index, completed.pop(next_index)
+                next_index += 1
+
+# Perform unit tests with the following examples
+# jobs = ((lambda x, k = k : x**2 - k, (0, k + 1)) for k in range(1, 4))
+# [[result.root for result in results] for index, results in solve_stream(jobs, solver_kwargs = {"epsilon" : 1e-8})] -> [[1.0...], [1.4142...], [1.7320...]]
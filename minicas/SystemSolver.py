@@ -0,0 +1,235 @@
+# TODO: Solve systems of non-linear equations F(x) = 0, where x is a vector of n unknowns and F(x) a vector of n equations
+# Note: func takes a vector (NumPy array of shape (n,)) and returns a vector of the same shape, jacobian (optional) returns the matrix J(x) of
+# shape (n, n) with J[i][j] = dF_i/dx_j. Without jacobian, J(x) is estimated by forward differences, which costs n more evaluations of func
+# Note: Requires NumPy for the linear algebra
+
+# Multivariate Newton-Rhapson's Method (MultivariateNewtonSolver):
+# Method : x_new = x - J(x)^(-1).F(x), i.e. solve the linear system J(x).dx = -F(x) and set x_new = x + dx
+# Note: The multivariate analogue of NewtonRhapsonSolver, with a quadratic order of convergence, but every iteration needs a new Jacobian and
+# an O(n^3) linear solve
+
+# Broyden's Method (BroydenSolver):
+# Method : Replace J(x) with an approximation B, updated after every step dx = x_new - x, dF = F(x_new) - F(x) by the smallest (rank one) change
+# which makes it consistent with the step, B_new.dx = dF (the secant equation)
+#           B_new = B + (dF - B.dx).dx^T / (dx^T.dx)
+# Note: The multivariate analogue of SecantSolver.calculate_next_value, which replaces f'(x) with (f(b) - f(a)) / (b - a)
+# Note: The inverse H = B^(-1) is updated instead (Sherman-Morrison formula), so that every iteration only costs one evaluation of func and O(n^2)
+#           H_new = H + (dx - H.dF).dx^T.H / (dx^T.H.dF)
+# Note: The Jacobian is only evaluated (or estimated) once at the initial approximation, after which Broyden's Method converges superlinearly
+
+# Note: Stop iteration in one of four situations:
+#           ||F(x)|| < epsilon, ||.|| being the maximum norm
+#           ||x(k + 1) - x(k)|| < epsilon
+#           the budget of the system runs out (see Budget.py and self.set_budget(*args, **kwargs)), or the iterations are cancelled or stagnate
+#           the Jacobian (or Broyden's approximation of it) turns singular, in which case the reason is SINGULAR (see SolverStatistics.py)
+# Note: Batched systems share the budget, which stops all the active systems at once, and stagnation is not detected per system
+# Note: Every RootResult holds the root as a list of n floats and the residual ||F(root)||
+
+# Note: Set manual approximations while calculating roots of F using init_approx, either a single vector or a sequence of them
+# Note: Set batched to True in self.set_roots(*args, **kwargs) to solve all the approximations at once as independent systems, in which case func
+# and jacobian are called with a matrix of shape (m, n) of m vectors and return (m, n) and (m, n, n) respectively. Converged systems are masked out
+
+from typing import Callable, List, Sequence
+from .NumericalMethod import NumericalMethodSolver
+from .SolverStatistics import RootResult, SINGULAR
+
+# Estimate the Jacobian(s) of func at x by forward differences, x and f_x being of shape (n,), or (m, n) for a batch of systems
+def estimate_jacobian(func : Callable, x, f_x):
+    import numpy as np
+    n = x.shape[-1]
+    jacobian = np.empty(x.shape + (n,))
+    for j in range(n):
+        h = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x[..., j]))
+        x_h = x.copy()
+        x_h[..., j] += h
+        jacobian[..., j] = (np.asarray(func(x_h), dtype = float) - f_x) / h[..., None]
+    return jacobian
+
+class SystemSolver(NumericalMethodSolver):
+    def __init__(self, func : Callable, jacobian : Callable = None, epsilon : float = 1e-5) -> None:
+        super(SystemSolver, self).__init__(func, None, epsilon)
+        self.jacobian = jacobian
+
+    def evaluate_system(self, x):
+        import numpy as np
+        return np.asarray(self.func(x), dtype = float)
+
+    def get_jacobian(self, x, f_x):
+        import numpy as np
+        if self.jacobian == None:
+            return estimate_jacobian(self.func, x, f_x)
+        return np.asarray(self.jacobian(x), dtype = float)
+
+    def get_result(self, x, f_x, iterations : int, multiplicity : int = None, stop : str = None) -> RootResult:
+        import numpy as np
+        return super(SystemSolver, self).get_result(x.tolist(), float(np.max(np.abs(f_x))), iterations, stop = stop)
+
+    # A single vector or a sequence of them
+    def get_initial_approximations(self, init_approx : Sequence = None) -> List:
+        import numpy as np
+        assert not init_approx is None, "Initial approximations need to be passed through init_approx"
+        return list(np.atleast_2d(np.asarray(init_approx, dtype = float)))
+
+    # Roots are vectors, hence they are kept as lists rather than in a ResultStore
+    def set_results(self, approximations : Sequence, chunks : Sequence[List[RootResult]]) -> None:
+        self.results = [result for chunk in chunks for result in chunk]
+        self.roots = [result.root for result in self.results]
+
+    def get_roots(self) -> List:
+        assert not self.roots == None, "Roots need to be calculated by calling self.set_roots(*args, **kwargs)"
+        return self.roots
+
+    def get_results(self) -> List[RootResult]:
+        assert not self.results == None, "Roots need to be calculated by calling self.set_roots(*args, **kwargs)"
+        return self.results
+
+    # Iterate all the systems at once, lanes being masked out as they converge, see find_roots_batched in the subclasses
+    def set_roots(self, init_approx : Sequence = None, batched : bool = False) -> None:
+        approximations = self.get_initial_approximations(init_approx)
+        if batched:
+            assert hasattr(self, "find_roots_batched"), "Solvers of systems need to implement find_roots_batched(self, approximations)"
+            self.set_results(approximations, [self.find_roots_batched(approximations)])
+        else:
+            self.map_roots(self.find_root, approximations)
+
+    def get_results_batched(self, x, f_x, iterations, stops : List[str]) -> List[RootResult]:
+        return [self.get_result(x[i], f_x[i], int(iterations[i]), stop = stops[i]) for i in range(len(x))]
+
+    # Stop all the active systems once the budget runs out after the given number of sweeps (which every active system took part in), recording
+    # the reason in stops and returning the systems left active
+    def check_budget(self, monitor, sweeps : int, active, stops : List[str]):
+        stop = monitor.check(sweeps)
+        if stop == None:
+            return active
+        for i in active.tolist():
+            stops[i] = stop
+        return active[:0]
+
+class MultivariateNewtonSolver(SystemSolver):
+    def find_root(self, x_0) -> RootResult:
+        import numpy as np
+        x_0 = np.array(x_0, dtype = float)
+        f_x_k = self.evaluate_system(x_0)
+        monitor = self.get_monitor()
+        stop = None
+        iterations = 0
+        while(np.max(np.abs(f_x_k)) >= self.epsilon and stop == None):
+            try:
+                dx = np.linalg.solve(self.get_jacobian(x_0, f_x_k), -f_x_k)
+            except np.linalg.LinAlgError:
+                stop = SINGULAR
+                break
+            x_0 = x_0 + dx
+            f_x_k = self.evaluate_system(x_0)
+            iterations += 1
+            if not self.callback == None:
+                self.callback(iterations, x_0, f_x_k)
+            stop = monitor.update(iterations, np.max(np.abs(f_x_k)))
+            if np.max(np.abs(dx)) < self.epsilon:
+                break
+
+        return self.get_result(x_0, f_x_k, iterations, stop = stop)
+
+    def find_roots_batched(self, approximations : Sequence) -> List[RootResult]:
+        import numpy as np
+        x = np.array(approximations, dtype = float)
+        f_x = self.evaluate_system(x)
+        iterations = np.zeros(len(x), dtype = int)
+        stops = [None] * len(x)
+        monitor = self.get_monitor()
+        sweeps = 0
+        active = np.flatnonzero(np.max(np.abs(f_x), axis = 1) >= self.epsilon)
+        while(len(active) > 0):
+            jacobian = self.get_jacobian(x[active], f_x[active])
+            # Lanes whose Jacobian turns singular stop where they are, without holding up the others
+            regular = np.linalg.det(jacobian) != 0
+            for i in active[~regular].tolist():
+                stops[i] = SINGULAR
+            active, jacobian = active[regular], jacobian[regular]
+            dx = np.linalg.solve(jacobian, -f_x[active][..., None])[..., 0]
+            x[active] += dx
+            f_x[active] = self.evaluate_system(x[active])
+            iterations[active] += 1
+            keep = (np.max(np.abs(f_x[active]), axis = 1) >= self.epsilon) & (np.max(np.abs(dx), axis = 1) >= self.epsilon)
+            active = active[keep]
+            sweeps += 1
+            active = self.check_budget(monitor, sweeps, active, stops)
+
+        return self.get_results_batched(x, f_x, iterations, stops)
+
+class BroydenSolver(SystemSolver):
+    def find_root(self, x_0) -> RootResult:
+        import numpy as np
+        x_0 = np.array(x_0, dtype = float)
+        f_x_k = self.evaluate_system(x_0)
+        monitor = self.get_monitor()
+        stop = None
+        iterations = 0
+        try:
+            inverse = np.linalg.inv(self.get_jacobian(x_0, f_x_k))
+        except np.linalg.LinAlgError:
+            return self.get_result(x_0, f_x_k, iterations, stop = SINGULAR)
+        while(np.max(np.abs(f_x_k)) >= self.epsilon and stop == None):
+            dx = -inverse @ f_x_k
+            x_0 = x_0 + dx
+            f_x_new = self.evaluate_system(x_0)
+            df = f_x_new - f_x_k
+            f_x_k = f_x_new
+            iterations += 1
+            if not self.callback == None:
+                self.callback(iterations, x_0, f_x_k)
+            stop = monitor.update(iterations, np.max(np.abs(f_x_k)))
+            h_df = inverse @ df
+            denominator = dx @ h_df
+            if np.max(np.abs(dx)) < self.epsilon:
+                break
+            if denominator == 0:
+                # The update would turn the approximation of the Jacobian singular
+                stop = SINGULAR if stop == None else stop
+                break
+            inverse += np.outer(dx - h_df, dx @ inverse) / denominator
+
+        return self.get_result(x_0, f_x_k, iterations, stop = stop)
+
+    def find_roots_batched(self, approximations : Sequence) -> List[RootResult]:
+        import numpy as np
+        x = np.array(approximations, dtype = float)
+        f_x = self.evaluate_system(x)
+        iterations = np.zeros(len(x), dtype = int)
+        stops = [None] * len(x)
+        monitor = self.get_monitor()
+        sweeps = 0
+        jacobian = self.get_jacobian(x, f_x)
+        regular = np.linalg.det(jacobian) != 0
+        inverse = np.zeros_like(jacobian)
+        inverse[regular] = np.linalg.inv(jacobian[regular])
+        for i in np.flatnonzero(~regular).tolist():
+            stops[i] = SINGULAR
+        active = np.flatnonzero((np.max(np.abs(f_x), axis = 1) >= self.epsilon) & regular)
+        while(len(active) > 0):
+            dx = -np.einsum("mij,mj->mi", inverse[active], f_x[active])
+            x[active] += dx
+            f_x_new = self.evaluate_system(x[active])
+            df = f_x_new - f_x[active]
+            f_x[active] = f_x_new
+            iterations[active] += 1
+            h_df = np.einsum("mij,mj->mi", inverse[active], df)
+            denominator = np.einsum("mi,mi->m", dx, h_df)
+            keep = (np.max(np.abs(f_x_new), axis = 1) >= self.epsilon) & (np.max(np.abs(dx), axis = 1) >= self.epsilon)
+            for i in active[keep & (denominator == 0)].tolist():
+                stops[i] = SINGULAR
+            keep &= denominator != 0
+            active, dx, h_df, denominator = active[keep], dx[keep], h_df[keep], denominator[keep]
+            inverse[active] += np.einsum("mi,mj->mij", dx - h_df, np.einsum("mi,mij->mj", dx, inverse[active])) / denominator[:, None, None]
+            sweeps += 1
+            active = self.check_budget(monitor, sweeps, active, stops)
+
+        return self.get_results_batched(x, f_x, iterations, stops)
+
+# Perform unit tests with the following examples
+# func = lambda x : np.array([x[..., 0]**2 + x[..., 1]**2 - 4, x[..., 0] - x[..., 1]]).T
+# solver = BroydenSolver(func, epsilon = 1e-10)
+# solver.set_roots([1, 2])
+# solver.get_roots() -> [[1.4142135623730951, 1.4142135623730951]]
+# solver.set_roots([[1, 2], [0, 0]], batched = True)
+# [result.reason for result in solver.get_results()] -> ['converged', 'singular']      (J(0, 0) is singular)
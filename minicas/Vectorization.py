@@ -0,0 +1,30 @@
+# TODO: Evaluate a function over a whole batch of points at once
+# Note: Array-aware callables (built from arithmetic operators or NumPy ufuncs) are evaluated in a single call over a NumPy array
+# Note: Scalar-only callables (math.sin, branching on the sign of x, etc.) transparently fall back to one call per point
+
+from typing import Callable
+
+def evaluate_batch(func : Callable, x):
+    import numpy as np
+    # Values keep the floating point type of x, e.g. float32 (see NumericBackends.py)
+    dtype = x.dtype if x.dtype.kind == "f" else float
+    try:
+        values = np.asarray(func(x), dtype = dtype)
+        if values.shape == x.shape:
+            return values
+    except (TypeError, ValueError):
+        pass
+    return np.fromiter((func(value) for value in x.tolist()), dtype = dtype, count = len(x))
+
+# Evaluate (f(x), f'(x), ..., f^(order)(x)) over a batch of points with a fused function (see self.evaluate(*args) in NumericalMethod.py),
+# in a single call when it is array-aware, or else one call per point
+def evaluate_batch_fused(fused_func : Callable, x, order : int = 1) -> tuple:
+    import numpy as np
+    dtype = x.dtype if x.dtype.kind == "f" else float
+    try:
+        values = tuple(np.asarray(value, dtype = dtype) for value in fused_func(x, order))
+        if all(value.shape == x.shape for value in values):
+            return values
+    except (TypeError, ValueError):
+        pass
+    return tuple(np.array(value, dtype = dtype) for value in zip(*(fused_func(point, order) for point in x.tolist())))
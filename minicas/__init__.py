@@ -0,0 +1,88 @@
+# TODO: Entry point of the package, giving access to every solver and helper without importing any of them upfront
+# Note: Importing the package only runs this module, every name below is imported from its module on first access (module __getattr__, PEP 562),
+# hence short-lived processes only pay for the solvers they actually use. NumPy is never imported before a vectorized mode needs it
+#           import minicas
+#           solver = minicas.NewtonRhapsonSolver("x**3 - 2*x - 5", intervals = (2, 3))     (imports NewtonRhapson.py and Expression.py to compile the text)
+#           solver = minicas.get_solver("async_secant")(func, [(2, 3)])                     (imports AsyncSolver.py and asyncio)
+# Note: No module is named after the class it exports (NewtonRhapson.py defines NewtonRhapsonSolver, Polynomials.py defines Polynomial, ...), since
+# importing a module binds it on the package under its name, which would shadow the lazy export of a class of the same name
+
+# Note: Solvers are registered by a short name along with the module and the class implementing them, see get_solver(name) and register_solver(*args)
+# Note: python -m minicas.Benchmark --imports measures the import time of the package and of every registered solver in fresh interpreters
+
+# Names exported by the package on first access and the module (relative to the package) defining them
+exports = {
+    "NumericalMethodSolver" : "NumericalMethod",
+    "NewtonRhapsonSolver" : "NewtonRhapson",
+    "SecantSolver" : "Secant",
+    "Regula_FalsiSolver" : "Regula_Falsi",
+    "MullerSolver" : "Muller",
+    "ChebysevSolver" : "Chebysev",
+    "MultipointSolver" : "Multipoint",
+    "BrentSolver" : "Brent",
+    "AsyncNewtonRhapsonSolver" : "AsyncSolver",
+    "AsyncSecantSolver" : "AsyncSolver",
+    "MultivariateNewtonSolver" : "SystemSolver",
+    "BroydenSolver" : "SystemSolver",
+    "ParametricSolver" : "Parametric",
+    "solve_stream" : "StreamingSolver",
+    "bisect_interval" : "Bisection",
+    "bracket_interval" : "Bisection",
+    "scan_interval" : "Scanning",
+    "has_root" : "IntermediateValueTheorem",
+    "isolate_roots" : "IntervalIsolation",
+    "Polynomial" : "Polynomials",
+    "compile_expression" : "Expression",
+    "DifferentiableFunction" : "AutomaticDifferentiation",
+    "MemoizedFunction" : "FunctionCache",
+    "CancellationToken" : "Budget",
+    "RootResult" : "SolverStatistics",
+    "ResultStore" : "ResultStorage",
+    "Interval" : "IntervalArithmetic",
+    "ChebyshevProxy" : "ChebyshevApproximation",
+    "NumericBackend" : "NumericBackends",
+    "DoubleDouble" : "DoubleDoubleArithmetic",
+}
+
+# Short names of the solvers and the (module, class) implementing them
+solvers = {
+    "newton_rhapson" : ("NewtonRhapson", "NewtonRhapsonSolver"),
+    "secant" : ("Secant", "SecantSolver"),
+    "regula_falsi" : ("Regula_Falsi", "Regula_FalsiSolver"),
+    "muller" : ("Muller", "MullerSolver"),
+    "chebysev" : ("Chebysev", "ChebysevSolver"),
+    "multipoint" : ("Multipoint", "MultipointSolver"),
+    "brent" : ("Brent", "BrentSolver"),
+    "async_newton_rhapson" : ("AsyncSolver", "AsyncNewtonRhapsonSolver"),
+    "async_secant" : ("AsyncSolver", "AsyncSecantSolver"),
+    "multivariate_newton" : ("SystemSolver", "MultivariateNewtonSolver"),
+    "broyden" : ("SystemSolver", "BroydenSolver"),
+}
+
+__all__ = list(exports) + ["get_solver", "register_solver", "solvers"]
+
+def import_name(module : str, name : str):
+    import importlib
+    # Modules given without a package are taken relative to this one
+    package = __name__ if not "." in module else None
+    return getattr(importlib.import_module(("." if package else "") + module, package), name)
+
+# Return the solver class registered as name, importing its module on first use
+def get_solver(name : str):
+    assert name in solvers, "Solver should be one of " + ", ".join(solvers)
+    return import_name(*solvers[name])
+
+# Register a solver under name, module being a module of this package or a fully qualified one (e.g. a plugin package.module)
+def register_solver(name : str, module : str, cls : str) -> None:
+    solvers[name] = (module, cls)
+
+def __getattr__(name : str):
+    if name in exports:
+        value = import_name(exports[name], name)
+        # Later accesses find the name in the package directly
+        globals()[name] = value
+        return value
+    raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+
+def __dir__():
+    return sorted(set(globals()) | set(exports))